@@ -0,0 +1,333 @@
+"""
+Satu CLI untuk semua pekerjaan tender, dengan profil run bernama
+(tender_profiles.json, lihat tender_config) sebagai pengganti mengedit
+konstanta modul.
+
+Subcommand:
+    scrape   scraping range tanggal profil (sharded kalau profil punya accounts)
+    parse    teks paste (.txt) / halaman HTML tersimpan -> output writer profil
+    export   isi store SQLite -> output writer profil, dibaca per batch_size
+    bench    jalankan tender_startup / tender_html_bench / tender_regression
+    reports  bandingkan laporan run sebelumnya (rows/s per profil)
+
+Setiap run (kecuali reports) menulis <report_dir>/<waktu>-<command>-<profil>.json
+berisi setting efektif, durasi, jumlah baris, dan rows/s, supaya dua profil
+bisa dibandingkan apel-ke-apel. Laporan bench tanpa setting: benchmark
+memakai argumennya sendiri (setelah --), bukan setting profil.
+
+Contoh:
+    python tender.py scrape --profile cepat --start 2025-11-01 --end 2025-11-07
+    python tender.py scrape --profile hemat --stub 2 --set rate=20
+    python tender.py parse dump.txt --profile cepat -o hasil.jsonl
+    python tender.py export --profile cepat --start 2025-11-01 -o november.csv
+    python tender.py bench regression -- --no-perf
+    python tender.py reports --command scrape
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import tender_config
+import tender_io
+import tender_log
+
+log = tender_log.get_logger("cli")
+
+BENCHES = ("startup", "html", "regression")
+
+# command yang tidak memakai setting profil (laporan run tanpa "settings")
+SETTINGLESS_COMMANDS = ("bench",)
+
+# kolom export store: kolom asli + hasil normalisasi
+EXPORT_NORMALIZED = ("estimation_idr", "estimation_currency", "closing_on")
+
+
+def output_for(settings: Dict) -> Tuple[str, str]:
+    """
+    (path, writer) final. Ekstensi output disamakan dengan writer profil.
+    """
+    output, writer = settings["output"], settings["writer"]
+    if output == "-":
+        return tender_io.resolve_output(output, writer)
+    root, ext = os.path.splitext(output)
+    if ext.lower().lstrip(".") != writer:
+        output = f"{root}.{writer}"
+    return output, writer
+
+
+# ---------- scrape ----------
+
+def cmd_scrape(args, settings: Dict) -> Tuple[int, int, Dict]:
+    import tender_scrapping as ts
+
+    output, writer = output_for(settings)
+    start, end = ts.parse_date(settings["start"]), ts.parse_date(settings["end"])
+    if not args.stub and not settings["accounts"]:
+        rows = ts.scrape(dict(settings, output=output))
+        return (0 if rows else 1), len(rows), {}
+
+    from tender_shard import ShardCoordinator, load_accounts, stub_accounts
+
+    servers = []
+    if args.stub:
+        accounts, servers = stub_accounts(args.stub, args.stub_per_day, settings["rate"])
+    else:
+        accounts = load_accounts(settings["accounts"])
+    coordinator = ShardCoordinator(
+        accounts, start, end, shard_days=settings["shard_days"], parse_workers=settings["workers"],
+        archive_dir=None if args.stub else settings["archive_dir"], log_config=args.log_config,
+        delay=ts.request_delay(settings["rate"]), queue_size=settings["queue_size"],
+    )
+    try:
+        rows = coordinator.run()
+    finally:
+        for server in servers:
+            server.shutdown()
+
+    extra = {"accounts": coordinator.stats,
+             "failed_shards": [[s.isoformat(), e.isoformat()] for s, e in coordinator.failed_shards]}
+    if not rows:
+        log.warning("Tidak ada data dalam range tanggal ini.")
+        return 1, 0, extra
+    ts.publish_rows(rows, output, writer=writer, store_db=settings["store_db"],
+                    snapshot_dir=coordinator.snapshot_dir(settings["snapshot_dir"]), window=coordinator.window)
+    tender_io.info(f"✅ {len(rows)} tender -> {output} ({writer})")
+    return (1 if coordinator.failed_shards else 0), len(rows), extra
+
+
+# ---------- parse ----------
+
+def cmd_parse(args, settings: Dict) -> Tuple[int, int, Dict]:
+    from tender_records import TENDER_COLUMNS, TenderBatch
+
+    output, writer = output_for(settings)
+    ext = os.path.splitext(args.input)[1].lower()
+    if ext in (".html", ".htm"):
+        import tender_hybrid
+
+        resolver = tender_hybrid.use_sector_map(settings["sector_map"])
+        with open(args.input, "rb") as f:
+            html = f.read()
+        lines = tender_hybrid.extract_text_lines_from_html(html)
+        records = tender_hybrid.extract_tender_items_from_lines(lines).rows()
+        resolver.save()
+    else:
+        from tender_extract import iter_tender_records
+
+        records = iter_tender_records(tender_io.iter_input_lines(args.input))
+
+    source = args.input
+    if writer in tender_io.STREAM_FORMATS:
+        if settings["store_db"]:
+            records = tender_io.tap_to_store(records, TENDER_COLUMNS, settings["store_db"], source,
+                                             settings["batch_size"])
+        count = tender_io.write_rows(records, TENDER_COLUMNS, output, writer)
+    else:
+        tenders = TenderBatch()
+        for record in records:
+            tenders.add(*record)
+        count = len(tenders)
+        if count:
+            tender_io.write_output(tenders, output, writer)
+            if settings["store_db"]:
+                tender_io.append_to_store(tenders, settings["store_db"], source=source)
+
+    if not count:
+        tender_io.info("❌ Tidak ada data tender yang berhasil diekstrak")
+        return 1, 0, {}
+    tender_io.info(f"✅ {count} tender -> {output} ({writer})")
+    return 0, count, {"input": args.input}
+
+
+# ---------- export ----------
+
+def iter_store_rows(db_path: str, columns: Sequence[str], batch_size: int,
+                    start: Optional[str] = None, end: Optional[str] = None):
+    """
+    Baris store sebagai tuple (urut id), dibaca per batch_size, filter tanggal rilis ISO.
+    """
+    from tender_store import TenderStore
+
+    last_id = 0
+    with TenderStore(db_path, readonly=True) as store:
+        while True:
+            batch = store.rows_since(last_id, columns, limit=batch_size)
+            if not batch:
+                return
+            last_id = batch[-1]["id"]
+            for row in batch:
+                day = (row["release_date"] or "")[:10]
+                if (start and day < start) or (end and day > end):
+                    continue
+                yield tuple(row[c] for c in columns)
+
+
+def cmd_export(args, settings: Dict) -> Tuple[int, int, Dict]:
+    from tender_store import STORE_COLUMNS
+
+    if not settings["store_db"]:
+        tender_io.info("❌ Profil tidak punya store_db (isi di profil atau --set store_db=...)")
+        return 1, 0, {}
+    if not os.path.exists(settings["store_db"]):
+        tender_io.info(f"❌ Store tidak ditemukan: {settings['store_db']}")
+        return 1, 0, {}
+
+    output, writer = output_for(settings)
+    columns = STORE_COLUMNS + EXPORT_NORMALIZED
+    # export memakai --start/--end hanya kalau diberikan (tanggal profil untuk scraping)
+    start = tender_config.resolve_date(args.start) if args.start else None
+    end = tender_config.resolve_date(args.end) if args.end else None
+    rows = iter_store_rows(settings["store_db"], columns, settings["batch_size"], start, end)
+
+    if writer in tender_io.STREAM_FORMATS:
+        count = tender_io.write_rows(rows, columns, output, writer)
+    else:
+        records = [dict(zip(columns, row)) for row in rows]
+        count = len(records)
+        if count:
+            tender_io.write_output(records, output, writer, columns=columns)
+    if not count:
+        tender_io.info("❌ Tidak ada baris di store untuk filter ini")
+        return 1, 0, {}
+    tender_io.info(f"✅ {count} tender -> {output} ({writer})")
+    return 0, count, {"filter": {"start": start, "end": end}}
+
+
+# ---------- bench ----------
+
+def cmd_bench(args, settings: Dict) -> Tuple[int, int, Dict]:
+    bench_args = args.bench_args
+    if args.bench == "startup":
+        import tender_startup
+        code = tender_startup.main(bench_args)
+    elif args.bench == "html":
+        import tender_html_bench
+        code = tender_html_bench.main(bench_args) or 0
+    else:
+        import tender_regression
+        code = tender_regression.main(bench_args)
+    return code, 0, {"bench": args.bench, "bench_args": bench_args}
+
+
+# ---------- reports ----------
+
+def cmd_reports(args) -> int:
+    reports = tender_config.load_reports(args.report_dir, args.command_filter)
+    if not reports:
+        print(f"Belum ada laporan di {args.report_dir}")
+        return 1
+    print(f"{'mulai':19} {'command':9} {'profil':12} {'baris':>8} {'detik':>8} {'rows/s':>9}  "
+          f"workers rate   writer")
+    for r in reports[-args.last:]:
+        s = r.get("settings", {})
+        rate = r.get("rows_per_sec")
+        print(f"{r['started_at']:19} {r['command']:9} {r['profile']:12} {r['rows']:8d} {r['seconds']:8.1f} "
+              f"{rate if rate is not None else '-':>9}  {s.get('workers', '-'):<7} {s.get('rate', '-'):<6} "
+              f"{s.get('writer', '-')}")
+    return 0
+
+
+COMMANDS = {
+    "scrape": cmd_scrape,
+    "parse": cmd_parse,
+    "export": cmd_export,
+    "bench": cmd_bench,
+}
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser, dates: bool = True, outputs: bool = True) -> None:
+    parser.add_argument("--profile", default=tender_config.DEFAULT_PROFILE,
+                        help=f"nama profil (default: {tender_config.DEFAULT_PROFILE})")
+    parser.add_argument("--profiles", default=tender_config.DEFAULT_PROFILES_FILE, help="file profil")
+    parser.add_argument("--set", action="append", metavar="KEY=VALUE", help="timpa satu setting profil")
+    if outputs:
+        parser.add_argument("-o", "--output", help="file output (menimpa profil)")
+        parser.add_argument("--writer", choices=tender_io.OUTPUT_FORMATS, help="format output (menimpa profil)")
+    if dates:
+        parser.add_argument("--start", help="tanggal awal YYYY-MM-DD / today-N (menimpa profil)")
+        parser.add_argument("--end", help="tanggal akhir YYYY-MM-DD / today-N (menimpa profil)")
+    tender_log.add_log_arguments(parser)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="CLI tender dengan profil run bernama.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scrape", help="scraping range tanggal")
+    add_profile_arguments(p)
+    p.add_argument("--stub", type=int, default=0, metavar="N",
+                   help="tes lokal: N situs tiruan, satu akun per situs (lihat tender_stubsite)")
+    p.add_argument("--stub-per-day", type=int, default=10, help="tender per hari di situs tiruan")
+
+    p = sub.add_parser("parse", help="teks paste / HTML tersimpan -> output")
+    p.add_argument("input", help="file .txt (teks paste), .html, atau '-' untuk stdin")
+    add_profile_arguments(p, dates=False)
+
+    p = sub.add_parser("export", help="store SQLite -> output")
+    add_profile_arguments(p)
+
+    # argumen benchmark setelah "--" dipisah di main() sebelum parsing, jadi opsi
+    # tender.py (--profile, ...) tidak pernah ikut terkirim ke benchmark
+    p = sub.add_parser("bench", help="benchmark / regression",
+                       usage="%(prog)s {startup,html,regression} [opsi] [-- argumen benchmark]")
+    p.add_argument("bench", choices=BENCHES)
+    # profil hanya menentukan report_dir & nama laporan; benchmark tidak memakai setting profil
+    add_profile_arguments(p, dates=False, outputs=False)
+
+    p = sub.add_parser("reports", help="bandingkan laporan run")
+    p.add_argument("--report-dir", default=tender_config.DEFAULT_REPORT_DIR)
+    p.add_argument("--command", dest="command_filter", choices=sorted(COMMANDS), help="hanya command ini")
+    p.add_argument("--last", type=int, default=20, help="jumlah laporan terakhir")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    bench_args: List[str] = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, bench_args = argv[:split], argv[split + 1:]
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if bench_args and args.command != "bench":
+        parser.error("argumen setelah -- hanya untuk bench")
+    args.bench_args = bench_args
+    if args.command == "reports":
+        return cmd_reports(args)
+
+    tender_log.configure_from_args(args)
+    args.log_config = {"level": args.log_level, "json_output": args.log_json, "sample": args.trace_sample}
+
+    try:
+        overrides = tender_config.parse_overrides(args.set)
+        # export: --start/--end memfilter store, bukan menimpa tanggal profil
+        keys = ("output", "writer") if args.command == "export" else ("output", "writer", "start", "end")
+        for key in keys:
+            if getattr(args, key, None):
+                overrides[key] = getattr(args, key)
+        if getattr(args, "output", None) and not args.writer:
+            # -o hasil.csv tanpa --writer: writer ikut ekstensi output
+            ext = os.path.splitext(args.output)[1].lower().lstrip(".")
+            if ext in tender_io.OUTPUT_FORMATS:
+                overrides["writer"] = ext
+        settings = tender_config.resolve_profile(args.profile, args.profiles, overrides)
+    except ValueError as e:
+        tender_io.info(f"❌ {e}")
+        return 2
+
+    started = time.time()
+    code, rows, extra = COMMANDS[args.command](args, settings)
+    finished = time.time()
+
+    # bench tidak memakai setting profil, jadi tidak dicatat (supaya tidak dibandingkan seolah berlaku)
+    applied = None if args.command in SETTINGLESS_COMMANDS else settings
+    path = tender_config.write_report(settings["report_dir"], args.command, args.profile, applied,
+                                      started, finished, rows, dict(extra, exit_code=code))
+    tender_io.info(f"📝 Laporan run: {path} ({rows} baris, {finished - started:.1f} s)")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,323 @@
+"""
+Alert tender yang mendekati tanggal penutupan (closing_on di store).
+
+Scheduler menyimpan heap berisi satu jadwal per tender: waktu alert berikutnya
+= tanggal penutupan - lead time (mis. 7d, 3d, 1d). Setiap tick hanya jadwal
+yang sudah jatuh tempo yang diambil dari heap, dan tender baru dibaca
+incremental dari store (id > id terakhir), jadi tidak ada scan ulang walau
+ada 100k+ tender terbuka.
+
+- Tender baru yang sebagian lead-nya sudah lewat hanya dapat satu alert (lead
+  terdekat), bukan semua sekaligus.
+- Kalau tanggal penutupan berubah (scrape ulang), jadwal lama diabaikan dan
+  alert dihitung ulang dari tanggal baru.
+- Alert dicatat terkirim hanya kalau semua sink berhasil; kalau gagal, alert
+  tetap tertunda dan dicoba lagi di tick berikutnya.
+- Alert yang sudah terkirim dan cursor baris store dicatat di file state, jadi
+  restart tidak mengirim ulang. Setelah restart hanya tender yang masih buka
+  yang dibaca ulang (index closing_on), bukan seluruh store.
+
+Contoh:
+    python tender_alerts.py --db tender_store.db --lead 7d,3d,1d --out alerts.jsonl
+    python tender_alerts.py --db tender_store.db --webhook https://hooks.example.com/tender --once
+"""
+import argparse
+import heapq
+import itertools
+import json
+import os
+import time
+import urllib.request
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import tender_log
+from tender_store import TenderStore, DEFAULT_DB
+
+DEFAULT_LEADS = "7d,3d,1d"
+DEFAULT_STATE = "alert_state.json"
+DEFAULT_OUTPUT = "alerts.jsonl"
+
+# Interval cek (detik)
+CHECK_INTERVAL = 60.0
+
+# Jumlah baris yang dibaca dari store per query
+LOAD_BATCH = 10000
+
+ALERT_FIELDS = ("title", "client", "sector", "closing_on", "estimation_value", "estimation_idr", "detail_url")
+
+_UNITS = {"d": 86400, "h": 3600, "m": 60}
+
+log = tender_log.get_logger("alerts")
+
+
+def parse_leads(text: str) -> List[Tuple[str, float]]:
+    """
+    "7d,3d,12h" -> [("7d", 604800), ("3d", 259200), ("12h", 43200)], urut dari yang terbesar.
+    Angka tanpa satuan dianggap hari.
+    """
+    leads = {}
+    for part in text.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        unit = part[-1] if part[-1] in _UNITS else "d"
+        number = part[:-1] if part[-1] in _UNITS else part
+        try:
+            seconds = float(number) * _UNITS[unit]
+        except ValueError:
+            raise ValueError(f"Lead time tidak valid: {part!r} (contoh: 7d, 12h, 30m)")
+        leads[seconds] = part
+    if not leads:
+        raise ValueError("Minimal satu lead time")
+    return [(leads[s], s) for s in sorted(leads, reverse=True)]
+
+
+def closing_timestamp(closing_on: str) -> Optional[float]:
+    """
+    Tanggal penutupan ISO -> epoch awal hari itu (waktu lokal). Jam penutupan
+    tidak diketahui, jadi dianggap 00:00 supaya alert tidak pernah terlambat.
+    """
+    try:
+        return datetime.combine(date.fromisoformat(closing_on), datetime.min.time()).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class FileSink:
+    """
+    Tambahkan alert ke file JSONL (satu alert per baris).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def emit(self, alerts: List[Dict]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            for alert in alerts:
+                f.write(json.dumps(alert, ensure_ascii=False))
+                f.write("\n")
+
+
+class WebhookSink:
+    """
+    POST {"alerts": [...]} ke URL webhook, satu request per tick.
+    """
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url = url
+        self.timeout = timeout
+
+    def emit(self, alerts: List[Dict]) -> None:
+        body = json.dumps({"alerts": alerts}, ensure_ascii=False).encode("utf-8")
+        req = urllib.request.Request(self.url, data=body, method="POST",
+                                     headers={"Content-Type": "application/json; charset=utf-8"})
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            resp.read()
+
+
+class AlertScheduler:
+    def __init__(self, leads: Sequence[Tuple[str, float]], sinks: Sequence = (),
+                 state_path: Optional[str] = None):
+        self.leads = sorted(leads, key=lambda x: x[1], reverse=True)
+        self.sinks = list(sinks)
+        self.state_path = state_path
+        self.cursor = 0
+
+        # (waktu alert, urutan, key, index lead, versi tender)
+        self._heap: List[Tuple[float, int, str, int, int]] = []
+        self._seq = itertools.count()
+        # versi jadwal dari satu counter untuk semua key, jadi tidak pernah terulang
+        # (mis. key dihapus dari _pending lalu di-upsert lagi saat heap masih berisi entri lama)
+        self._versions = itertools.count()
+        # key -> [closing_at, versi, info]; hanya tender yang masih punya alert tertunda
+        self._pending: Dict[str, list] = {}
+        # key -> [closing_at, index lead berikutnya]; alert yang sudah terkirim
+        self._sent: Dict[str, list] = {}
+
+        # cursor dari file state: jadwal tertunda tidak ikut disimpan, jadi load
+        # pertama membaca ulang tender yang masih buka
+        self._reload_open = False
+
+        if state_path and os.path.exists(state_path):
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self._sent = state.get("sent", {})
+            self.cursor = state.get("cursor", 0)
+            self._reload_open = self.cursor > 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # ---------- input ----------
+
+    def upsert(self, key: str, closing_at: float, info: Dict, now: Optional[float] = None) -> None:
+        """
+        Tambah / update satu tender. Jadwal lama (kalau tanggal berubah) tidak
+        dihapus dari heap, tapi diabaikan saat diambil (versi berbeda).
+        """
+        now = time.time() if now is None else now
+        pending = self._pending.get(key)
+        if pending is not None and pending[0] == closing_at:
+            pending[2] = info
+            return
+
+        sent = self._sent.get(key)
+        if sent is not None and sent[0] != closing_at:
+            # tanggal penutupan berubah: semua lead berlaku lagi
+            del self._sent[key]
+
+        self._pending[key] = [closing_at, next(self._versions), info]
+        self._schedule(key, now)
+
+    def load_from_store(self, store: TenderStore, now: Optional[float] = None) -> int:
+        """
+        Baca tender baru yang masih buka dari store (id > cursor). Return jumlah
+        baris yang dibaca.
+        """
+        now = time.time() if now is None else now
+        # closing_timestamp = awal hari penutupan, jadi "masih buka" = tutup setelah hari ini
+        today = date.fromtimestamp(now).isoformat()
+        since = 0 if self._reload_open else self.cursor
+        self._reload_open = False
+        total = 0
+        while True:
+            rows = store.rows_since(since, ("row_key",) + ALERT_FIELDS, limit=LOAD_BATCH, closing_after=today)
+            if not rows:
+                break
+            for row in rows:
+                closing_at = closing_timestamp(row["closing_on"])
+                if closing_at is not None and closing_at > now:
+                    key = row["detail_url"] or row["row_key"]
+                    self.upsert(key, closing_at, {k: row[k] for k in ALERT_FIELDS}, now)
+            since = rows[-1]["id"]
+            total += len(rows)
+        self.cursor = max(self.cursor, since)
+        return total
+
+    # ---------- jadwal ----------
+
+    def _schedule(self, key: str, now: float) -> None:
+        closing_at, version, _info = self._pending[key]
+        if closing_at <= now:
+            del self._pending[key]
+            return
+        i = self._sent[key][1] if key in self._sent else 0
+        # beberapa lead sudah lewat -> langsung ke lead terdekat yang sudah lewat
+        while i + 1 < len(self.leads) and closing_at - self.leads[i + 1][1] <= now:
+            i += 1
+        if i >= len(self.leads):
+            del self._pending[key]
+            return
+        heapq.heappush(self._heap, (closing_at - self.leads[i][1], next(self._seq), key, i, version))
+
+    def next_due(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def tick(self, now: Optional[float] = None) -> List[Dict]:
+        """
+        Keluarkan semua alert yang sudah jatuh tempo dan kirim ke sink. Return
+        alert yang terkirim; kalau ada sink yang gagal, semuanya tetap tertunda
+        (dicoba lagi tick berikutnya, sink yang sudah berhasil bisa menerima ulang).
+        """
+        now = time.time() if now is None else now
+        alerts = []
+        fired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            _fire_at, _seq, key, i, version = entry
+            pending = self._pending.get(key)
+            if pending is None or pending[1] != version:
+                continue  # jadwal lama
+            closing_at, _version, info = pending
+            if closing_at <= now:
+                self._schedule(key, now)  # sudah tutup: dibuang
+                continue
+            label = self.leads[i][0]
+            alerts.append(dict(info, key=key, lead=label,
+                               days_left=round((closing_at - now) / 86400, 1),
+                               fired_at=datetime.fromtimestamp(now).isoformat(timespec="seconds")))
+            fired.append((entry, closing_at))
+
+        if not alerts:
+            return alerts
+        if not self._emit(alerts):
+            for entry, _closing_at in fired:
+                heapq.heappush(heap, entry)
+            return []
+        for (_fire_at, _seq, key, i, _version), closing_at in fired:
+            self._sent[key] = [closing_at, i + 1]
+            self._schedule(key, now)
+        return alerts
+
+    def _emit(self, alerts: List[Dict]) -> bool:
+        """
+        Kirim ke semua sink. Return False kalau ada sink yang gagal.
+        """
+        ok = True
+        for sink in self.sinks:
+            try:
+                sink.emit(alerts)
+            except Exception as e:
+                ok = False
+                log.error("Gagal kirim alert", extra={"sink": type(sink).__name__, "alerts": len(alerts),
+                                                      "error": str(e)})
+        if ok:
+            log.info("Alert terkirim", extra={"alerts": len(alerts)})
+        return ok
+
+    # ---------- state ----------
+
+    def save_state(self, now: Optional[float] = None) -> None:
+        if not self.state_path:
+            return
+        now = time.time() if now is None else now
+        # tender yang sudah tutup tidak perlu diingat lagi
+        self._sent = {k: v for k, v in self._sent.items() if v[0] > now}
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"leads": [label for label, _ in self.leads], "sent": self._sent, "cursor": self.cursor}, f)
+        os.replace(tmp, self.state_path)
+
+    def run(self, store: TenderStore, interval: float = CHECK_INTERVAL, once: bool = False) -> None:
+        loaded = self.load_from_store(store)
+        log.info("Scheduler alert mulai", extra={"rows": loaded, "open_tenders": len(self),
+                                                 "leads": ",".join(label for label, _ in self.leads)})
+        while True:
+            self.tick()
+            self.save_state()
+            if once:
+                return
+            time.sleep(interval)
+            self.load_from_store(store)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alert tender yang mendekati tanggal penutupan.")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"file SQLite store (default: {DEFAULT_DB})")
+    parser.add_argument("--lead", default=DEFAULT_LEADS, help=f"lead time (default: {DEFAULT_LEADS})")
+    parser.add_argument("--out", default=None, help=f"file JSONL alert (default: {DEFAULT_OUTPUT} kalau tanpa --webhook)")
+    parser.add_argument("--webhook", action="append", default=[], help="URL webhook (boleh diulang)")
+    parser.add_argument("--state", default=DEFAULT_STATE, help="file catatan alert terkirim + cursor store")
+    parser.add_argument("--interval", type=float, default=CHECK_INTERVAL, help="detik antar cek")
+    parser.add_argument("--once", action="store_true", help="cek sekali lalu keluar (untuk cron)")
+    tender_log.add_log_arguments(parser)
+    args = parser.parse_args()
+    tender_log.configure_from_args(args)
+
+    sinks = [WebhookSink(url) for url in args.webhook]
+    if args.out or not sinks:
+        sinks.insert(0, FileSink(args.out or DEFAULT_OUTPUT))
+
+    scheduler = AlertScheduler(parse_leads(args.lead), sinks, state_path=args.state)
+    with TenderStore(args.db) as store:
+        try:
+            scheduler.run(store, interval=args.interval, once=args.once)
+        except KeyboardInterrupt:
+            scheduler.save_state()
+            log.info("Berhenti.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+HTTP API read-only untuk data tender di store (SQLite).
+
+Endpoint:
+    GET /tenders?start=2025-11-01&end=2025-11-30&sector=OIL%20%26%20GAS
+                &client=...&q=pipeline&page=1&per_page=50
+                &closing_days=7&min_value=10M      (tutup <= 7 hari lagi, nilai > Rp 10 Miliar)
+                &closing_from=2025-11-01&closing_to=2025-11-30&max_value=...
+    GET /stats?by=sector&top=20          (by: lihat tender_stats.DIMENSIONS)
+    GET /health
+
+Setiap response punya ETag (versi data + query). Client yang mengirim
+If-None-Match dengan ETag yang sama dapat 304 tanpa body. Response juga
+di-cache di memori sampai data di store berubah.
+
+Contoh:
+    python tender_api.py --db tender_store.db --port 8080
+"""
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit, urlencode
+
+import tender_log
+from tender_normalize import parse_value_idr
+from tender_stats import DIMENSIONS
+from tender_store import TenderStore, DEFAULT_DB
+
+DEFAULT_PORT = 8080
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 500
+# batas page & closing_days (nilai lebih besar overflow di offset SQLite / tanggal)
+MAX_PAGE = 1_000_000
+MAX_CLOSING_DAYS = 36_500
+
+# Berapa lama versi data boleh dianggap sama tanpa cek ulang ke SQLite (detik)
+VERSION_TTL = 1.0
+
+# Jumlah response yang di-cache
+RESPONSE_CACHE_SIZE = 2048
+
+log = tender_log.get_logger("api")
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class TenderAPI:
+    """
+    Logika query + cache, terpisah dari HTTP handler.
+    Setiap thread server punya koneksi SQLite read-only sendiri.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[str, bytes]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, str], threading.Event] = {}
+        self._version = ""
+        self._version_checked = 0.0
+        self._version_lock = threading.Lock()
+
+    def store(self) -> TenderStore:
+        store = getattr(self._local, "store", None)
+        if store is None:
+            store = TenderStore(self.db_path, readonly=True)
+            self._local.store = store
+        return store
+
+    def data_version(self) -> str:
+        now = time.monotonic()
+        if now - self._version_checked < VERSION_TTL and self._version:
+            return self._version
+        with self._version_lock:
+            if now - self._version_checked >= VERSION_TTL or not self._version:
+                self._version = self.store().version()
+                self._version_checked = now
+        return self._version
+
+    # ---------- endpoint ----------
+
+    def tenders(self, params: Dict[str, str]) -> Dict:
+        page = _int_param(params, "page", 1, minimum=1, maximum=MAX_PAGE)
+        per_page = min(_int_param(params, "per_page", DEFAULT_PER_PAGE, minimum=1), MAX_PER_PAGE)
+        closing_from = params.get("closing_from")
+        closing_to = params.get("closing_to")
+        if "closing_days" in params:
+            # relatif terhadap hari ini (lihat handle: tanggal ikut jadi key cache)
+            today = date.today()
+            closing_from = closing_from or today.isoformat()
+            days = _int_param(params, "closing_days", 0, maximum=MAX_CLOSING_DAYS)
+            closing_to = (today + timedelta(days=days)).isoformat()
+        try:
+            total, rows = self.store().search(
+                start=params.get("start"),
+                end=params.get("end"),
+                sector=params.get("sector"),
+                client=params.get("client"),
+                keyword=params.get("q"),
+                limit=per_page,
+                offset=(page - 1) * per_page,
+                closing_start=closing_from,
+                closing_end=closing_to,
+                min_value=_value_param(params, "min_value"),
+                max_value=_value_param(params, "max_value"),
+            )
+        except ValueError as e:
+            raise ApiError(400, str(e))
+        return {
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "pages": (total + per_page - 1) // per_page,
+            "items": rows,
+        }
+
+    def stats(self, params: Dict[str, str]) -> Dict:
+        dim = params.get("by", "sector")
+        if dim not in DIMENSIONS:
+            raise ApiError(400, f"'by' harus salah satu dari: {', '.join(DIMENSIONS)}")
+        top = _int_param(params, "top", 0, minimum=0) or None
+        items = self.store().summary(dim, limit=top, start=params.get("start"), end=params.get("end"))
+        return {"by": dim, "total": self.store().count(), "items": [{"key": k, "count": n} for k, n in items]}
+
+    ROUTES = {
+        "/tenders": tenders,
+        "/stats": stats,
+    }
+
+    def handle(self, path: str, query: str) -> Tuple[str, bytes]:
+        """
+        Return (etag, body JSON). Hasil di-cache per (versi data, path+query).
+        """
+        if path == "/health":
+            body = json.dumps({"status": "ok", "version": self.data_version()}).encode("utf-8")
+            return "", body
+
+        route = self.ROUTES.get(path)
+        if route is None:
+            raise ApiError(404, f"Endpoint tidak dikenal: {path}")
+
+        # query dinormalisasi supaya urutan parameter tidak memecah cache
+        params = dict(parse_qsl(query, keep_blank_values=False))
+        canonical = path + "?" + urlencode(sorted(params.items()))
+        if "closing_days" in params:
+            # hasil bergantung tanggal hari ini -> cache & ETag berganti tiap hari
+            canonical += "#" + date.today().isoformat()
+        version = self.data_version()
+        key = (version, canonical)
+
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+                return hit
+            # single-flight: kalau query yang sama sedang dihitung thread lain, tunggu saja
+            event = self._inflight.get(key)
+            owner = event is None
+            if owner:
+                event = self._inflight[key] = threading.Event()
+
+        if not owner:
+            event.wait()
+            with self._cache_lock:
+                hit = self._cache.get(key)
+            if hit is not None:
+                return hit
+            # thread pemilik gagal (error) -> hitung sendiri
+            return self._compute(route, params, version, canonical)
+
+        try:
+            result = self._compute(route, params, version, canonical)
+            with self._cache_lock:
+                self._cache[key] = result
+                if len(self._cache) > RESPONSE_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            return result
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def _compute(self, route, params: Dict[str, str], version: str, canonical: str) -> Tuple[str, bytes]:
+        body = json.dumps(route(self, params), ensure_ascii=False).encode("utf-8")
+        etag = '"' + hashlib.sha1(f"{version}|{canonical}".encode("utf-8")).hexdigest()[:20] + '"'
+        return etag, body
+
+
+def _value_param(params: Dict[str, str], name: str) -> Optional[float]:
+    """
+    Nilai IDR: angka biasa atau teks seperti "10M", "500 Juta", "USD 1 Million".
+    """
+    raw = params.get(name)
+    if raw is None:
+        return None
+    value = parse_value_idr(raw)
+    if value is None:
+        raise ApiError(400, f"Parameter '{name}' bukan nilai yang valid")
+    return value
+
+
+def _int_param(params: Dict[str, str], name: str, default: int, minimum: int = 0,
+               maximum: Optional[int] = None) -> int:
+    raw = params.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ApiError(400, f"Parameter '{name}' harus angka")
+    if value < minimum:
+        raise ApiError(400, f"Parameter '{name}' minimal {minimum}")
+    if maximum is not None and value > maximum:
+        raise ApiError(400, f"Parameter '{name}' maksimal {maximum}")
+    return value
+
+
+class TenderAPIHandler(BaseHTTPRequestHandler):
+    server_version = "TenderAPI/1.0"
+    # keep-alive supaya dashboard tidak buka koneksi baru setiap request
+    protocol_version = "HTTP/1.1"
+
+    api: TenderAPI = None
+    verbose = False
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        try:
+            etag, body = self.api.handle(parts.path.rstrip("/") or "/", parts.query)
+        except ApiError as e:
+            self._send(e.status, json.dumps({"error": e.message}).encode("utf-8"))
+            return
+        except Exception as e:
+            # jangan biarkan koneksi keep-alive putus tanpa response
+            log.error("Request gagal", extra={"path": self.path, "error": f"{type(e).__name__}: {e}"},
+                      exc_info=True)
+            self._send(500, json.dumps({"error": "Internal server error"}).encode("utf-8"))
+            return
+
+        if etag and etag in _parse_if_none_match(self.headers.get("If-None-Match")):
+            self._send(304, b"", etag)
+            return
+        self._send(200, body, etag)
+
+    def _send(self, status: int, body: bytes, etag: str = "") -> None:
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def _parse_if_none_match(header: Optional[str]):
+    if not header:
+        return ()
+    return {tag.strip() for tag in header.split(",")}
+
+
+class TenderAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # antrian koneksi lebih panjang dari default (5) untuk ratusan client sekaligus
+    request_queue_size = 512
+
+
+def make_server(db_path: str = DEFAULT_DB, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                verbose: bool = False) -> TenderAPIServer:
+    # cek store bisa dibuka dulu (error jelas sebelum server jalan)
+    TenderStore(db_path, readonly=True).close()
+    handler = type("Handler", (TenderAPIHandler,), {"api": TenderAPI(db_path), "verbose": verbose})
+    return TenderAPIServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP API read-only untuk data tender.")
+    parser.add_argument("--db", default=DEFAULT_DB)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("-v", "--verbose", action="store_true", help="log setiap request")
+    args = parser.parse_args()
+
+    server = make_server(args.db, args.host, args.port, args.verbose)
+    print(f"[API] Melayani {args.db} di http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[API] Berhenti.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
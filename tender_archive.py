@@ -0,0 +1,443 @@
+"""
+Arsip HTML mentah (append-only) supaya data bisa diparsing ulang tanpa scraping.
+
+Isi folder arsip:
+- pages.dat : record berurutan = header + URL + HTML terkompresi (zstd, atau
+              zlib kalau modul zstandard tidak ada)
+- pages.idx : offset (uint64) tiap record di pages.dat, dibaca via mmap
+              supaya akses ke halaman ke-i langsung tanpa scan file.
+
+Beberapa proses boleh menulis ke folder yang sama: append memegang flock di
+pages.idx (kalau fcntl tersedia; di Windows beri tiap proses folder sendiri).
+
+Contoh:
+    # bangun ulang dataset scraping dari arsip (tanpa network)
+    python tender_archive.py reparse html_archive --start 2025-11-01 --end 2025-11-11
+    # arsip scraping multi-akun (html_archive/shard-*, URL mirror ditulis ulang)
+    python tender_archive.py reparse html_archive --start 2025-11-01 --end 2025-11-30
+    # halaman yang diambil tender_hybrid (Selenium)
+    python tender_archive.py reparse-web html_archive
+    python tender_archive.py info html_archive
+"""
+import argparse
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DATA_FILE = "pages.dat"
+INDEX_FILE = "pages.idx"
+
+CODEC_RAW = 0
+CODEC_ZSTD = 1
+CODEC_ZLIB = 2
+
+# jenis halaman
+KIND_LIST = "list"
+KIND_DETAIL = "detail"
+KIND_WEB = "web"
+_KIND_CODES = {KIND_LIST: 1, KIND_DETAIL: 2, KIND_WEB: 3}
+_KIND_NAMES = {v: k for k, v in _KIND_CODES.items()}
+
+# codec, kind, panjang url, panjang payload, waktu fetch
+_RECORD_HEADER = struct.Struct("<BBHId")
+_INDEX_ENTRY = struct.Struct("<Q")
+
+ZSTD_LEVEL = 3
+
+
+@lru_cache(maxsize=None)
+def _zstandard():
+    """
+    Modul zstandard (di-import saat pertama kali dipakai), atau None -> zlib sebagai cadangan.
+    """
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+@lru_cache(maxsize=None)
+def _fcntl():
+    """
+    Modul fcntl (flock antar proses), atau None di platform tanpa fcntl.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return None
+    return fcntl
+
+
+@contextmanager
+def _file_lock(f):
+    """
+    Lock eksklusif antar proses pada file f (tanpa fcntl: hanya lock thread).
+    """
+    fcntl = _fcntl()
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _compress(payload: bytes) -> Tuple[int, bytes]:
+    zstandard = _zstandard()
+    if zstandard is not None:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    return CODEC_ZLIB, zlib.compress(payload, 6)
+
+
+def _decompress(codec: int, data: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise RuntimeError("Arsip ini memakai zstd; install dulu: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    return data
+
+
+class HtmlArchive:
+    """
+    Writer + reader arsip. Writer aman dipakai dari beberapa thread.
+    """
+
+    def __init__(self, path: str, readonly: bool = False):
+        self.path = path
+        self.readonly = readonly
+        self._lock = threading.Lock()
+        self._data_path = os.path.join(path, DATA_FILE)
+        self._index_path = os.path.join(path, INDEX_FILE)
+        self._data_f = None
+        self._index_f = None
+        self._data_mm: Optional[mmap.mmap] = None
+        self._index_mm: Optional[mmap.mmap] = None
+        self._mapped_count = -1
+        if not readonly:
+            os.makedirs(path, exist_ok=True)
+            self._recover()
+
+    # ---------- writer ----------
+
+    def _recover(self) -> None:
+        """
+        Kalau proses sempat mati di tengah append, buang data/index yang setengah jadi.
+        Dijalankan di bawah lock supaya append proses lain yang sedang jalan tidak terpotong.
+        """
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, "ab") as lock_f, _file_lock(lock_f):
+            self._truncate_partial()
+
+    def _truncate_partial(self) -> None:
+        size = os.path.getsize(self._index_path)
+        whole = size - size % _INDEX_ENTRY.size
+        if whole != size:
+            with open(self._index_path, "r+b") as f:
+                f.truncate(whole)
+
+        if whole == 0:
+            end = 0
+        else:
+            with open(self._index_path, "rb") as f:
+                f.seek(whole - _INDEX_ENTRY.size)
+                last_offset, = _INDEX_ENTRY.unpack(f.read(_INDEX_ENTRY.size))
+            with open(self._data_path, "rb") as f:
+                f.seek(last_offset)
+                _codec, _kind, url_len, payload_len, _ts = _RECORD_HEADER.unpack(f.read(_RECORD_HEADER.size))
+            end = last_offset + _RECORD_HEADER.size + url_len + payload_len
+
+        if os.path.exists(self._data_path) and os.path.getsize(self._data_path) > end:
+            with open(self._data_path, "r+b") as f:
+                f.truncate(end)
+
+    def append(self, url: str, kind: str, html: bytes, fetched_at: Optional[float] = None) -> int:
+        """
+        Simpan satu halaman; return nomor record.
+        """
+        if self.readonly:
+            raise RuntimeError("arsip dibuka read-only")
+        if isinstance(html, str):
+            html = html.encode("utf-8")
+        codec, payload = _compress(html)
+        url_b = url.encode("utf-8")
+        header = _RECORD_HEADER.pack(codec, _KIND_CODES[kind], len(url_b), len(payload),
+                                     fetched_at if fetched_at is not None else time.time())
+
+        with self._lock:
+            if self._data_f is None:
+                self._data_f = open(self._data_path, "ab")
+                self._index_f = open(self._index_path, "ab")
+            with _file_lock(self._index_f):
+                # proses lain mungkin sudah menambah record sejak append terakhir:
+                # offset diambil dari ujung file yang sebenarnya, di bawah lock
+                offset = self._data_f.seek(0, os.SEEK_END)
+                self._data_f.write(header + url_b + payload)
+                self._data_f.flush()
+                # index ditulis terakhir: record baru "ada" hanya kalau index-nya sudah ada
+                self._index_f.write(_INDEX_ENTRY.pack(offset))
+                self._index_f.flush()
+                return self._index_f.tell() // _INDEX_ENTRY.size - 1
+
+    # ---------- reader ----------
+
+    def _map(self) -> int:
+        """
+        mmap ulang kalau ada record baru sejak mapping terakhir. Return jumlah record.
+        """
+        if self._index_f is not None:
+            with self._lock:
+                self._index_f.flush()
+                self._data_f.flush()
+
+        count = os.path.getsize(self._index_path) // _INDEX_ENTRY.size if os.path.exists(self._index_path) else 0
+        if count == self._mapped_count:
+            return count
+
+        self._unmap()
+        self._mapped_count = count
+        if count == 0:
+            return 0
+        with open(self._index_path, "rb") as f:
+            self._index_mm = mmap.mmap(f.fileno(), count * _INDEX_ENTRY.size, access=mmap.ACCESS_READ)
+        with open(self._data_path, "rb") as f:
+            self._data_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return count
+
+    def _unmap(self) -> None:
+        for mm in (self._index_mm, self._data_mm):
+            if mm is not None:
+                mm.close()
+        self._index_mm = self._data_mm = None
+
+    def __len__(self) -> int:
+        return self._map()
+
+    def _header(self, i: int) -> Tuple[int, int, str, int, int, float]:
+        """
+        (codec, kind, url, posisi payload, panjang payload, fetched_at) record ke-i.
+        """
+        offset, = _INDEX_ENTRY.unpack_from(self._index_mm, i * _INDEX_ENTRY.size)
+        codec, kind, url_len, payload_len, ts = _RECORD_HEADER.unpack_from(self._data_mm, offset)
+        url_start = offset + _RECORD_HEADER.size
+        url = self._data_mm[url_start:url_start + url_len].decode("utf-8")
+        return codec, kind, url, url_start + url_len, payload_len, ts
+
+    def entry(self, i: int) -> Tuple[str, str, float]:
+        """
+        Metadata record ke-i: (url, kind, fetched_at) tanpa dekompresi.
+        """
+        count = self._map()
+        if not 0 <= i < count:
+            raise IndexError("record arsip di luar range")
+        _codec, kind, url, _start, _plen, ts = self._header(i)
+        return url, _KIND_NAMES.get(kind, "?"), ts
+
+    def read(self, i: int) -> bytes:
+        """
+        HTML record ke-i (sudah didekompresi).
+        """
+        count = self._map()
+        if not 0 <= i < count:
+            raise IndexError("record arsip di luar range")
+        codec, _kind, _url, start, payload_len, _ts = self._header(i)
+        return _decompress(codec, self._data_mm[start:start + payload_len])
+
+    def iter_entries(self, kind: Optional[str] = None) -> Iterator[Tuple[int, str, str, float]]:
+        want = _KIND_CODES[kind] if kind is not None else None
+        for i in range(self._map()):
+            _codec, k, url, _start, _plen, ts = self._header(i)
+            if want is None or k == want:
+                yield i, url, _KIND_NAMES.get(k, "?"), ts
+
+    def latest_by_url(self, kind: Optional[str] = None) -> Dict[str, int]:
+        """
+        url -> nomor record terbaru (kalau halaman yang sama diambil berkali-kali).
+        """
+        latest: Dict[str, int] = {}
+        for i, url, _k, _ts in self.iter_entries(kind):
+            latest[url] = i
+        return latest
+
+    def close(self) -> None:
+        self._unmap()
+        with self._lock:
+            for f in (self._data_f, self._index_f):
+                if f is not None:
+                    f.close()
+            self._data_f = self._index_f = None
+
+    def __enter__(self) -> "HtmlArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# =========================
+# Re-parse dari arsip
+# =========================
+
+def _read_and_parse_detail(args: Tuple[str, int]) -> dict:
+    # dijalankan di worker process: buka arsip sendiri (mmap), parse satu detail
+    from tender_scrapping import parse_detail_html
+
+    path, i = args
+    archive = _worker_archive(path)
+    return parse_detail_html(archive.read(i))
+
+
+_WORKER_ARCHIVES: Dict[str, HtmlArchive] = {}
+
+
+def _worker_archive(path: str) -> HtmlArchive:
+    archive = _WORKER_ARCHIVES.get(path)
+    if archive is None:
+        archive = _WORKER_ARCHIVES[path] = HtmlArchive(path, readonly=True)
+    return archive
+
+
+def find_archives(path: str) -> List[str]:
+    """
+    Arsip di bawah path: path itu sendiri (kalau berisi arsip) dan subfolder
+    shard-<akun> yang ditulis tender_shard.
+    """
+    found = [path] if os.path.exists(os.path.join(path, DATA_FILE)) else []
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            sub = os.path.join(path, name)
+            if name.startswith("shard-") and os.path.exists(os.path.join(sub, DATA_FILE)):
+                found.append(sub)
+    return found or [path]
+
+
+def reparse_scrape(path: str, start_date: date, end_date: date, workers: int = 4):
+    """
+    Bangun ulang dataset scraping (seperti output scrape()) dari arsip, atau
+    dari seluruh pohon arsip tender_shard (<path>/shard-*).
+
+    Arsip shard dari mirror menyimpan URL dengan base mirror: base diambil dari
+    URL halaman list masing-masing, detail dicari dengan URL mirror itu, lalu
+    detail_url ditulis ulang ke MOBILE_BASE (sama dengan merge coordinator).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from tender_records import TenderBatch, SCRAPE_COLUMNS, SCRAPE_CATEGORIES
+    from tender_scrapping import build_row, parse_list_html
+    from tender_shard import canonical_url
+
+    rows = TenderBatch(SCRAPE_COLUMNS, SCRAPE_CATEGORIES)
+
+    # (tender, arsip, index detail / None); satu entri per detail_url kanonik
+    tenders: List[Tuple[dict, str, Optional[int]]] = []
+    seen: Dict[str, int] = {}
+    for archive_path in find_archives(path):
+        with HtmlArchive(archive_path, readonly=True) as archive:
+            details = archive.latest_by_url(KIND_DETAIL)
+            for list_url, i in archive.latest_by_url(KIND_LIST).items():
+                mobile_base = list_url.rsplit("/", 1)[0]
+                for t in parse_list_html(archive.read(i), start_date, end_date, mobile_base=mobile_base):
+                    detail_i = details.get(t["detail_url"])
+                    url = canonical_url(t["detail_url"], mobile_base)
+                    entry = (dict(t, detail_url=url), archive_path, detail_i)
+                    # halaman list yang memuat beberapa hari bisa berisi tender yang sama;
+                    # di arsip shard, detail-nya mungkin hanya ada di arsip akun lain
+                    pos = seen.get(url)
+                    if pos is None:
+                        seen[url] = len(tenders)
+                        tenders.append(entry)
+                    elif tenders[pos][2] is None and detail_i is not None:
+                        tenders[pos] = entry
+
+    jobs = [(archive_path, detail_i) for _t, archive_path, detail_i in tenders if detail_i is not None]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parsed = iter(pool.map(_read_and_parse_detail, jobs, chunksize=32))
+        for t, _archive_path, detail_i in tenders:
+            detail = next(parsed) if detail_i is not None else {}
+            rows.append(build_row(t, detail))
+
+    return rows
+
+
+def reparse_web(path: str):
+    """
+    Parse ulang semua halaman yang diambil via tender_hybrid (Selenium).
+    """
+    from tender_hybrid import extract_text_lines_from_html, extract_tender_items_from_lines
+    from tender_records import TenderBatch
+
+    archive = HtmlArchive(path, readonly=True)
+    tenders = TenderBatch()
+    for url, i in archive.latest_by_url(KIND_WEB).items():
+        html = archive.read(i).decode("utf-8", "replace")
+        for row in extract_tender_items_from_lines(extract_text_lines_from_html(html)):
+            tenders.append(row)
+    archive.close()
+    return tenders
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arsip HTML mentah & parsing ulang tanpa network.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_info = sub.add_parser("info", help="ringkasan isi arsip")
+    p_info.add_argument("archive")
+
+    p_re = sub.add_parser("reparse", help="bangun ulang dataset scraping dari arsip")
+    p_re.add_argument("archive", help="folder arsip, atau folder induk berisi shard-* dari tender_shard")
+    p_re.add_argument("--start", default=None, help="YYYY-MM-DD (default: semua)")
+    p_re.add_argument("--end", default=None, help="YYYY-MM-DD (default: semua)")
+    p_re.add_argument("-o", "--output", default="tender_indonesia_reparsed.xlsx")
+    p_re.add_argument("--workers", type=int, default=4)
+
+    p_web = sub.add_parser("reparse-web", help="parse ulang halaman dari tender_hybrid")
+    p_web.add_argument("archive")
+    p_web.add_argument("-o", "--output", default="tender_parsed_reparsed.xlsx")
+
+    args = parser.parse_args()
+
+    if args.command == "info":
+        with HtmlArchive(args.archive, readonly=True) as archive:
+            counts: Dict[str, int] = {}
+            for _i, _url, kind, _ts in archive.iter_entries():
+                counts[kind] = counts.get(kind, 0) + 1
+            print(f"{len(archive)} halaman, "
+                  f"{os.path.getsize(os.path.join(args.archive, DATA_FILE)) / 1e6:.1f} MB terkompresi")
+            for kind, n in sorted(counts.items()):
+                print(f"  {kind}: {n}")
+        return
+
+    if args.command == "reparse":
+        from tender_scrapping import parse_date, export_rows
+
+        start = parse_date(args.start) if args.start else date.min
+        end = parse_date(args.end) if args.end else date.max
+        started = time.perf_counter()
+        rows = reparse_scrape(args.archive, start, end, workers=args.workers)
+        print(f"[REPARSE] {len(rows)} baris dalam {time.perf_counter() - started:.1f}s")
+        if rows:
+            export_rows(rows, args.output)
+        return
+
+    if args.command == "reparse-web":
+        from tender_hybrid import export_to_excel
+
+        tenders = reparse_web(args.archive)
+        print(f"[REPARSE] {len(tenders)} tender")
+        export_to_excel(tenders, args.output)
+
+
+if __name__ == "__main__":
+    main()
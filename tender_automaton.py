@@ -0,0 +1,94 @@
+"""
+Aho-Corasick keyword automaton (pure Python, tanpa dependency).
+
+Semua keyword dikompilasi jadi satu automaton, jadi satu kali scan teks
+menemukan semua keyword yang muncul. Biaya scan ~ panjang teks + jumlah match,
+tidak tergantung berapa banyak keyword yang didaftarkan.
+"""
+from collections import deque
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class KeywordAutomaton:
+    def __init__(self):
+        # node 0 = root
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._own: List[List[Any]] = [[]]
+        self._out: List[List[Any]] = [[]]
+        self._built = True
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, keyword: str, value: Any) -> None:
+        """
+        Daftarkan keyword; value dikembalikan setiap kali keyword ini match.
+        """
+        if not keyword:
+            raise ValueError("keyword kosong tidak didukung")
+
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append([])
+                self._out.append([])
+                self._goto[node][ch] = nxt
+            node = nxt
+        self._own[node].append(value)
+        self._size += 1
+        self._built = False
+
+    def build(self) -> "KeywordAutomaton":
+        """
+        Hitung failure link (BFS). Dipanggil otomatis sebelum scan pertama.
+        """
+        goto, fail = self._goto, self._fail
+        out = self._out = [list(own) for own in self._own]
+        q = deque()
+        for nxt in goto[0].values():
+            fail[nxt] = 0
+            q.append(nxt)
+
+        while q:
+            node = q.popleft()
+            for ch, nxt in goto[node].items():
+                q.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                # output node = output sendiri + output dari failure target
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._built = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield (posisi_akhir, value) untuk setiap keyword yang muncul di text.
+        """
+        if not self._built:
+            self.build()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                for value in out[node]:
+                    yield i, value
+
+    def values(self, text: str) -> List[Any]:
+        """
+        Semua value yang match (boleh duplikat kalau keyword muncul berkali-kali).
+        """
+        return [value for _, value in self.iter_matches(text)]
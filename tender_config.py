@@ -0,0 +1,198 @@
+"""
+Profil run bernama untuk tender.py (pengganti mengedit konstanta di
+tender_scrapping.py setiap kali mau ganti tanggal, rate, atau jumlah worker).
+
+File profil (tender_profiles.json):
+    {"profiles": {
+        "default": {},
+        "cepat":   {"workers": 4, "rate": 2.0, "writer": "jsonl", "output": "tender_cepat.jsonl"},
+        "harian":  {"extends": "cepat", "start": "today-1", "end": "today"}
+    }}
+
+Key yang tidak diisi memakai default dari konstanta modul (default_settings).
+"extends" mewarisi profil lain. Tanggal boleh "YYYY-MM-DD", "today", atau
+"today-N" (N hari sebelum hari ini).
+
+| key          | arti                                                      |
+|--------------|-----------------------------------------------------------|
+| start, end   | range tanggal scraping                                    |
+| output       | file output                                               |
+| writer       | xlsx / csv / json / jsonl                                 |
+| rate         | request per detik per akun (0 = tanpa jeda)               |
+| workers      | proses parsing (per akun kalau sharded)                   |
+| queue_size   | maksimum HTML yang menunggu di-parse                      |
+| batch_size   | baris per batch saat menulis ke / membaca dari store      |
+| archive_dir  | arsip HTML mentah (null = tidak diarsip)                  |
+| store_db     | store SQLite (null = tidak ditulis)                       |
+| snapshot_dir | state tender_diff (null = tanpa delta)                    |
+| report_dir   | laporan per run (setting efektif + throughput)            |
+| accounts     | file akun tender_shard (null = satu session, akun default) |
+| shard_days   | hari per shard kalau sharded                              |
+| sector_map   | peta client -> sector yang dipelajari parse HTML (null = off) |
+"""
+import glob
+import json
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+DEFAULT_PROFILES_FILE = "tender_profiles.json"
+DEFAULT_PROFILE = "default"
+DEFAULT_REPORT_DIR = "run_reports"
+
+# kedalaman "extends" maksimum (jaga-jaga kalau ada siklus)
+MAX_EXTENDS = 10
+
+
+def default_settings() -> Dict:
+    """
+    Setting dasar: konstanta tender_scrapping / tender_extract / tender_shard.
+    """
+    import tender_scrapping as ts
+    from tender_extract import STORE_CHUNK
+    from tender_shard import SHARD_DAYS
+
+    settings = ts.default_settings()
+    settings.update({
+        "batch_size": STORE_CHUNK,
+        "report_dir": DEFAULT_REPORT_DIR,
+        "accounts": None,
+        "shard_days": SHARD_DAYS,
+        "sector_map": None,
+    })
+    return settings
+
+
+def load_profiles(path: str = DEFAULT_PROFILES_FILE) -> Dict[str, Dict]:
+    """
+    Nama profil -> isi mentah. File tidak ada = hanya profil default kosong.
+    """
+    if not os.path.exists(path):
+        return {DEFAULT_PROFILE: {}}
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    profiles = data.get("profiles", data)
+    if not isinstance(profiles, dict):
+        raise ValueError(f"Format {path} salah: harus object nama profil -> setting")
+    profiles.setdefault(DEFAULT_PROFILE, {})
+    return profiles
+
+
+def coerce(key: str, value, defaults: Dict):
+    """
+    Samakan tipe value dengan default-nya ("4" -> 4 untuk workers, "null" -> None).
+    """
+    if key not in defaults:
+        raise ValueError(f"Setting tidak dikenal: {key} (pilihan: {', '.join(sorted(defaults))})")
+    if isinstance(value, str) and value.lower() in ("null", "none", ""):
+        return None
+    base = defaults[key]
+    if base is None or isinstance(value, type(base)) or not isinstance(value, (str, int, float)):
+        return value
+    return type(base)(value)
+
+
+def resolve_date(value: str, today: Optional[date] = None) -> str:
+    """
+    "today" / "today-N" / "YYYY-MM-DD" -> "YYYY-MM-DD".
+    """
+    today = today or date.today()
+    text = str(value).strip().lower()
+    if text.startswith("today"):
+        rest = text[len("today"):].replace(" ", "")
+        return (today - timedelta(days=int(rest[1:]) if rest.startswith("-") else 0)).isoformat()
+    return datetime.strptime(text, "%Y-%m-%d").date().isoformat()
+
+
+def resolve_profile(name: str = DEFAULT_PROFILE, path: str = DEFAULT_PROFILES_FILE,
+                    overrides: Optional[Dict] = None) -> Dict:
+    """
+    Setting efektif profil: default modul <- rantai extends <- profil <- overrides (CLI).
+    """
+    profiles = load_profiles(path)
+    defaults = default_settings()
+
+    chain: List[Dict] = []
+    current: Optional[str] = name
+    while current is not None:
+        if current not in profiles:
+            raise ValueError(f"Profil tidak ada di {path}: {current} (pilihan: {', '.join(sorted(profiles))})")
+        if len(chain) >= MAX_EXTENDS:
+            raise ValueError(f"extends terlalu dalam / berputar di profil {name}")
+        chain.append(profiles[current])
+        current = profiles[current].get("extends")
+
+    settings = dict(defaults)
+    for layer in reversed(chain):
+        for key, value in layer.items():
+            if key != "extends":
+                settings[key] = coerce(key, value, defaults)
+    for key, value in (overrides or {}).items():
+        settings[key] = coerce(key, value, defaults)
+
+    settings["start"] = resolve_date(settings["start"])
+    settings["end"] = resolve_date(settings["end"])
+    if settings["start"] > settings["end"]:
+        raise ValueError(f"start ({settings['start']}) setelah end ({settings['end']})")
+    return settings
+
+
+def parse_overrides(pairs: Optional[List[str]]) -> Dict[str, str]:
+    """
+    ["workers=4", "rate=2"] -> {"workers": "4", "rate": "2"}.
+    """
+    overrides = {}
+    for pair in pairs or []:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"--set harus KEY=VALUE: {pair}")
+        overrides[key.strip()] = value.strip()
+    return overrides
+
+
+def write_report(report_dir: str, command: str, profile: str, settings: Optional[Dict], started: float,
+                 finished: float, rows: int, extra: Optional[Dict] = None) -> str:
+    """
+    Simpan laporan satu run (setting efektif + durasi + throughput) sebagai JSON.
+    settings None = run tidak memakai setting profil (key "settings" tidak ditulis).
+    """
+    os.makedirs(report_dir, exist_ok=True)
+    seconds = finished - started
+    report = {
+        "command": command,
+        "profile": profile,
+        "started_at": datetime.fromtimestamp(started).isoformat(timespec="seconds"),
+        "finished_at": datetime.fromtimestamp(finished).isoformat(timespec="seconds"),
+        "seconds": round(seconds, 3),
+        "rows": rows,
+        "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None,
+    }
+    if settings is not None:
+        report["settings"] = settings
+    report.update(extra or {})
+    stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(started))
+    path = os.path.join(report_dir, f"{stamp}-{command}-{profile}.json")
+    n = 1
+    while os.path.exists(path):
+        n += 1
+        path = os.path.join(report_dir, f"{stamp}-{command}-{profile}-{n}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    return path
+
+
+def load_reports(report_dir: str = DEFAULT_REPORT_DIR, command: Optional[str] = None) -> List[Dict]:
+    """
+    Semua laporan run (urut waktu mulai), opsional hanya satu command.
+    """
+    reports = []
+    for path in sorted(glob.glob(os.path.join(report_dir, "*.json"))):
+        with open(path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        if command and report.get("command") != command:
+            continue
+        report["path"] = path
+        reports.append(report)
+    reports.sort(key=lambda r: (r.get("started_at", ""), r.get("finished_at", "")))
+    return reports
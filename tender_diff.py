@@ -0,0 +1,349 @@
+"""
+Deteksi perubahan antar hasil scraping: yang baru, yang berubah (mis.
+closing_date / estimation_value diganti) dan yang hilang, tanpa membandingkan
+file Excel utuh.
+
+Setiap tender dikenali dari detail_url. Untuk tiap tender disimpan tanggal
+rilis dan hash per field (crc32) di index snapshot (file biner kecil, bukan
+data lengkapnya). Scrape berikutnya cukup dibandingkan dengan index itu, lalu
+yang ditulis hanya delta-nya (JSONL):
+
+    {"op": "snapshot", "id": 8, "base": 7, "rows": 1520, "added": 12, "changed": 3, "removed": 1}
+    {"op": "add", "key": "https://.../m/detail-...", "row": {...semua field...}}
+    {"op": "change", "key": "https://...", "set": {"closing_date": "20 Nov 2025"}}
+    {"op": "remove", "key": "https://..."}
+
+"remove" hanya untuk tender yang tanggal rilisnya ada di rentang tanggal
+scrape sekarang; tender di luar rentang itu tetap disimpan di index, jadi
+scrape harian (rentang pendek) tidak menganggap data lama hilang.
+
+Konsumen yang menyimpan snapshot `base` cukup menerapkan delta (apply_delta),
+tidak perlu memuat ulang seluruh file.
+
+Isi folder state:
+- snapshot.idx          : index hash snapshot terakhir
+- delta-<id>.jsonl      : delta dari snapshot <id - 1> ke <id>
+
+Contoh:
+    python tender_diff.py diff tender_indonesia_filtered.xlsx --state snapshots
+    python tender_diff.py info --state snapshots
+"""
+import argparse
+import json
+import os
+import struct
+import time
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import tender_log
+from tender_records import SCRAPE_COLUMNS, TenderBatch
+
+DEFAULT_STATE_DIR = "snapshots"
+INDEX_FILE = "snapshot.idx"
+
+KEY_FIELD = "detail_url"
+DIFF_FIELDS = tuple(c for c in SCRAPE_COLUMNS if c != KEY_FIELD)
+
+# magic, versi, id snapshot, jumlah tender, waktu, panjang daftar field
+_INDEX_HEADER = struct.Struct("<4sHIId H")
+_INDEX_MAGIC = b"TSNP"
+_INDEX_VERSION = 1
+_KEY_LEN = struct.Struct("<HB")
+DAY_FIELD = "announce_date"
+
+log = tender_log.get_logger("diff")
+
+
+def field_hash(value) -> int:
+    if value is None:
+        return 0
+    return zlib.crc32(str(value).encode("utf-8"))
+
+
+def record_key(record: Dict) -> str:
+    """
+    detail_url; untuk baris tanpa URL dipakai tanggal + judul.
+    """
+    url = record.get(KEY_FIELD)
+    if url:
+        return str(url)
+    return f"{record.get(DAY_FIELD, '')}|{record.get('title', '')}"
+
+
+class SnapshotIndex:
+    """
+    key -> (tanggal rilis, tuple hash per field urut self.fields).
+    """
+
+    def __init__(self, fields: Sequence[str] = DIFF_FIELDS, snapshot_id: int = 0, created_at: float = 0.0):
+        self.fields = tuple(fields)
+        self.snapshot_id = snapshot_id
+        self.created_at = created_at
+        self.entries: Dict[str, Tuple[str, Tuple[int, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def load(cls, path: str) -> "SnapshotIndex":
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, snapshot_id, count, created_at, fields_len = _INDEX_HEADER.unpack_from(data, 0)
+        if magic != _INDEX_MAGIC or version != _INDEX_VERSION:
+            raise ValueError(f"Bukan index snapshot yang dikenal: {path}")
+        pos = _INDEX_HEADER.size
+        fields = data[pos:pos + fields_len].decode("utf-8").split("\x1f")
+        pos += fields_len
+
+        index = cls(fields, snapshot_id, created_at)
+        hashes = struct.Struct(f"<{len(fields)}I")
+        entries = index.entries
+        for _ in range(count):
+            key_len, day_len = _KEY_LEN.unpack_from(data, pos)
+            pos += _KEY_LEN.size
+            key = data[pos:pos + key_len].decode("utf-8")
+            pos += key_len
+            day = data[pos:pos + day_len].decode("ascii")
+            pos += day_len
+            entries[key] = (day, hashes.unpack_from(data, pos))
+            pos += hashes.size
+        return index
+
+    def save(self, path: str) -> None:
+        fields_b = "\x1f".join(self.fields).encode("utf-8")
+        hashes = struct.Struct(f"<{len(self.fields)}I")
+        parts = [_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, self.snapshot_id, len(self.entries),
+                                    self.created_at, len(fields_b)), fields_b]
+        for key, (day, values) in self.entries.items():
+            key_b = key.encode("utf-8")[:0xFFFF]
+            day_b = day.encode("ascii", "replace")[:0xFF]
+            parts.append(_KEY_LEN.pack(len(key_b), len(day_b)))
+            parts.append(key_b)
+            parts.append(day_b)
+            parts.append(hashes.pack(*values))
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(parts))
+        os.replace(tmp, path)
+
+
+def _day(value) -> str:
+    return str(value)[:10] if value else ""
+
+
+def _iter_rows(records, fields: Sequence[str]) -> Iterator[Tuple[str, str, Tuple]]:
+    """
+    (key, tanggal rilis, nilai field) per tender; TenderBatch dibaca per kolom.
+    """
+    if isinstance(records, TenderBatch):
+        pos = {c: i for i, c in enumerate(records.columns)}
+        picks = [pos.get(f) for f in fields]
+        url_i = pos.get(KEY_FIELD)
+        day_i = pos.get(DAY_FIELD)
+        for values in records.rows():
+            url = values[url_i] if url_i is not None else ""
+            key = url if url else record_key(dict(zip(records.columns, values)))
+            day = _day(values[day_i]) if day_i is not None else ""
+            yield key, day, tuple(values[i] if i is not None else "" for i in picks)
+        return
+    for rec in records:
+        yield record_key(rec), _day(rec.get(DAY_FIELD)), tuple(rec.get(f, "") for f in fields)
+
+
+def _clean(value):
+    # NaN / Timestamp dari pandas -> nilai JSON biasa
+    if value is None or value != value:
+        return ""
+    return value if isinstance(value, (str, int, float)) else str(value)
+
+
+def diff_records(records, previous: SnapshotIndex, fields: Sequence[str] = DIFF_FIELDS,
+                 window: Optional[Tuple[str, str]] = None) -> Tuple[List[Dict], SnapshotIndex]:
+    """
+    Bandingkan tender sekarang dengan index snapshot sebelumnya.
+    Return (operasi delta, index baru). Tender dengan key ganda: yang pertama dipakai.
+
+    window = (tanggal awal, tanggal akhir) ISO yang dicakup scrape ini; default
+    tanggal rilis terlama & terbaru di records. Tender lama di luar window
+    tidak dianggap hilang (hash-nya dipetakan ke layout field baru kalau
+    DIFF_FIELDS berubah).
+    """
+    fields = tuple(fields)
+    current = SnapshotIndex(fields, previous.snapshot_id + 1, time.time())
+    # posisi field lama untuk tiap field sekarang (None kalau field baru)
+    old_pos = {f: i for i, f in enumerate(previous.fields)}
+    remap = [old_pos.get(f) for f in fields]
+    same_layout = tuple(fields) == previous.fields
+    empty_hash = field_hash("")
+
+    ops: List[Dict] = []
+    prev_entries = previous.entries
+    entries = current.entries
+    # hash per nilai unik per kolom (owner, kategori, tanggal banyak berulang)
+    caches: List[Dict] = [{} for _ in fields]
+    first_day = last_day = None
+    for key, day, values in _iter_rows(records, fields):
+        if key in entries:
+            continue
+        if day:
+            if first_day is None or day < first_day:
+                first_day = day
+            if last_day is None or day > last_day:
+                last_day = day
+        hashes = []
+        for cache, v in zip(caches, values):
+            h = cache.get(v)
+            if h is None:
+                h = cache[v] = field_hash(_clean(v))
+            hashes.append(h)
+        hashes = tuple(hashes)
+        entries[key] = (day, hashes)
+        old = prev_entries.get(key)
+        if old is not None:
+            old = old[1]
+        if old is None:
+            ops.append({"op": "add", "key": key, "row": {f: _clean(v) for f, v in zip(fields, values)}})
+            continue
+        if same_layout and old == hashes:
+            continue
+        changed = {}
+        for i, f in enumerate(fields):
+            j = remap[i]
+            if j is None or old[j] != hashes[i]:
+                changed[f] = _clean(values[i])
+        if changed:
+            ops.append({"op": "change", "key": key, "set": changed})
+
+    start, end = window or (first_day, last_day)
+    for key, entry in prev_entries.items():
+        if key in entries:
+            continue
+        day = entry[0]
+        if start is not None and (not day or start <= day <= end):
+            ops.append({"op": "remove", "key": key})
+        elif same_layout:
+            entries[key] = entry  # di luar rentang scrape ini: tetap diingat
+        else:
+            # field baru belum punya nilai lama: dianggap kosong
+            old = entry[1]
+            entries[key] = (day, tuple(old[j] if j is not None else empty_hash for j in remap))
+    return ops, current
+
+
+def summarize(ops: Iterable[Dict]) -> Dict[str, int]:
+    counts = {"added": 0, "changed": 0, "removed": 0}
+    names = {"add": "added", "change": "changed", "remove": "removed"}
+    for op in ops:
+        counts[names[op["op"]]] += 1
+    return counts
+
+
+def write_delta(path: str, ops: List[Dict], current: SnapshotIndex, base_id: int) -> None:
+    header = {"op": "snapshot", "id": current.snapshot_id, "base": base_id, "rows": len(current)}
+    header.update(summarize(ops))
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(json.dumps(header, ensure_ascii=False))
+        f.write("\n")
+        for op in ops:
+            f.write(json.dumps(op, ensure_ascii=False))
+            f.write("\n")
+    os.replace(tmp, path)
+
+
+def apply_delta(rows: Dict[str, Dict], path: str, base_id: Optional[int] = None) -> int:
+    """
+    Terapkan file delta ke salinan lokal (key -> row). Kalau base_id diberikan,
+    delta harus berasal dari snapshot itu. Return id snapshot baru.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if base_id is not None and header["base"] != base_id:
+            raise ValueError(f"Delta {path} untuk snapshot {header['base']}, bukan {base_id}")
+        for line in f:
+            op = json.loads(line)
+            kind = op["op"]
+            if kind == "add":
+                rows[op["key"]] = op["row"]
+            elif kind == "change":
+                rows.setdefault(op["key"], {}).update(op["set"])
+            elif kind == "remove":
+                rows.pop(op["key"], None)
+    return header["id"]
+
+
+def snapshot(records, state_dir: str = DEFAULT_STATE_DIR,
+             window: Optional[Tuple[str, str]] = None) -> Tuple[Optional[str], Dict[str, int]]:
+    """
+    Diff hasil scrape terhadap snapshot terakhir di state_dir, tulis delta
+    dan index baru. Return (path delta atau None kalau tidak ada perubahan, ringkasan).
+    """
+    os.makedirs(state_dir, exist_ok=True)
+    index_path = os.path.join(state_dir, INDEX_FILE)
+    previous = SnapshotIndex.load(index_path) if os.path.exists(index_path) else SnapshotIndex()
+
+    with tender_log.span(log, "diff", previous=len(previous)) as sp:
+        ops, current = diff_records(records, previous, window=window)
+        counts = summarize(ops)
+        sp.set(rows=len(current), **counts)
+
+    delta_path = None
+    if ops:
+        delta_path = os.path.join(state_dir, f"delta-{current.snapshot_id:06d}.jsonl")
+        write_delta(delta_path, ops, current, previous.snapshot_id)
+        current.save(index_path)
+    log.info("Snapshot diff", extra=dict(counts, snapshot=current.snapshot_id if ops else previous.snapshot_id,
+                                         rows=len(current)))
+    return delta_path, counts
+
+
+def _read_records(path: str):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    import pandas as pd
+    if ext == ".csv":
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    else:
+        df = pd.read_excel(path, dtype=str, keep_default_na=False)
+    return df.to_dict("records")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Delta antar hasil scraping (baru / berubah / hilang).")
+    parser.add_argument("--state", default=DEFAULT_STATE_DIR, help="folder index snapshot & file delta")
+    tender_log.add_log_arguments(parser)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_diff = sub.add_parser("diff", help="bandingkan file hasil scrape (.xlsx/.csv/.jsonl) dengan snapshot terakhir")
+    p_diff.add_argument("file")
+    p_diff.add_argument("--start", help="tanggal awal rentang scrape (default: tanggal rilis terlama di file)")
+    p_diff.add_argument("--end", help="tanggal akhir rentang scrape (default: tanggal rilis terbaru di file)")
+    sub.add_parser("info", help="ringkasan snapshot terakhir")
+    args = parser.parse_args(argv)
+    tender_log.configure_from_args(args)
+
+    if args.command == "info":
+        index_path = os.path.join(args.state, INDEX_FILE)
+        if not os.path.exists(index_path):
+            print("Belum ada snapshot")
+            return 1
+        index = SnapshotIndex.load(index_path)
+        print(f"snapshot {index.snapshot_id}: {len(index)} tender, "
+              f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(index.created_at))}")
+        return 0
+
+    records = _read_records(args.file)
+    window = None
+    if args.start or args.end:
+        days = [_day(r.get(DAY_FIELD)) for r in records if r.get(DAY_FIELD)]
+        window = (args.start or min(days, default=""), args.end or max(days, default="9999"))
+    delta_path, counts = snapshot(records, args.state, window)
+    print(f"+{counts['added']} baru, ~{counts['changed']} berubah, -{counts['removed']} hilang"
+          + (f" -> {delta_path}" if delta_path else " (tidak ada perubahan)"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,31 +1,59 @@
-import pandas as pd
+import argparse
+import io
+import itertools
 import re
 from datetime import datetime
 
-def parse_tender_data(text_content):
+from tender_records import TENDER_COLUMNS, TenderBatch, to_dataframe
+import tender_io
+from tender_stats import TenderStats
+import tender_log
+
+log = tender_log.get_logger("extract")
+
+# Pola baris (di-compile sekali, dipakai per baris)
+SECTOR_RE = re.compile(r'^[A-Z&/\s]+$')
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+TENDER_DATE_RE = re.compile(r'\((\d{4}-\d{2}-\d{2})\)')
+SOW_RE = re.compile(r'\(([^)]+)\)')
+BULLET_RE = re.compile(r'^o\s*')
+LEADING_DOT_RE = re.compile(r'^\.\s*')
+TITLE_DASH_RE = re.compile(r'^[-\s]*')
+TITLE_LEAD_RE = re.compile(r'^[\.\-\s]*')
+
+SECTOR_EXCLUDE = ('government', 'kota', 'kabupaten')
+GOVERNMENT_HEADING_RE = re.compile('CENTRAL GOVERNMENT|PROVINCE GOVERNMENT|CITY GOVERNMENT|'
+                                   'REGENCY GOVERNMENT|ALL GOVERNMENT')
+
+# Jumlah tender per batch saat hasil streaming ditulis ke store
+STORE_CHUNK = 50000
+
+def iter_tender_records(lines):
     """
-    Fungsi untuk parsing data tender dari text content - VERSION 2
+    Parser streaming: terima iterable baris (file, stdin, list) dan yield
+    tuple (Sector, Client, Tanggal Rilis, SOW, Judul Tender) satu per satu.
+    Memori tidak bergantung pada panjang input.
     """
-    # Convert tabs to spaces dan clean up
-    text_content = text_content.replace('\t', ' ').replace('○', 'o').replace('•', 'o')
-    
-    lines = text_content.split('\n')
-    tenders = []
     current_sector = ""
     current_client = ""
+    # None kalau level trace tidak aktif (tanpa overhead per baris)
+    trace = tender_log.tracer(log)
     
-    for line in lines:
-        line = line.strip()
+    for i, line in enumerate(lines):
+        # Convert tabs to spaces dan clean up (per baris, bukan atas seluruh teks)
+        line = line.replace('\t', ' ').replace('○', 'o').replace('•', 'o').strip()
         
         # Skip empty lines and placeholder data
         if not line or 'DALAM PROSES ENTRI DATA' in line:
             continue
             
         # Detect sector (ALL CAPS atau judul utama)
-        if (re.match(r'^[A-Z&/\s]+$', line) and len(line) > 3 and 
-            not any(word in line.lower() for word in ['government', 'kota', 'kabupaten'])):
+        if (SECTOR_RE.match(line) and len(line) > 3 and 
+            not any(word in line.lower() for word in SECTOR_EXCLUDE)):
             current_sector = line
             current_client = ""
+            if trace:
+                trace("sector", i, line, sector=current_sector)
             continue
             
         # Detect client (indented text, biasanya nama perusahaan/instansi)
@@ -33,22 +61,25 @@ def parse_tender_data(text_content):
             not line.startswith('(') and
             not 'GOVERNMENT' in line and
             len(line) > 5 and
-            not re.search(r'\d{4}-\d{2}-\d{2}', line)):
+            not ISO_DATE_RE.search(line)):
             
             # Skip jika ini adalah sub-heading government
-            if not any(gov in line for gov in ['CENTRAL GOVERNMENT', 'PROVINCE GOVERNMENT', 
-                                             'CITY GOVERNMENT', 'REGENCY GOVERNMENT', 'ALL GOVERNMENT']):
+            if not GOVERNMENT_HEADING_RE.search(line):
                 current_client = line.strip()
+                if trace:
+                    trace("client", i, line, client=current_client)
+            elif trace:
+                trace("sub-heading", i, line)
             continue
             
         # Parse tender items dengan bullet points (o)
-        if line.startswith('o') or re.search(r'\(\d{4}-\d{2}-\d{2}\)', line):
+        if line.startswith('o') or TENDER_DATE_RE.search(line):
             # Clean the line
-            line = re.sub(r'^o\s*', '', line)  # Remove bullet point
-            line = re.sub(r'^\.\s*', '', line)  # Remove leading dot
+            line = BULLET_RE.sub('', line, count=1)  # Remove bullet point
+            line = LEADING_DOT_RE.sub('', line, count=1)  # Remove leading dot
             
             # Extract date
-            date_match = re.search(r'\((\d{4}-\d{2}-\d{2})\)', line)
+            date_match = TENDER_DATE_RE.search(line)
             if date_match:
                 date = date_match.group(1)
                 
@@ -56,12 +87,12 @@ def parse_tender_data(text_content):
                 remaining_text = line[date_match.end():].strip()
                 
                 # Extract SOW (dalam kurung) dan Judul
-                sow_match = re.search(r'\(([^)]+)\)', remaining_text)
+                sow_match = SOW_RE.search(remaining_text)
                 if sow_match:
                     sow = sow_match.group(1)
                     title = remaining_text[sow_match.end():].strip()
                     # Clean title
-                    title = re.sub(r'^[-\s]*', '', title)
+                    title = TITLE_DASH_RE.sub('', title, count=1)
                 else:
                     # Jika tidak ada SOW dalam kurung
                     sow = ""
@@ -72,20 +103,37 @@ def parse_tender_data(text_content):
                 title = title.strip()
                 
                 # Remove trailing dots/dashes
-                title = re.sub(r'^[\.\-\s]*', '', title)
+                title = TITLE_LEAD_RE.sub('', title, count=1)
                 
-                # Add to tenders list jika ada sector
+                if trace:
+                    trace("tender", i, line, date=date, sow=sow, title=title)
+                
+                # Yield jika ada sector
                 if current_sector:
-                    tenders.append({
-                        'Sector': current_sector,
-                        'Client': current_client if current_client else 'Unknown',
-                        'Tanggal Rilis': date,
-                        'SOW': sow,
-                        'Judul Tender': title
-                    })
-    
+                    yield (
+                        current_sector,
+                        current_client if current_client else 'Unknown',
+                        date,
+                        sow,
+                        title,
+                    )
+
+def parse_tender_lines(lines):
+    """
+    Semua tender dari iterable baris -> TenderBatch.
+    """
+    tenders = TenderBatch()
+    for record in iter_tender_records(lines):
+        tenders.add(*record)
     return tenders
 
+def parse_tender_data(text_content):
+    """
+    Fungsi untuk parsing data tender dari text content - VERSION 2
+    """
+    # StringIO dipecah per '\n' saja, sama dengan split('\n'), tanpa membuat list semua baris
+    return parse_tender_lines(io.StringIO(text_content, newline='\n'))
+
 def manual_input_mode():
     """
     Mode input manual - paste data setiap kali
@@ -103,27 +151,30 @@ def manual_input_mode():
     print("➡️  Paste data di bawah ini (tekan Enter 2 kali setelah selesai):")
     print("-" * 50)
     
-    lines = []
     print("Menunggu input...")
     
     try:
-        while True:
-            line = input()
-            if line == "":
-                # Check if we have multiple empty lines
-                if lines and lines[-1] == "":
-                    break
-                lines.append(line)
-            else:
-                lines.append(line)
-    except EOFError:
-        pass
+        return parse_tender_lines(pasted_lines())
     except KeyboardInterrupt:
         print("\n❌ Proses dibatalkan")
         return []
-    
-    text_content = "\n".join(lines)
-    return parse_tender_data(text_content)
+
+def pasted_lines():
+    """
+    Baris dari input() sampai Enter 2 kali (atau EOF), langsung diteruskan
+    ke parser tanpa ditampung dulu.
+    """
+    previous = None
+    while True:
+        try:
+            line = input()
+        except EOFError:
+            return
+        # Check if we have multiple empty lines
+        if line == "" and previous == "":
+            return
+        previous = line
+        yield line
 
 def save_to_excel(tenders, filename):
     """
@@ -133,7 +184,7 @@ def save_to_excel(tenders, filename):
         print("❌ Tidak ada data untuk disimpan")
         return False
     
-    df = pd.DataFrame(tenders)
+    df = to_dataframe(tenders)
     df = df[['Sector', 'Client', 'Tanggal Rilis', 'SOW', 'Judul Tender']]
     
     try:
@@ -143,10 +194,50 @@ def save_to_excel(tenders, filename):
         print(f"❌ Error menyimpan file: {e}")
         return False
 
+def batch_mode(args):
+    """
+    Mode non-interaktif: baca file/stdin per baris, tulis ke format pilihan.
+    Output jsonl/csv ditulis sambil parsing, jadi memori tetap kecil walau
+    inputnya berukuran GB.
+    """
+    records = iter_tender_records(tender_io.iter_input_lines(args.input))
+    first = next(records, None)
+    if first is None:
+        tender_io.info("❌ Tidak ada data tender yang berhasil diekstrak")
+        return 1
+    records = itertools.chain([first], records)
+
+    output, fmt = tender_io.resolve_output(args.output, args.format)
+    source = args.input or "-"
+    if fmt in tender_io.STREAM_FORMATS:
+        if args.db:
+            records = tender_io.tap_to_store(records, TENDER_COLUMNS, args.db, source, STORE_CHUNK)
+        count = tender_io.write_rows(records, TENDER_COLUMNS, output, fmt)
+        tender_io.info(f"✅ {count} tender -> {output} ({fmt})")
+        return 0
+
+    tenders = TenderBatch()
+    for record in records:
+        tenders.add(*record)
+    tender_io.write_output(tenders, output, fmt)
+    tender_io.info(f"✅ {len(tenders)} tender -> {output} ({fmt})")
+    if args.db:
+        tender_io.append_to_store(tenders, args.db, source=source)
+    return 0
+
 def main():
     """
     Main function
     """
+    parser = argparse.ArgumentParser(description="Ekstrak data tender dari teks paste tender-indonesia.com")
+    tender_io.add_io_arguments(parser)
+    tender_log.add_log_arguments(parser)
+    args = parser.parse_args()
+    tender_log.configure_from_args(args)
+
+    if tender_io.is_batch_mode(args):
+        return batch_mode(args)
+
     print("🚀 Memulai ekstraksi data tender...\n")
     
     tenders = manual_input_mode()
@@ -173,8 +264,9 @@ def main():
             print(f"💾 Data berhasil disimpan ke: {output_file}")
             
             # Statistics
-            sectors = set(t['Sector'] for t in tenders)
-            clients = set(t['Client'] for t in tenders)
+            stats = TenderStats.from_records(tenders)
+            sectors = set(stats.counts['sector'])
+            clients = set(stats.counts['client'])
             print(f"\n📊 STATISTIK:")
             print(f"   • Sectors: {len(sectors)}")
             print(f"   • Clients: {len(clients)}")
@@ -183,10 +275,13 @@ def main():
             # Show all sectors and clients
             print(f"\n📂 Sectors ditemukan: {', '.join(sorted(sectors))}")
             print(f"👥 Clients ditemukan: {', '.join(sorted(clients)[:5])}..." if len(clients) > 5 else f"👥 Clients: {', '.join(sorted(clients))}")
+
+        if args.db:
+            tender_io.append_to_store(tenders, args.db, source="paste")
             
     else:
         print("❌ Tidak ada data tender yang berhasil diekstrak")
         print("   Pastikan format data sesuai")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(main())
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Benchmark ekstraksi teks HTML (tender_hybrid.extract_text_lines_from_html)
+dibanding cara lama (BeautifulSoup find_all + get_text per tag).
+
+Cara lama membaca ulang teks tag bersarang (b di dalam td di dalam td), jadi
+waktunya membengkak di layout tabel bertingkat dan barisnya dobel. Benchmark
+melaporkan waktu, jumlah baris, dan jumlah baris duplikat untuk keduanya.
+
+Contoh:
+    python tender_html_bench.py halaman1.html halaman2.html
+    python tender_html_bench.py --generate 2000 --depth 6     # halaman sintetis besar
+"""
+import argparse
+import time
+from collections import Counter
+from typing import List, Optional
+
+from tender_hybrid import clean_text, extract_text_lines_from_html
+
+LEGACY_TAGS = ["h1", "h2", "h3", "h4", "b", "strong", "p", "td", "li", "span"]
+
+
+def legacy_extract_text_lines(html: str) -> List[str]:
+    """
+    Implementasi lama, hanya untuk pembanding.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    texts = []
+    for tag in soup.find_all(LEGACY_TAGS):
+        t = clean_text(tag.get_text(separator=" "))
+        if t:
+            texts.append(t)
+    return texts
+
+
+def generate_page(sections: int, depth: int) -> str:
+    """
+    Halaman sintetis mirip tender-indonesia: sector -> client -> item, dibungkus
+    tabel bertingkat sedalam `depth`.
+    """
+    parts = ["<html><body>"]
+    open_tables = "<table><tr><td>" * depth
+    close_tables = "</td></tr></table>" * depth
+    for i in range(sections):
+        parts.append(open_tables)
+        parts.append(f"<b>OIL &amp; GAS</b><table><tr><td><strong>PT KLIEN NOMOR {i}</strong></td></tr>")
+        for j in range(3):
+            parts.append(f"<tr><td><span>{j + 1}. (EPC) Pekerjaan <b>{i}-{j}</b> lapangan 0{j + 1}/11/2025"
+                         f"</span></td></tr>")
+        parts.append("</table>")
+        parts.append(close_tables)
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def _bench(func, html: str, repeat: int):
+    best = float("inf")
+    lines = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        lines = func(html)
+        best = min(best, time.perf_counter() - started)
+    duplicates = sum(n - 1 for n in Counter(lines).values() if n > 1)
+    return best, len(lines), duplicates
+
+
+def report(name: str, html: str, repeat: int, legacy: bool) -> None:
+    size_kb = len(html.encode("utf-8")) / 1024
+    print(f"{name} ({size_kb:,.0f} KB)")
+    funcs = [("linearizer", extract_text_lines_from_html)]
+    if legacy:
+        funcs.append(("find_all (lama)", legacy_extract_text_lines))
+    for label, func in funcs:
+        elapsed, n, dup = _bench(func, html, repeat)
+        print(f"  {label:16} {elapsed * 1000:9.1f} ms  {size_kb / elapsed:9,.0f} KB/s  "
+              f"{n:7d} baris  {dup:7d} duplikat")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ekstraksi teks HTML.")
+    parser.add_argument("files", nargs="*", help="halaman HTML tersimpan")
+    parser.add_argument("--generate", type=int, default=0, help="buat halaman sintetis dengan N section")
+    parser.add_argument("--depth", type=int, default=4, help="kedalaman tabel bertingkat halaman sintetis")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-legacy", action="store_true", help="lewati pembanding cara lama")
+    args = parser.parse_args(argv)
+
+    if not args.files and not args.generate:
+        args.generate = 1000
+
+    for path in args.files:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            report(path, f.read(), args.repeat, not args.no_legacy)
+    if args.generate:
+        html = generate_page(args.generate, args.depth)
+        report(f"sintetis {args.generate} section, depth {args.depth}", html, args.repeat, not args.no_legacy)
+
+
+if __name__ == "__main__":
+    main()
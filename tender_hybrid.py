@@ -1,19 +1,25 @@
+import codecs
+import logging
 import os
 import re
 import time
 import threading
 import subprocess
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Union
 
-import pandas as pd
-from bs4 import BeautifulSoup
+# pandas, BeautifulSoup dan selenium baru di-import di fungsi yang memakainya,
+# supaya mode file lokal / keluar tidak menunggu modul berat dimuat.
+if TYPE_CHECKING:
+    from selenium import webdriver
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from tender_archive import HtmlArchive, KIND_WEB
+from tender_records import TenderBatch, to_dataframe
+from tender_sector import SectorResolver
+from tender_watchlist import route_if_configured
+import tender_log
+
+log = tender_log.get_logger("hybrid")
 
 
 # =========================
@@ -28,81 +34,39 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
+# Folder arsip HTML mentah untuk mode web (lihat tender_archive.py). None = tidak diarsip.
+ARCHIVE_DIR = "html_archive"
+
+# Peta client -> sector hasil belajar dari data sebelumnya (JSON). None = tidak dipakai,
+# jadi hasil parsing hanya bergantung pada input & aturan keyword, bukan file yang pernah diparse.
+SECTOR_MAP_FILE = None
+
+SECTOR_RESOLVER = SectorResolver()
+
+
+def use_sector_map(path: Optional[str]) -> SectorResolver:
+    """
+    Aktifkan (path) atau matikan (None) peta client -> sector yang dipelajari.
+    Peta hanya diisi kalau aktif, dan hanya ditulis lewat SECTOR_RESOLVER.save().
+    """
+    global SECTOR_RESOLVER
+    SECTOR_RESOLVER = SectorResolver(learned_path=path)
+    return SECTOR_RESOLVER
+
+
 def correct_sector_typos(sector_name: str) -> str:
     """
     Normalize common typos / variations in sector name.
     """
-    if not sector_name:
-        return ""
-    name = sector_name.upper().strip()
-
-    corrections = {
-        "ELECTRICTY": "ELECTRICITY",
-        "ELECTRIC": "ELECTRICITY",
-        "ELECTRICITY": "ELECTRICITY",
-        "GOVERMENT": "GOVERNMENT",
-        "GOVERNMENT": "GOVERNMENT",
-        "MANUFACTUR": "MANUFACTURE",
-        "MANUFACTURE": "MANUFACTURE",
-        "TELECOMMUNICATON": "TELECOMMUNICATION",
-        "TELECOMMUNICATION": "TELECOMMUNICATION",
-        "INFRASTRUCTUR": "INFRASTRUCTURE",
-        "INFRASTRUCTURE": "INFRASTRUCTURE",
-        "INTERNATONAL": "INTERNATIONAL",
-        "INTERNATIONAL": "INTERNATIONAL",
-        "MINING / CEMENT": "MINING / CEMENT",
-        "PLANTATION": "PLANTATION",
-        "BANK AND FINANCIAL SERVICE": "BANK AND FINANCIAL SERVICE",
-        "HOSPITAL": "HOSPITAL",
-        "OTHER PRIVATE SECTOR": "OTHER PRIVATE SECTOR",
-        "OIL & GAS": "OIL & GAS",
-    }
-
-    if name in corrections:
-        return corrections[name]
-
-    # partial match fallback
-    for wrong, fixed in corrections.items():
-        if wrong in name:
-            return fixed
-
-    return name
+    return SECTOR_RESOLVER.correct(sector_name)
 
 
 def detect_sector_from_client(client_name: str) -> str:
     """
-    Fallback detection of sector based on client keywords.
+    Fallback detection of sector based on client keywords
+    (and clients seen before under a known sector).
     """
-    if not client_name:
-        return ""
-
-    name = client_name.upper()
-
-    # Oil & Gas
-    if any(k in name for k in ["PERTAMINA", "PETROCHINA", "MEDCO", "CHEVRON", "SHELL", "MUBADALA", "BP "]):
-        return "OIL & GAS"
-
-    # Power / Electricity
-    if any(k in name for k in ["PLN", "ELECTRIC", "POWER", "TENAGA LISTRIK"]):
-        return "ELECTRICITY"
-
-    # Government
-    if any(k in name for k in ["KEMENTERIAN", "PEMERINTAH", "PEMKAB", "PEMKOT", "PEMPROV", "DINAS", "KABUPATEN", "KOTA"]):
-        return "GOVERNMENT"
-
-    # Banking & Finance
-    if any(k in name for k in ["BANK ", "BPR ", "FINANCE", "ASURANSI"]):
-        return "BANK AND FINANCIAL SERVICE"
-
-    # Hospital
-    if any(k in name for k in ["RS ", "RUMAH SAKIT", "HOSPITAL", "CLINIC", "KLINIK"]):
-        return "HOSPITAL"
-
-    # Plantation / Agro
-    if any(k in name for k in ["PLANTATION", "SAWIT", "PALM", "PERKEBUNAN"]):
-        return "PLANTATION"
-
-    return ""
+    return SECTOR_RESOLVER.from_client(client_name)
 
 
 # =========================
@@ -227,15 +191,20 @@ def looks_like_client_header(line: str) -> bool:
     return False
 
 
-def extract_tender_items_from_lines(lines: List[str]) -> List[Dict]:
-    tenders: List[Dict] = []
+def extract_tender_items_from_lines(lines: List[str]) -> TenderBatch:
+    tenders = TenderBatch()
 
     current_sector = ""
     current_client = ""
     buffer_lines: List[str] = []
+    # pasangan client -> sector dicatat sekali per header client, bukan per tender
+    learn_pending = False
+    # None kalau level trace tidak aktif (tanpa overhead per baris)
+    trace = tender_log.tracer(log)
+    line_no = 0
 
     def flush_buffer():
-        nonlocal buffer_lines
+        nonlocal buffer_lines, learn_pending
         if not buffer_lines:
             return
 
@@ -278,18 +247,19 @@ def extract_tender_items_from_lines(lines: List[str]) -> List[Dict]:
             return
 
         sector_final = correct_sector_typos(current_sector) if current_sector else ""
-        if not sector_final and current_client:
+        if sector_final and current_client:
+            if learn_pending:
+                SECTOR_RESOLVER.learn(current_client, sector_final)
+                learn_pending = False
+        elif not sector_final and current_client:
             sector_final = detect_sector_from_client(current_client)
 
-        tenders.append({
-            "Sector": sector_final,
-            "Client": clean_text(current_client),
-            "Tanggal Rilis": tanggal,
-            "SOW": sow,
-            "Judul Tender": title,
-        })
+        if trace:
+            trace("tender", line_no, full, sector=sector_final, date=tanggal, sow=sow, title=title)
 
-    for raw in lines:
+        tenders.add(sector_final, clean_text(current_client), tanggal, sow, title)
+
+    for line_no, raw in enumerate(lines):
         line = clean_text(raw)
         if not line:
             continue
@@ -299,12 +269,17 @@ def extract_tender_items_from_lines(lines: List[str]) -> List[Dict]:
             flush_buffer()
             current_sector = correct_sector_typos(line)
             current_client = ""
+            if trace:
+                trace("sector", line_no, line, sector=current_sector)
             continue
 
         # client
         if looks_like_client_header(line):
             flush_buffer()
             current_client = line
+            learn_pending = SECTOR_RESOLVER.learned_path is not None
+            if trace:
+                trace("client", line_no, line, client=current_client)
             continue
 
         # bullet / nomor -> item baru
@@ -325,22 +300,136 @@ def extract_tender_items_from_lines(lines: List[str]) -> List[Dict]:
 # HTML Extraction
 # =========================
 
-def extract_text_lines_from_html(html: str) -> List[str]:
-    soup = BeautifulSoup(html, "html.parser")
+# Tag yang memulai/mengakhiri baris teks. Tag lain (b, strong, span, a, font, ...)
+# dianggap inline: teksnya menyambung ke baris yang sedang berjalan, dipisah satu
+# spasi dari teks elemen lain (<b>PT X</b>Jakarta -> "PT X Jakarta").
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "body", "br", "caption", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "html", "li", "main", "nav", "ol", "option", "p", "pre", "section", "table",
+    "tbody", "td", "tfoot", "th", "thead", "title", "tr", "ul",
+})
+# Isi tag ini tidak pernah jadi teks
+SKIP_TAGS = frozenset({"script", "style", "noscript", "template", "head", "svg"})
+
+# Ukuran potongan saat file HTML dibaca bertahap
+HTML_CHUNK_SIZE = 64 * 1024
+
+
+class _HtmlLineCollector:
+    """
+    Target parser SAX-style: setiap potongan teks ditulis sekali sesuai urutan
+    dokumen, baris baru dimulai di batas tag blok. Tidak ada get_text per
+    elemen, jadi teks tag bersarang tidak terbaca berulang. Di batas tag
+    inline disisipkan satu spasi (spasi berlebih dirapikan clean_text).
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self._buf: List[str] = []
+        self._skip = 0
+        self._boundary = False
+
+    def start(self, tag, attrib=None):
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        elif tag in BLOCK_TAGS:
+            self._flush()
+        else:
+            self._boundary = True
+
+    def end(self, tag):
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag in BLOCK_TAGS:
+            self._flush()
+        else:
+            self._boundary = True
+
+    def data(self, text):
+        if not self._skip:
+            if self._boundary and self._buf:
+                self._buf.append(" ")
+            self._boundary = False
+            self._buf.append(text)
+
+    def close(self):
+        self._flush()
+
+    def _flush(self):
+        if self._buf:
+            line = clean_text("".join(self._buf))
+            self._buf = []
+            if line:
+                self.lines.append(line)
+
+
+def _make_html_feeder(collector: _HtmlLineCollector):
+    """
+    Parser HTML streaming yang memanggil collector. lxml kalau ada, selain itu html.parser.
+    Return (feed, close).
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        etree = None
 
-    texts: List[str] = []
+    if etree is not None:
+        parser = etree.HTMLParser(target=collector)
+        return parser.feed, parser.close
 
-    # ambil teks dari elemen-elemen umum
-    for tag in soup.find_all(["h1", "h2", "h3", "h4", "b", "strong", "p", "td", "li", "span"]):
-        t = clean_text(tag.get_text(separator=" "))
-        if t:
-            texts.append(t)
+    from html.parser import HTMLParser
 
-    if not texts:
-        all_text = clean_text(soup.get_text(separator="\n"))
-        texts = [ln for ln in all_text.split("\n") if clean_text(ln)]
+    class _Parser(HTMLParser):
+        def handle_starttag(self, tag, attrs):
+            collector.start(tag)
 
-    return texts
+        def handle_startendtag(self, tag, attrs):
+            collector.start(tag)
+            collector.end(tag)
+
+        def handle_endtag(self, tag):
+            collector.end(tag)
+
+        def handle_data(self, data):
+            collector.data(data)
+
+    parser = _Parser(convert_charrefs=True)
+
+    def close():
+        parser.close()
+        collector.close()
+
+    return parser.feed, close
+
+
+def iter_text_lines_from_html(chunks: Iterable[Union[str, bytes]]) -> Iterator[str]:
+    """
+    Linearisasi HTML (diberikan per potongan) jadi baris teks, satu traversal.
+    Baris dikeluarkan begitu tag bloknya selesai, jadi halaman besar tidak
+    perlu dimuat sebagai pohon DOM.
+    """
+    collector = _HtmlLineCollector()
+    feed, close = _make_html_feeder(collector)
+    decoder = None
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            # potongan bytes bisa memotong karakter multi-byte di tengah
+            decoder = decoder or codecs.getincrementaldecoder("utf-8")(errors="replace")
+            chunk = decoder.decode(chunk)
+        if chunk:
+            feed(chunk)
+        if collector.lines:
+            yield from collector.lines
+            collector.lines = []
+    close()
+    yield from collector.lines
+
+
+def extract_text_lines_from_html(html: Union[str, bytes]) -> List[str]:
+    return list(iter_text_lines_from_html([html]))
 
 
 # =========================
@@ -349,10 +438,13 @@ def extract_text_lines_from_html(html: str) -> List[str]:
 
 class SessionManager:
     def __init__(self):
-        self._driver: Optional[webdriver.Chrome] = None
+        self._driver: Optional["webdriver.Chrome"] = None
         self._lock = threading.Lock()
 
-    def _create_driver(self) -> webdriver.Chrome:
+    def _create_driver(self) -> "webdriver.Chrome":
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
         chrome_options = Options()
         chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--disable-gpu")
@@ -376,7 +468,7 @@ class SessionManager:
 
         return driver
 
-    def get_driver(self) -> webdriver.Chrome:
+    def get_driver(self) -> "webdriver.Chrome":
         with self._lock:
             if self._driver is None:
                 self._driver = self._create_driver()
@@ -401,6 +493,10 @@ def scrape_page_with_selenium(session: SessionManager, url: str, wait_selector:
     driver.get(url)
 
     if wait_selector:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         try:
             WebDriverWait(driver, 20).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
@@ -441,19 +537,22 @@ def choose_file_interactively() -> Optional[str]:
         print("Input tidak valid.")
 
 
-def export_to_excel(tenders: List[Dict], output_name: str = "tender_parsed.xlsx") -> str:
+def export_to_excel(tenders: TenderBatch, output_name: str = "tender_parsed.xlsx") -> str:
     if not tenders:
         print("Tidak ada data untuk diekspor.")
         return ""
 
-    df = pd.DataFrame(tenders)
+    import pandas as pd
 
-    if "Tanggal Rilis" in df.columns:
-        df["Tanggal Rilis Sort"] = pd.to_datetime(df["Tanggal Rilis"], errors="coerce")
-        df = df.sort_values("Tanggal Rilis Sort", ascending=False).drop(columns=["Tanggal Rilis Sort"])
+    with tender_log.span(log, "export", logging.INFO, rows=len(tenders), path=output_name):
+        df = to_dataframe(tenders)
 
-    df.index = range(1, len(df) + 1)
-    df.to_excel(output_name, index_label="No")
+        if "Tanggal Rilis" in df.columns:
+            df["Tanggal Rilis Sort"] = pd.to_datetime(df["Tanggal Rilis"], errors="coerce")
+            df = df.sort_values("Tanggal Rilis Sort", ascending=False).drop(columns=["Tanggal Rilis Sort"])
+
+        df.index = range(1, len(df) + 1)
+        df.to_excel(output_name, index_label="No")
     print(f"OK. File disimpan sebagai: {output_name}")
     return output_name
 
@@ -462,40 +561,50 @@ def export_to_excel(tenders: List[Dict], output_name: str = "tender_parsed.xlsx"
 # Main Flow
 # =========================
 
-def parse_from_local_file() -> List[Dict]:
-    filename = choose_file_interactively()
-    if not filename:
-        return []
+def read_lines_from_file(filename: str) -> List[str]:
+    if filename.lower().endswith((".html", ".htm")):
+        with open(filename, "r", encoding="utf-8") as f:
+            return list(iter_text_lines_from_html(iter(lambda: f.read(HTML_CHUNK_SIZE), "")))
 
     with open(filename, "r", encoding="utf-8") as f:
         content = f.read()
 
-    if filename.lower().endswith((".html", ".htm")):
-        lines = extract_text_lines_from_html(content)
-    else:
-        content = content.replace("\r", "\n")
-        lines = [ln for ln in content.split("\n") if clean_text(ln)]
+    content = content.replace("\r", "\n")
+    return [ln for ln in content.split("\n") if clean_text(ln)]
 
-    print(f"Loaded {len(lines)} lines from {filename}")
+
+def parse_from_local_file() -> TenderBatch:
+    filename = choose_file_interactively()
+    if not filename:
+        return TenderBatch()
+
+    lines = read_lines_from_file(filename)
+    log.info("File dibaca", extra={"path": filename, "lines": len(lines)})
     tenders = extract_tender_items_from_lines(lines)
     return tenders
 
 
-def parse_from_web(session: SessionManager) -> List[Dict]:
+def parse_from_web(session: SessionManager) -> TenderBatch:
     url = input("Masukkan URL halaman tender: ").strip()
     if not url:
-        return []
+        return TenderBatch()
 
-    print(f"Load {url} ...")
-    html = scrape_page_with_selenium(session, url)
+    with tender_log.span(log, "fetch", logging.INFO, url=url):
+        html = scrape_page_with_selenium(session, url)
+    if ARCHIVE_DIR:
+        with HtmlArchive(ARCHIVE_DIR) as archive:
+            archive.append(url, KIND_WEB, html)
 
     lines = extract_text_lines_from_html(html)
-    print(f"HTML parsed menjadi {len(lines)} baris teks.")
-    tenders = extract_tender_items_from_lines(lines)
+    with tender_log.span(log, "parse", logging.INFO, lines=len(lines)) as s:
+        tenders = extract_tender_items_from_lines(lines)
+        s.set(tenders=len(tenders))
     return tenders
 
 
 def main():
+    tender_log.configure()
+    use_sector_map(SECTOR_MAP_FILE)
     print("=== Tender Parser Hybrid ===")
     print("1. Parse dari file lokal (.html/.txt)")
     print("2. Parse dari halaman web (Selenium)")
@@ -528,7 +637,9 @@ def main():
             print(f"   Judul: {row.get('Judul Tender','')[:100]}...")
             print()
 
+        route_if_configured(tenders, source="hybrid")
         export_to_excel(tenders)
+        SECTOR_RESOLVER.save()
 
     finally:
         session.cleanup()
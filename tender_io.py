@@ -0,0 +1,201 @@
+"""
+Helper input/output untuk mode non-interaktif (file / stdin / pipe).
+
+Contoh:
+    python tender_extract.py -i dump.txt -f csv -o hasil.csv
+    cat dump.txt | python tender_simple.py -f jsonl -o - > hasil.jsonl
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Iterable, Iterator, Optional, Sequence
+
+from tender_records import to_dataframe
+
+OUTPUT_FORMATS = ("xlsx", "csv", "json", "jsonl")
+# format yang bisa ditulis sambil parsing (tanpa menampung semua baris)
+STREAM_FORMATS = ("jsonl", "csv")
+TENDER_COLUMN_ORDER = ['Sector', 'Client', 'Tanggal Rilis', 'SOW', 'Judul Tender']
+
+
+def add_io_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-i", "--input",
+                        help="file teks sumber, atau '-' untuk stdin (tanpa ini: mode interaktif)")
+    parser.add_argument("-o", "--output",
+                        help="file output, atau '-' untuk stdout (default: tender_data_<timestamp>.<format>)")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS,
+                        help="format output (default: dari ekstensi output, atau xlsx)")
+    parser.add_argument("--db",
+                        help="tambahkan hasil ke store SQLite ini (statistik kumulatif ikut ter-update)")
+
+
+def is_batch_mode(args: argparse.Namespace) -> bool:
+    """
+    Batch kalau --input diberikan, atau stdin bukan terminal (data di-pipe).
+    """
+    return bool(args.input) or not sys.stdin.isatty()
+
+
+def read_input(path: Optional[str]) -> str:
+    """
+    Baca seluruh input sekaligus (satu kali read, bukan loop input()).
+    """
+    if not path or path == "-":
+        return sys.stdin.read()
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def iter_input_lines(path: Optional[str]) -> Iterator[str]:
+    """
+    Baca input per baris (streaming), untuk file besar yang tidak perlu dimuat sekaligus.
+    Baris hanya dipecah di "\n" (CRLF -> "\n"); "\r" tunggal di tengah baris
+    (mis. sel Excel yang di-paste) tidak memecah baris.
+    """
+    if not path or path == "-":
+        buffer = getattr(sys.stdin, "buffer", None)
+        if buffer is None:
+            yield from _strip_cr(sys.stdin)
+            return
+        stdin = io.TextIOWrapper(buffer, encoding="utf-8", newline="\n")
+        try:
+            yield from _strip_cr(stdin)
+        finally:
+            stdin.detach()  # jangan ikut menutup sys.stdin
+        return
+    with open(path, "r", encoding="utf-8", newline="\n") as f:
+        yield from _strip_cr(f)
+
+
+def _strip_cr(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        if line.endswith("\r\n"):
+            yield line[:-2] + "\n"
+        elif line.endswith("\r"):
+            yield line[:-1]
+        else:
+            yield line
+
+
+def resolve_output(output: Optional[str], fmt: Optional[str]):
+    """
+    Tentukan (path, format) final.
+    """
+    if not fmt:
+        ext = os.path.splitext(output)[1].lower().lstrip(".") if output and output != "-" else ""
+        fmt = ext if ext in OUTPUT_FORMATS else ("csv" if output == "-" else "xlsx")
+    if not output:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = f"tender_data_{timestamp}.{fmt}"
+    if output == "-" and fmt == "xlsx":
+        raise ValueError("format xlsx tidak bisa ditulis ke stdout, pakai csv/json/jsonl")
+    return output, fmt
+
+
+def write_output(tenders, output: str, fmt: str, columns: Sequence[str] = TENDER_COLUMN_ORDER) -> str:
+    """
+    Tulis tender ke output sesuai format. Return path (atau '-' untuk stdout).
+    `columns` = urutan kolom untuk format tabel (kolom yang tidak ada dilewati).
+    """
+    if fmt == "jsonl":
+        stream = sys.stdout if output == "-" else open(output, "w", encoding="utf-8")
+        try:
+            for row in tenders:
+                stream.write(json.dumps(row, ensure_ascii=False))
+                stream.write("\n")
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+        return output
+
+    df = to_dataframe(tenders)
+    cols = [c for c in columns if c in df.columns]
+    if cols:
+        df = df[cols]
+
+    target = sys.stdout if output == "-" else output
+    if fmt == "xlsx":
+        df.to_excel(output, index=False, engine='openpyxl')
+    elif fmt == "csv":
+        df.to_csv(target, index=False)
+    elif fmt == "json":
+        df.to_json(target, orient="records", force_ascii=False, indent=1)
+        if output == "-":
+            sys.stdout.write("\n")
+    else:
+        raise ValueError(f"Format tidak dikenal: {fmt}")
+    return output
+
+
+def write_rows(rows: Iterable[tuple], columns: Sequence[str], output: str, fmt: str) -> int:
+    """
+    Tulis tuple baris (urut sesuai columns) langsung ke jsonl/csv tanpa
+    ditampung dulu. Hasilnya sama dengan write_output. Return jumlah baris.
+    """
+    if fmt not in STREAM_FORMATS:
+        raise ValueError(f"Format {fmt} tidak bisa ditulis streaming")
+    stream = sys.stdout if output == "-" else open(output, "w", encoding="utf-8", newline="")
+    count = 0
+    try:
+        if fmt == "jsonl":
+            for row in rows:
+                stream.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+                stream.write("\n")
+                count += 1
+        else:
+            writer = csv.writer(stream, lineterminator="\n")
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    return count
+
+
+def tap_to_store(rows: Iterable[tuple], columns: Sequence[str], db_path: str, source: str = "",
+                 chunk: int = 50000) -> Iterator[tuple]:
+    """
+    Teruskan baris apa adanya sambil menambahkannya ke store per `chunk` baris.
+    """
+    from tender_records import TenderBatch
+    from tender_store import TenderStore
+
+    added = 0
+    with TenderStore(db_path) as store:
+        batch = TenderBatch(columns)
+        for row in rows:
+            batch.add(*row)
+            yield row
+            if len(batch) >= chunk:
+                added += store.append(batch, source=source)
+                batch = TenderBatch(columns)
+        if batch:
+            added += store.append(batch, source=source)
+        total = store.count()
+    info(f"🗄️  Store {db_path}: +{added} tender baru (total {total})")
+
+
+def append_to_store(tenders, db_path: str, source: str = "") -> int:
+    """
+    Tambahkan tender ke store; return jumlah baris baru.
+    """
+    from tender_store import TenderStore
+
+    with TenderStore(db_path) as store:
+        added = store.append(tenders, source=source)
+        total = store.count()
+    info(f"🗄️  Store {db_path}: +{added} tender baru (total {total})")
+    return added
+
+
+def info(msg: str) -> None:
+    """
+    Pesan status di mode batch: ke stderr supaya stdout tetap bersih untuk data.
+    """
+    print(msg, file=sys.stderr)
@@ -0,0 +1,191 @@
+"""
+Load test sederhana untuk tender_api.py.
+
+Menjalankan banyak client paralel (keep-alive) dengan campuran query
+dashboard, lalu melaporkan throughput dan latensi p50/p95/p99.
+
+Contoh:
+    # jalankan API lokal sendiri dari store, lalu tes
+    python tender_loadtest.py --db tender_store.db --clients 200 --duration 20
+
+    # tes ke instance yang sudah jalan
+    python tender_loadtest.py --url http://127.0.0.1:8080 --clients 200
+"""
+import argparse
+import http.client
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from typing import List, Optional
+from urllib.parse import urlencode, urlsplit
+
+DEFAULT_QUERIES = [
+    "/tenders",
+    "/tenders?page=2",
+    "/tenders?per_page=100",
+    "/stats?by=sector",
+    "/stats?by=client&top=20",
+    "/stats?by=month",
+]
+
+
+def build_queries(base_url: str) -> List[str]:
+    """
+    Campuran query: default + filter sector/client/keyword dari data yang ada.
+    """
+    import json
+    from urllib.request import urlopen
+
+    queries = list(DEFAULT_QUERIES)
+    try:
+        with urlopen(base_url + "/stats?by=sector&top=10", timeout=5) as r:
+            sectors = [item["key"] for item in json.load(r)["items"]]
+        with urlopen(base_url + "/stats?by=client&top=10", timeout=5) as r:
+            clients = [item["key"] for item in json.load(r)["items"]]
+        with urlopen(base_url + "/stats?by=month", timeout=5) as r:
+            months = [item["key"] for item in json.load(r)["items"]]
+    except OSError:
+        return queries
+
+    for s in sectors:
+        queries.append("/tenders?" + urlencode({"sector": s}))
+    for c in clients:
+        queries.append("/tenders?" + urlencode({"client": c}))
+    for m in months:
+        queries.append("/tenders?" + urlencode({"start": f"{m}-01", "end": f"{m}-31"}))
+    for kw in ("pipeline", "pengadaan", "konstruksi", "supply", "jasa"):
+        queries.append("/tenders?" + urlencode({"q": kw}))
+    return queries
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def client_loop(host: str, port: int, queries: List[str], deadline: float, use_etag: bool,
+                latencies: List[float], errors: List[int], lock: threading.Lock) -> None:
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    etags = {}
+    local_lat = []
+    local_err = 0
+    rnd = random.Random()
+
+    while time.perf_counter() < deadline:
+        q = rnd.choice(queries)
+        headers = {}
+        if use_etag and q in etags:
+            headers["If-None-Match"] = etags[q]
+        started = time.perf_counter()
+        try:
+            conn.request("GET", q, headers=headers)
+            resp = conn.getresponse()
+            resp.read()
+            if resp.status not in (200, 304):
+                local_err += 1
+            elif resp.getheader("ETag"):
+                etags[q] = resp.getheader("ETag")
+        except (OSError, http.client.HTTPException):
+            local_err += 1
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        local_lat.append(time.perf_counter() - started)
+
+    conn.close()
+    with lock:
+        latencies.extend(local_lat)
+        errors.append(local_err)
+
+
+def run_load(base_url: str, clients: int, duration: float, use_etag: bool) -> dict:
+    parts = urlsplit(base_url)
+    queries = build_queries(base_url)
+
+    latencies: List[float] = []
+    errors: List[int] = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    threads = [
+        threading.Thread(target=client_loop,
+                         args=(parts.hostname, parts.port or 80, queries, deadline, use_etag,
+                               latencies, errors, lock),
+                         daemon=True)
+        for _ in range(clients)
+    ]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors),
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": (latencies[-1] * 1000) if latencies else 0.0,
+    }
+
+
+def spawn_server(db_path: str, port: int) -> subprocess.Popen:
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tender_api.py")
+    proc = subprocess.Popen([sys.executable, script, "--db", db_path, "--port", str(port)],
+                            stdout=subprocess.DEVNULL)
+    for _ in range(50):
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/health")
+            conn.getresponse().read()
+            conn.close()
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("API server tidak bisa dijalankan")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test untuk tender_api.py")
+    parser.add_argument("--url", default=None, help="base URL instance yang sudah jalan")
+    parser.add_argument("--db", default=None, help="jalankan API lokal sendiri dari store ini")
+    parser.add_argument("--port", type=int, default=8765, help="port untuk API yang dijalankan --db")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10.0, help="detik")
+    parser.add_argument("--no-etag", action="store_true", help="jangan kirim If-None-Match")
+    args = parser.parse_args()
+
+    proc: Optional[subprocess.Popen] = None
+    base_url = args.url
+    if args.db:
+        proc = spawn_server(args.db, args.port)
+        base_url = f"http://127.0.0.1:{args.port}"
+    elif not base_url:
+        base_url = "http://127.0.0.1:8080"
+
+    try:
+        print(f"[LOAD] {args.clients} client, {args.duration:.0f}s -> {base_url}")
+        result = run_load(base_url, args.clients, args.duration, use_etag=not args.no_etag)
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+    print(f"[LOAD] requests: {result['requests']}  errors: {result['errors']}  rps: {result['rps']:.0f}")
+    print(f"[LOAD] latency ms  p50: {result['p50_ms']:.1f}  p95: {result['p95_ms']:.1f}  "
+          f"p99: {result['p99_ms']:.1f}  max: {result['max_ms']:.1f}")
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
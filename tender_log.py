@@ -0,0 +1,201 @@
+"""
+Logging & tracing untuk semua script tender (pengganti print progress).
+
+- Level standar + TRACE (di bawah DEBUG) untuk trace per baris di parser.
+- Output teks ("[INFO] pesan key=value") atau JSON satu baris per event.
+- span(): ukur durasi fetch/parse/export, dicatat saat blok selesai.
+- tracer(): trace per baris dengan sampling (mis. 1 dari 100 baris).
+
+Kalau level-nya tidak aktif, span() mengembalikan objek kosong dan tracer()
+mengembalikan None, jadi loop parser hanya membayar satu cek `if trace:`.
+
+Konfigurasi dari argumen CLI (add_log_arguments) atau environment:
+    TENDER_LOG_LEVEL=debug  TENDER_LOG_FORMAT=json  TENDER_TRACE_SAMPLE=0.01
+"""
+import argparse
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+ROOT_LOGGER = "tender"
+LOG_LEVELS = ("trace", "debug", "info", "warning", "error")
+
+# atribut bawaan LogRecord; sisanya dianggap field dari extra={...}
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_config = {"sample": 1.0}
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def _fields(record: logging.LogRecord) -> dict:
+    return {k: v for k, v in vars(record).items() if k not in _RESERVED}
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        parts = [f"[{record.levelname}] {record.getMessage()}"]
+        for key, value in _fields(record).items():
+            text = str(value)
+            if not text or " " in text:
+                text = json.dumps(text, ensure_ascii=False)
+            parts.append(f"{key}={text}")
+        if record.exc_info:
+            parts.append("\n" + self.formatException(record.exc_info))
+        return " ".join(parts)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        event.update(_fields(record))
+        if record.exc_info:
+            event["exc"] = self.formatException(record.exc_info)
+        return json.dumps(event, ensure_ascii=False, default=str)
+
+
+def _parse_level(level) -> int:
+    if isinstance(level, int):
+        return level
+    name = str(level).strip().upper()
+    if name.isdigit():
+        return int(name)
+    value = logging.getLevelName(name)
+    if not isinstance(value, int):
+        raise ValueError(f"Level log tidak dikenal: {level}")
+    return value
+
+
+def configure(level=None, json_output: Optional[bool] = None, sample: Optional[float] = None,
+              stream=None) -> None:
+    """
+    Pasang handler di logger 'tender'. Nilai None diambil dari environment.
+    Log selalu ke stderr (default) supaya stdout tetap bersih untuk data.
+    """
+    if level is None:
+        level = os.environ.get("TENDER_LOG_LEVEL", "info")
+    if json_output is None:
+        json_output = os.environ.get("TENDER_LOG_FORMAT", "text").lower() == "json"
+    if sample is None:
+        sample = float(os.environ.get("TENDER_TRACE_SAMPLE", "1"))
+    _config["sample"] = min(max(sample, 0.0), 1.0)
+
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if json_output else TextFormatter())
+    root.addHandler(handler)
+    root.setLevel(_parse_level(level))
+    root.propagate = False
+
+
+def add_log_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default=None,
+                        help="level log (default: $TENDER_LOG_LEVEL atau info)")
+    parser.add_argument("--log-json", action="store_true", default=None,
+                        help="log dalam format JSON (satu baris per event)")
+    parser.add_argument("--trace-sample", type=float, default=None,
+                        help="fraksi baris yang di-trace di level trace (mis. 0.01)")
+
+
+def configure_from_args(args: argparse.Namespace) -> None:
+    configure(level=getattr(args, "log_level", None),
+              json_output=getattr(args, "log_json", None),
+              sample=getattr(args, "trace_sample", None))
+
+
+class _Span:
+    __slots__ = ("log", "level", "name", "fields", "started")
+
+    def __init__(self, log: logging.Logger, level: int, name: str, fields: dict):
+        self.log = log
+        self.level = level
+        self.name = name
+        self.fields = fields
+        self.started = 0.0
+
+    def set(self, **fields) -> None:
+        self.fields.update(fields)
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        fields = dict(self.fields, span=self.name,
+                      duration_ms=round((time.perf_counter() - self.started) * 1000, 2))
+        if exc_type is not None:
+            fields["error"] = exc_type.__name__
+        self.log.log(self.level, "%s selesai", self.name, extra=fields)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def set(self, **fields) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(log: logging.Logger, name: str, level: int = logging.DEBUG, **fields):
+    """
+    with span(log, "fetch", url=url) as s:
+        ...
+        s.set(bytes=len(html))
+    """
+    if not log.isEnabledFor(level):
+        return _NULL_SPAN
+    return _Span(log, level, name, fields)
+
+
+def tracer(log: logging.Logger, sample: Optional[float] = None) -> Optional[Callable]:
+    """
+    Trace per baris untuk loop parser. Return None kalau TRACE tidak aktif,
+    jadi pemakaiannya:
+
+        trace = tracer(log)
+        for i, line in enumerate(lines):
+            if trace:
+                trace("sector", i, line, sector=...)
+    """
+    if not log.isEnabledFor(TRACE):
+        return None
+    rate = _config["sample"] if sample is None else sample
+    if rate <= 0:
+        return None
+    every = max(1, round(1 / rate))
+    counter = itertools.count()
+
+    def trace(event: str, line_no: int, line: str, **fields) -> None:
+        if next(counter) % every:
+            return
+        fields["line_no"] = line_no
+        fields["line"] = line
+        log.log(TRACE, event, extra=fields)
+
+    return trace
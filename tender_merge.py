@@ -0,0 +1,268 @@
+"""
+Gabungkan tender hasil paste (Sector, Client, SOW, tanpa URL) dengan hasil
+scraping detail (project_owner, estimation_value, closing_date, tanpa Sector)
+menjadi satu baris lengkap, pengganti VLOOKUP manual di Excel.
+
+Pasangan dicari lewat blocking key = (tanggal rilis, awal judul yang sudah
+dinormalisasi), lalu hash-join: sisi scraping diindeks sekali di dict, setiap
+baris paste cukup lookup ke block-nya. Yang dibandingkan hanya kandidat di
+block yang sama (skor = kemiripan kata judul), jadi waktunya linear walau
+ratusan ribu baris, tidak n x m.
+
+- Block utama: PREFIX_WORDS kata pertama judul. Kalau kosong, dicoba block
+  cadangan dengan SHORT_PREFIX_WORDS kata (judul yang ujungnya beda ditulis).
+- Satu baris scraping hanya dipasangkan ke satu baris paste (skor tertinggi dulu).
+- Baris yang tidak punya pasangan tetap ikut (match = "paste" / "scrape"),
+  kecuali dengan --inner.
+
+Contoh:
+    python tender_merge.py dump.txt tender_indonesia_filtered.xlsx -o gabungan.xlsx
+    python tender_merge.py hasil_paste.jsonl hasil_scrape.csv -o - -f csv --inner
+"""
+import argparse
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import tender_io
+import tender_log
+from tender_normalize import closing_iso
+from tender_records import SCRAPE_COLUMNS, TENDER_COLUMNS, TenderBatch
+
+# jumlah kata awal judul untuk blocking key
+PREFIX_WORDS = 4
+SHORT_PREFIX_WORDS = 2
+
+# skor minimum (kemiripan kata judul, 0..1) supaya dianggap tender yang sama
+MIN_SCORE = 0.5
+
+# block yang terlalu besar (judul generik di tanggal yang sama) dilewati,
+# supaya satu block tidak berubah jadi perbandingan n x m
+MAX_BLOCK_SIZE = 500
+
+DETAIL_COLUMNS = tuple(c for c in SCRAPE_COLUMNS if c not in ("announce_date", "title"))
+MERGED_COLUMNS = TENDER_COLUMNS + DETAIL_COLUMNS + ("match", "match_score")
+MERGED_CATEGORIES = ("Sector", "Client", "Tanggal Rilis", "category", "project_owner",
+                     "qualification", "location", "match")
+
+_NON_WORD_RE = re.compile(r"[^0-9A-Z]+")
+# "(EPC) Pembangunan ..." / "EPC - Pembangunan ..." : kode SOW di depan judul tidak ikut key
+_LEADING_SOW_RE = re.compile(r"^\s*\([^)]*\)\s*")
+
+log = tender_log.get_logger("merge")
+
+
+@lru_cache(maxsize=65536)
+def release_day(value) -> str:
+    """
+    Tanggal rilis / announce_date dalam bentuk apa pun -> 'YYYY-MM-DD' ("" kalau tidak terbaca).
+    """
+    s = str(value).strip() if value is not None else ""
+    if len(s) >= 10 and s[4] == "-" and s[7] == "-":
+        return s[:10]  # ISO, termasuk Timestamp dari Excel ("2025-11-03 00:00:00")
+    return closing_iso(s)
+
+
+def title_tokens(title: str) -> Tuple[str, ...]:
+    """
+    Judul -> kata uppercase tanpa tanda baca, tanpa kode SOW dalam kurung di depan.
+    """
+    title = _LEADING_SOW_RE.sub("", title or "", count=1)
+    return tuple(_NON_WORD_RE.sub(" ", title.upper()).split())
+
+
+def title_score(a: Tuple[str, ...], b: Tuple[str, ...]) -> float:
+    """
+    Kemiripan dua judul: Dice coefficient atas himpunan kata.
+    """
+    if not a or not b:
+        return 0.0
+    sa, sb = set(a), set(b)
+    return 2.0 * len(sa & sb) / (len(sa) + len(sb))
+
+
+def _columns(records, names: Sequence[str]) -> Dict[str, List]:
+    """
+    Ambil beberapa kolom sebagai list; TenderBatch dibaca per kolom (tanpa dict per baris).
+    """
+    if isinstance(records, TenderBatch):
+        return {n: records.column(n) if n in records.columns else [""] * len(records) for n in names}
+    records = list(records)
+    return {n: [r.get(n, "") for r in records] for n in names}
+
+
+def _first(cols: Dict[str, List], *names: str) -> List:
+    for name in names:
+        values = cols.get(name)
+        if values and any(values):
+            return values
+    return cols[names[0]]
+
+
+class _BlockIndex:
+    """
+    (tanggal, awal judul) -> index baris scraping, untuk dua panjang prefix.
+    """
+
+    def __init__(self, days: List[str], tokens: List[Tuple[str, ...]]):
+        self.long: Dict[Tuple[str, Tuple[str, ...]], List[int]] = {}
+        self.short: Dict[Tuple[str, Tuple[str, ...]], List[int]] = {}
+        for i, (day, toks) in enumerate(zip(days, tokens)):
+            if not day or not toks:
+                continue
+            self.long.setdefault((day, toks[:PREFIX_WORDS]), []).append(i)
+            self.short.setdefault((day, toks[:SHORT_PREFIX_WORDS]), []).append(i)
+
+    def candidates(self, day: str, toks: Tuple[str, ...]) -> List[int]:
+        found = self.long.get((day, toks[:PREFIX_WORDS]))
+        if not found:
+            found = self.short.get((day, toks[:SHORT_PREFIX_WORDS]), ())
+        if len(found) > MAX_BLOCK_SIZE:
+            log.debug("Block terlalu besar, dilewati", extra={"day": day, "prefix": " ".join(toks[:PREFIX_WORDS]),
+                                                               "size": len(found)})
+            return []
+        return found
+
+
+def merge_records(pasted, scraped, min_score: float = MIN_SCORE,
+                  keep_unmatched: bool = True) -> Tuple[TenderBatch, Dict[str, int]]:
+    """
+    Gabungkan tender paste (TENDER_COLUMNS) dengan hasil scraping (SCRAPE_COLUMNS).
+    Return (TenderBatch MERGED_COLUMNS, ringkasan jumlah).
+
+    Baris gabungan memakai Sector/Client/SOW/judul dari paste dan field detail
+    dari scraping; Client "Unknown"/kosong diisi project_owner.
+    """
+    p = _columns(pasted, TENDER_COLUMNS)
+    s = _columns(scraped, SCRAPE_COLUMNS + ("Tanggal Rilis", "Judul Tender"))
+    s_days = [release_day(v) for v in _first(s, "announce_date", "Tanggal Rilis")]
+    s_titles = _first(s, "title", "Judul Tender")
+    s_tokens = [title_tokens(str(t)) for t in s_titles]
+
+    with tender_log.span(log, "merge", paste=len(p["Sector"]), scrape=len(s_days)) as sp:
+        index = _BlockIndex(s_days, s_tokens)
+
+        # semua pasangan kandidat dalam block yang lolos skor minimum
+        proposals = []
+        compared = 0
+        for i, (day_value, title) in enumerate(zip(p["Tanggal Rilis"], p["Judul Tender"])):
+            day, toks = release_day(day_value), title_tokens(str(title))
+            if not day or not toks:
+                continue
+            for j in index.candidates(day, toks):
+                compared += 1
+                score = title_score(toks, s_tokens[j])
+                if score >= min_score:
+                    proposals.append((-score, i, j))
+
+        # pasangan 1-1, skor tertinggi dulu (urutan deterministik untuk skor sama)
+        proposals.sort()
+        paste_match: Dict[int, Tuple[int, float]] = {}
+        used = set()
+        for neg_score, i, j in proposals:
+            if i in paste_match or j in used:
+                continue
+            paste_match[i] = (j, -neg_score)
+            used.add(j)
+        sp.set(compared=compared, matched=len(paste_match))
+
+    merged = TenderBatch(MERGED_COLUMNS, categorical=MERGED_CATEGORIES)
+    empty_detail = ("",) * len(DETAIL_COLUMNS)
+    detail_cols = [s[c] for c in DETAIL_COLUMNS]
+    owner_pos = DETAIL_COLUMNS.index("project_owner")
+
+    for i, row in enumerate(zip(*(p[c] for c in TENDER_COLUMNS))):
+        hit = paste_match.get(i)
+        if hit is None:
+            if keep_unmatched:
+                merged.add(*row, *empty_detail, "paste", None)
+            continue
+        j, score = hit
+        detail = tuple(col[j] for col in detail_cols)
+        sector, client, day, sow, title = row
+        if (not client or client == "Unknown") and detail[owner_pos]:
+            client = detail[owner_pos]
+        merged.add(sector, client, day, sow, title, *detail, "both", round(score, 3))
+
+    if keep_unmatched:
+        for j in range(len(s_days)):
+            if j in used:
+                continue
+            detail = tuple(col[j] for col in detail_cols)
+            merged.add("", detail[owner_pos], s_days[j], "", s_titles[j], *detail, "scrape", None)
+
+    summary = {
+        "paste": len(p["Sector"]),
+        "scrape": len(s_days),
+        "matched": len(paste_match),
+        "compared": compared,
+        "rows": len(merged),
+    }
+    log.info("Merge selesai", extra=summary)
+    return merged, summary
+
+
+def read_records(path: str):
+    """
+    File tender -> list of dict / TenderBatch.
+    .txt = teks paste (diparse tender_extract), .jsonl/.json, .csv, .xlsx = output script lain.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".txt" or path == "-":
+        from tender_extract import parse_tender_lines
+        return parse_tender_lines(tender_io.iter_input_lines(path))
+    if ext == ".jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    if ext == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    import pandas as pd
+    if ext == ".csv":
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    elif ext in (".xlsx", ".xls"):
+        df = pd.read_excel(path, dtype=str, keep_default_na=False)
+    else:
+        raise ValueError(f"Format file tidak dikenal: {path}")
+    return df.to_dict("records")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Gabungkan tender paste dengan hasil scraping detail.")
+    parser.add_argument("paste", help="teks paste (.txt) atau output tender_extract/tender_simple")
+    parser.add_argument("scrape", help="output tender_scrapping (.xlsx/.csv/.jsonl)")
+    parser.add_argument("-o", "--output",
+                        help="file output, atau '-' untuk stdout (default: tender_merged_<timestamp>.<format>)")
+    parser.add_argument("-f", "--format", choices=tender_io.OUTPUT_FORMATS)
+    parser.add_argument("--min-score", type=float, default=MIN_SCORE,
+                        help=f"kemiripan judul minimum 0..1 (default: {MIN_SCORE})")
+    parser.add_argument("--inner", action="store_true", help="hanya tulis baris yang punya pasangan")
+    parser.add_argument("--db", help="tambahkan hasil gabungan ke store SQLite ini")
+    tender_log.add_log_arguments(parser)
+    args = parser.parse_args(argv)
+    tender_log.configure_from_args(args)
+
+    merged, summary = merge_records(read_records(args.paste), read_records(args.scrape),
+                                    min_score=args.min_score, keep_unmatched=not args.inner)
+    tender_io.info(f"🔗 {summary['matched']} pasangan dari {summary['paste']} paste x {summary['scrape']} scrape "
+                   f"({summary['compared']} perbandingan)")
+    if not merged:
+        tender_io.info("❌ Tidak ada baris untuk ditulis")
+        return 1
+
+    output = args.output
+    if not output:
+        output = tender_io.resolve_output(None, args.format)[0].replace("tender_data_", "tender_merged_", 1)
+    output, fmt = tender_io.resolve_output(output, args.format)
+    tender_io.write_output(merged, output, fmt, columns=MERGED_COLUMNS)
+    tender_io.info(f"✅ {len(merged)} baris -> {output} ({fmt})")
+    if args.db:
+        tender_io.append_to_store(merged, args.db, source="merge")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
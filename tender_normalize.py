@@ -0,0 +1,211 @@
+"""
+Normalisasi field detail hasil scraping: nilai estimasi & tanggal penutupan.
+
+- estimation_value  "Rp 1.250.000.000", "IDR 15,5 Miliar", "Rp 750 Juta",
+                    "USD 2.5 Million", "10 M"            -> nilai IDR (float)
+- closing_date      "12 Nov 2025", "Senin, 17 Nopember 2025 Pukul 14.00 WIB",
+                    "17/11/2025", "2025-11-17"          -> date
+
+Nilai yang sama sangat sering berulang (format halaman seragam), jadi parsing
+dilakukan per nilai unik lalu hasilnya disebar ke semua baris:
+- parse_value / parse_closing_date : satu nilai (di-cache)
+- normalize_frame                  : kolom DataFrame sekaligus (pd.factorize + take)
+"""
+import math
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+# kurs untuk konversi nilai USD ke IDR
+USD_TO_IDR = 16000.0
+
+CURRENCY_RATES = {
+    "IDR": 1.0,
+    "USD": USD_TO_IDR,
+}
+
+# pengali satuan; "M" di teks Indonesia = Miliar, di teks USD = Million
+_MULTIPLIERS = {
+    "TRILIUN": 1e12, "TRILYUN": 1e12, "T": 1e12,
+    "MILIAR": 1e9, "MILYAR": 1e9, "BILLION": 1e9, "BN": 1e9, "B": 1e9, "M": 1e9,
+    "JUTA": 1e6, "JT": 1e6, "MILLION": 1e6, "MIO": 1e6,
+    "RIBU": 1e3, "RB": 1e3, "K": 1e3, "THOUSAND": 1e3,
+}
+_USD_MULTIPLIERS = dict(_MULTIPLIERS, M=1e6)
+
+_CURRENCY_RE = re.compile(r"\b(USD|US\$|IDR|RP)|(\$)", re.IGNORECASE)
+_AMOUNT_RE = re.compile(
+    r"(\d[\d.,]*)\s*(" + "|".join(sorted(_MULTIPLIERS, key=len, reverse=True)) + r")?\b\.?",
+    re.IGNORECASE,
+)
+
+MONTHS = {
+    "JAN": 1, "JANUARI": 1, "JANUARY": 1,
+    "FEB": 2, "PEB": 2, "FEBRUARI": 2, "PEBRUARI": 2, "FEBRUARY": 2,
+    "MAR": 3, "MARET": 3, "MARCH": 3,
+    "APR": 4, "APRIL": 4,
+    "MEI": 5, "MAY": 5,
+    "JUN": 6, "JUNI": 6, "JUNE": 6,
+    "JUL": 7, "JULI": 7, "JULY": 7,
+    "AGU": 8, "AGS": 8, "AGT": 8, "AGUST": 8, "AGUSTUS": 8, "AUG": 8, "AUGUST": 8,
+    "SEP": 9, "SEPT": 9, "SEPTEMBER": 9,
+    "OKT": 10, "OCT": 10, "OKTOBER": 10, "OCTOBER": 10,
+    "NOV": 11, "NOP": 11, "NOVEMBER": 11, "NOPEMBER": 11,
+    "DES": 12, "DEC": 12, "DESEMBER": 12, "DECEMBER": 12,
+}
+
+_ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b")
+_NUMERIC_DATE_RE = re.compile(r"\b(\d{1,2})[/.\-](\d{1,2})[/.\-](\d{4}|\d{2})\b")
+_TEXT_DATE_RE = re.compile(r"\b(\d{1,2})\s*[-\s]\s*([A-Za-z]{3,9})\.?\s*[-\s,]\s*(\d{4})\b")
+
+
+def _parse_number(raw: str, has_multiplier: bool) -> Optional[float]:
+    """
+    Angka dengan pemisah ribuan/desimal gaya Indonesia ("1.250.000,50")
+    maupun Inggris ("1,250,000.50").
+    """
+    s = raw.rstrip(".,")
+    if not s:
+        return None
+    dots, commas = s.count("."), s.count(",")
+    if dots and commas:
+        # pemisah yang muncul terakhir = desimal
+        if s.rfind(",") > s.rfind("."):
+            s = s.replace(".", "").replace(",", ".")
+        else:
+            s = s.replace(",", "")
+    elif dots or commas:
+        sep = "." if dots else ","
+        head, _, tail = s.rpartition(sep)
+        if s.count(sep) > 1 or (len(tail) == 3 and not has_multiplier):
+            s = s.replace(sep, "")  # pemisah ribuan
+        elif len(tail) == 3 and sep == ".":
+            s = s.replace(sep, "")  # "1.250 Juta" = 1250 juta
+        else:
+            s = head.replace(sep, "") + "." + tail
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=65536)
+def parse_value(text: str) -> Tuple[Optional[float], str]:
+    """
+    Teks nilai estimasi -> (nilai dalam IDR, mata uang asal).
+    Nilai None kalau tidak ada angka ("-", "Confidential", ...).
+    Untuk rentang ("Rp 1 M - 2 M") yang diambil angka pertama.
+    """
+    if not text:
+        return None, ""
+    m = _CURRENCY_RE.search(text)
+    currency = "IDR"
+    if m:
+        currency = "USD" if (m.group(2) or m.group(1).upper() in ("USD", "US$")) else "IDR"
+
+    multipliers = _USD_MULTIPLIERS if currency == "USD" else _MULTIPLIERS
+    # angka setelah simbol mata uang (kalau ada), supaya "No. 3 ... Rp 5 M" tidak salah ambil
+    start = m.end() if m else 0
+    for match in _AMOUNT_RE.finditer(text, start):
+        suffix = (match.group(2) or "").upper()
+        number = _parse_number(match.group(1), bool(suffix))
+        if number is None:
+            continue
+        return number * multipliers.get(suffix, 1.0) * CURRENCY_RATES[currency], currency
+    return None, ""
+
+
+def parse_value_idr(text: str) -> Optional[float]:
+    return parse_value(text)[0]
+
+
+def _make_date(y: int, mo: int, d: int) -> Optional[date]:
+    if y < 100:
+        y += 2000
+    try:
+        return date(y, mo, d)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=65536)
+def parse_closing_date(text: str) -> Optional[date]:
+    """
+    Tanggal penutupan dalam format Indonesia/Inggris/angka -> date.
+    Tanpa tahun -> None (tidak ditebak).
+    """
+    if not text:
+        return None
+    m = _ISO_DATE_RE.search(text)
+    if m:
+        return _make_date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    m = _TEXT_DATE_RE.search(text)
+    if m:
+        month = MONTHS.get(m.group(2).upper())
+        if month:
+            return _make_date(int(m.group(3)), month, int(m.group(1)))
+    m = _NUMERIC_DATE_RE.search(text)
+    if m:
+        return _make_date(int(m.group(3)), int(m.group(2)), int(m.group(1)))
+    return None
+
+
+def closing_iso(text: str) -> str:
+    d = parse_closing_date(text)
+    return d.isoformat() if d else ""
+
+
+def normalize_values(values: Iterable[str]) -> Tuple[List[Optional[float]], List[str]]:
+    """
+    Kolom nilai estimasi -> (nilai IDR, mata uang), diparsing per nilai unik.
+    """
+    parsed = {}
+    idr, currency = [], []
+    for v in values:
+        res = parsed.get(v)
+        if res is None:
+            res = parsed[v] = parse_value(v or "")
+        idr.append(res[0])
+        currency.append(res[1])
+    return idr, currency
+
+
+def normalize_dates(values: Iterable[str]) -> List[str]:
+    """
+    Kolom tanggal penutupan -> tanggal ISO ("" kalau tidak terbaca).
+    """
+    parsed = {}
+    out = []
+    for v in values:
+        res = parsed.get(v)
+        if res is None:
+            res = parsed[v] = closing_iso(v or "")
+        out.append(res)
+    return out
+
+
+def normalize_frame(df, value_col: str = "estimation_value", date_col: str = "closing_date"):
+    """
+    Tambah kolom estimation_idr (float, NaN kalau kosong), estimation_currency
+    dan closing_on (datetime64) ke DataFrame. Setiap kolom di-factorize dulu,
+    jadi parsing hanya sekali per nilai unik dan penyebaran ke baris dilakukan
+    numpy (take), bukan loop Python per baris.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if value_col in df.columns:
+        codes, uniques = pd.factorize(df[value_col].fillna("").astype(str), sort=False)
+        parsed = [parse_value(u) for u in uniques]
+        amounts = np.array([math.nan if p[0] is None else p[0] for p in parsed], dtype=float)
+        currencies = np.array([p[1] for p in parsed], dtype=object)
+        df["estimation_idr"] = amounts.take(codes)
+        df["estimation_currency"] = currencies.take(codes)
+
+    if date_col in df.columns:
+        codes, uniques = pd.factorize(df[date_col].fillna("").astype(str), sort=False)
+        dates = pd.to_datetime(pd.Series([closing_iso(u) or None for u in uniques], dtype=object))
+        df["closing_on"] = dates.to_numpy().take(codes)
+
+    return df
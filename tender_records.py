@@ -0,0 +1,199 @@
+"""
+Representasi data tender yang ringkas (column-oriented).
+
+Daripada menyimpan satu dict per tender (key string berulang di setiap baris),
+TenderBatch menyimpan data per kolom. Kolom yang nilainya banyak berulang
+(Sector, Client, tanggal) di-dictionary-encode: nilai unik disimpan sekali,
+tiap baris hanya menyimpan kode int32 di array('i').
+
+Batch tetap bisa dipakai seperti list of dict (len, index, slice, iterasi),
+jadi kode lama yang membaca tenders[i]['Sector'] tetap jalan.
+"""
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+TENDER_COLUMNS = ("Sector", "Client", "Tanggal Rilis", "SOW", "Judul Tender")
+TENDER_CATEGORIES = ("Sector", "Client", "Tanggal Rilis")
+
+SCRAPE_COLUMNS = (
+    "announce_date",
+    "title",
+    "detail_url",
+    "project_description",
+    "category",
+    "project_owner",
+    "qualification",
+    "estimation_value",
+    "location",
+    "closing_date",
+)
+SCRAPE_CATEGORIES = ("announce_date", "category", "project_owner", "qualification", "location")
+
+
+class TenderBatch:
+    __slots__ = ("columns", "_data", "_categories", "_lookup")
+
+    def __init__(self, columns: Sequence[str] = TENDER_COLUMNS,
+                 categorical: Sequence[str] = TENDER_CATEGORIES):
+        self.columns = tuple(columns)
+        self._data: Dict[str, Union[array, list]] = {}
+        self._categories: Dict[str, List[str]] = {}
+        self._lookup: Dict[str, Dict[str, int]] = {}
+
+        for col in self.columns:
+            if col in categorical:
+                self._data[col] = array("i")
+                self._categories[col] = []
+                self._lookup[col] = {}
+            else:
+                self._data[col] = []
+
+    # ---------- builder ----------
+
+    def add(self, *values) -> None:
+        """
+        Tambah satu tender, nilai diberikan berurutan sesuai self.columns.
+        """
+        if len(values) != len(self.columns):
+            raise ValueError(f"Butuh {len(self.columns)} nilai, dapat {len(values)}")
+
+        for col, value in zip(self.columns, values):
+            lookup = self._lookup.get(col)
+            if lookup is None:
+                self._data[col].append(value)
+                continue
+            code = lookup.get(value)
+            if code is None:
+                code = len(self._categories[col])
+                lookup[value] = code
+                self._categories[col].append(value)
+            self._data[col].append(code)
+
+    def append(self, row: Dict) -> None:
+        """
+        Tambah satu tender dari dict (kompatibel dengan list.append lama).
+        """
+        self.add(*(row.get(col, "") for col in self.columns))
+
+    def extend(self, rows: Iterable[Dict]) -> None:
+        for row in rows:
+            self.append(row)
+
+    # ---------- akses ----------
+
+    def __len__(self) -> int:
+        return len(self._data[self.columns[0]]) if self.columns else 0
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def column(self, name: str) -> List:
+        """
+        Nilai satu kolom (sudah di-decode).
+        """
+        cats = self._categories.get(name)
+        if cats is None:
+            return list(self._data[name])
+        return [cats[code] for code in self._data[name]]
+
+    def distinct(self, name: str) -> List:
+        """
+        Nilai unik suatu kolom; untuk kolom kategori ini gratis.
+        """
+        cats = self._categories.get(name)
+        if cats is None:
+            return list(dict.fromkeys(self._data[name]))
+        return list(cats)
+
+    def value_counts(self, name: str) -> Counter:
+        """
+        Jumlah baris per nilai; kolom kategori dihitung langsung dari kode int.
+        """
+        cats = self._categories.get(name)
+        if cats is None:
+            return Counter(self._data[name])
+        return Counter({cats[code]: n for code, n in Counter(self._data[name]).items()})
+
+    def row(self, i: int) -> Tuple:
+        out = []
+        for col in self.columns:
+            value = self._data[col][i]
+            cats = self._categories.get(col)
+            out.append(cats[value] if cats is not None else value)
+        return tuple(out)
+
+    def rows(self) -> Iterator[Tuple]:
+        decoded = [self.column(col) for col in self.columns]
+        return zip(*decoded)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("TenderBatch index out of range")
+        return dict(zip(self.columns, self.row(i)))
+
+    def __iter__(self) -> Iterator[Dict]:
+        cols = self.columns
+        for values in self.rows():
+            yield dict(zip(cols, values))
+
+    def __repr__(self) -> str:
+        return f"TenderBatch({len(self)} rows, columns={list(self.columns)})"
+
+    # ---------- konversi ----------
+
+    def to_dataframe(self):
+        """
+        Konversi ke pandas.DataFrame. Kolom kategori menjadi pd.Categorical
+        ordered dengan kategori terurut, jadi sort_values mengikuti nilai
+        (tanggal ISO urut kronologis), bukan urutan nilai pertama kali muncul.
+        """
+        import numpy as np
+        import pandas as pd
+
+        data = {}
+        for col in self.columns:
+            cats = self._categories.get(col)
+            if cats is None:
+                data[col] = self._data[col]
+            else:
+                codes = np.frombuffer(self._data[col], dtype=np.int32) if len(self) else np.array([], dtype=np.int32)
+                # kode disimpan sesuai urutan insert; remap ke posisi kategori yang sudah diurutkan
+                order = sorted(range(len(cats)), key=lambda k: str(cats[k]))
+                rank = np.empty(len(cats), dtype=np.int32)
+                rank[order] = np.arange(len(cats), dtype=np.int32)
+                data[col] = pd.Categorical.from_codes(rank[codes] if len(cats) else codes,
+                                                      categories=pd.Index([cats[k] for k in order], dtype=object),
+                                                      ordered=True)
+        return pd.DataFrame(data, columns=list(self.columns))
+
+    def to_arrow(self):
+        """
+        Konversi ke pyarrow.Table (opsional, butuh pyarrow).
+        Kolom kategori menjadi DictionaryArray.
+        """
+        import pyarrow as pa
+
+        arrays = []
+        for col in self.columns:
+            cats = self._categories.get(col)
+            if cats is None:
+                arrays.append(pa.array(self._data[col]))
+            else:
+                indices = pa.array(memoryview(self._data[col]), type=pa.int32())
+                arrays.append(pa.DictionaryArray.from_arrays(indices, pa.array(cats, type=pa.string())))
+        return pa.Table.from_arrays(arrays, names=list(self.columns))
+
+
+def to_dataframe(tenders):
+    """
+    Helper: terima TenderBatch atau list of dict.
+    """
+    if isinstance(tenders, TenderBatch):
+        return tenders.to_dataframe()
+    import pandas as pd
+    return pd.DataFrame(tenders)
@@ -0,0 +1,238 @@
+"""
+Regression & throughput check untuk parser tender.
+
+Corpus ada di corpus/inputs (teks paste .txt dan halaman .html). Untuk setiap
+input dan setiap parser yang relevan, output dibandingkan dengan golden di
+corpus/expected/<input>.<parser>.json. Throughput tiap parser (KB/detik)
+juga harus di atas batas minimum di corpus/throughput.json.
+
+Parser:
+- extract : tender_extract.parse_tender_data        (.txt)
+- simple  : tender_simple.parse_tender_data         (.txt)
+- hybrid  : tender_hybrid read_lines_from_file +
+            extract_tender_items_from_lines         (.txt & .html)
+
+Contoh:
+    python tender_regression.py              # cek output + throughput
+    python tender_regression.py --no-perf    # cek output saja
+    python tender_regression.py --update     # tulis ulang golden (setelah perubahan disengaja)
+"""
+import argparse
+import difflib
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_DIR = os.path.join(BASE_DIR, "corpus")
+INPUT_DIR = os.path.join(CORPUS_DIR, "inputs")
+EXPECTED_DIR = os.path.join(CORPUS_DIR, "expected")
+THROUGHPUT_FILE = os.path.join(CORPUS_DIR, "throughput.json")
+
+# ukuran input minimum untuk pengukuran throughput (input diulang sampai segini)
+PERF_MIN_BYTES = 256 * 1024
+PERF_ROUNDS = 3
+
+
+def _fresh_hybrid():
+    """
+    Pastikan peta client -> sector yang dipelajari tidak aktif (mis. sisa
+    pemanggil lain), supaya output hanya bergantung pada input.
+    """
+    import tender_hybrid
+
+    tender_hybrid.use_sector_map(None)
+    return tender_hybrid
+
+
+def run_extract(path: str) -> List[Dict]:
+    import tender_extract
+    return list(tender_extract.parse_tender_data(read_text(path)))
+
+
+def run_simple(path: str) -> List[Dict]:
+    import tender_simple
+    return list(tender_simple.parse_tender_data(read_text(path)))
+
+
+def run_hybrid(path: str) -> List[Dict]:
+    hybrid = _fresh_hybrid()
+    return list(hybrid.extract_tender_items_from_lines(hybrid.read_lines_from_file(path)))
+
+
+# parser -> (fungsi, ekstensi input yang dicek)
+PARSERS: Dict[str, tuple] = {
+    "extract": (run_extract, (".txt",)),
+    "simple": (run_simple, (".txt",)),
+    "hybrid": (run_hybrid, (".txt", ".html", ".htm")),
+}
+
+
+def read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def list_inputs() -> List[str]:
+    return sorted(f for f in os.listdir(INPUT_DIR) if not f.startswith("."))
+
+
+def expected_path(input_name: str, parser: str) -> str:
+    return os.path.join(EXPECTED_DIR, f"{input_name}.{parser}.json")
+
+
+def dump(rows: List[Dict]) -> str:
+    return json.dumps(rows, ensure_ascii=False, indent=1) + "\n"
+
+
+def check_outputs(update: bool, only: List[str]) -> int:
+    failures = 0
+    for name in list_inputs():
+        path = os.path.join(INPUT_DIR, name)
+        for parser, (func, exts) in PARSERS.items():
+            if only and parser not in only:
+                continue
+            if not name.lower().endswith(exts):
+                continue
+
+            actual = dump(func(path))
+            golden = expected_path(name, parser)
+
+            if update:
+                with open(golden, "w", encoding="utf-8") as f:
+                    f.write(actual)
+                print(f"[UPDATE] {name} [{parser}]")
+                continue
+
+            if not os.path.exists(golden):
+                print(f"[MISSING] {name} [{parser}] -> jalankan dengan --update")
+                failures += 1
+                continue
+
+            expected = read_text(golden)
+            if actual == expected:
+                print(f"[OK]   {name} [{parser}]")
+                continue
+
+            failures += 1
+            print(f"[FAIL] {name} [{parser}]")
+            diff = difflib.unified_diff(expected.splitlines(), actual.splitlines(),
+                                        "expected", "actual", lineterm="", n=2)
+            for line in list(diff)[:40]:
+                print("       " + line)
+    return failures
+
+
+def check_records() -> int:
+    """
+    TenderBatch.to_dataframe: sort kolom kategori tanggal harus urut tanggal,
+    bukan urut nilai pertama kali muncul (export_rows sort announce_date desc).
+    """
+    from tender_records import SCRAPE_CATEGORIES, SCRAPE_COLUMNS, TenderBatch
+
+    days = ["2025-11-05", "2025-11-01", "2025-11-03", "2025-11-10", "2025-11-01"]
+    batch = TenderBatch(SCRAPE_COLUMNS, SCRAPE_CATEGORIES)
+    for day in days:
+        batch.add(day, *[""] * (len(SCRAPE_COLUMNS) - 1))
+    df = batch.to_dataframe()
+    actual = list(df.sort_values(by="announce_date", ascending=False)["announce_date"])
+    expected = sorted(days, reverse=True)
+    same = list(df["announce_date"]) == days
+    if actual == expected and same:
+        print("[OK]   TenderBatch sort kolom kategori tanggal")
+        return 0
+    print(f"[FAIL] TenderBatch sort kolom kategori tanggal: {actual} (harusnya {expected})")
+    return 1
+
+
+def _perf_input(exts) -> str:
+    """
+    Gabungkan semua input yang cocok, diulang sampai >= PERF_MIN_BYTES.
+    """
+    texts = [read_text(os.path.join(INPUT_DIR, n)) for n in list_inputs() if n.lower().endswith(exts)]
+    unit = "\n".join(texts)
+    repeat = max(1, PERF_MIN_BYTES // max(1, len(unit.encode("utf-8"))) + 1)
+    return "\n".join([unit] * repeat)
+
+
+def _perf_funcs() -> Dict[str, Callable[[str], object]]:
+    import tender_extract
+    import tender_simple
+
+    def hybrid_text(text):
+        hybrid = _fresh_hybrid()
+        lines = [ln for ln in text.replace("\r", "\n").split("\n") if hybrid.clean_text(ln)]
+        return hybrid.extract_tender_items_from_lines(lines)
+
+    def hybrid_html(text):
+        hybrid = _fresh_hybrid()
+        return hybrid.extract_tender_items_from_lines(hybrid.extract_text_lines_from_html(text))
+
+    return {
+        "extract": (tender_extract.parse_tender_data, (".txt",)),
+        "simple": (tender_simple.parse_tender_data, (".txt",)),
+        "hybrid": (hybrid_text, (".txt",)),
+        "hybrid-html": (hybrid_html, (".html", ".htm")),
+    }
+
+
+def measure_throughput(only: List[str]) -> Dict[str, float]:
+    results = {}
+    for name, (func, exts) in _perf_funcs().items():
+        if only and name.split("-")[0] not in only:
+            continue
+        text = _perf_input(exts)
+        size_kb = len(text.encode("utf-8")) / 1024
+        best = min(_timed(func, text) for _ in range(PERF_ROUNDS))
+        results[name] = size_kb / best if best > 0 else float("inf")
+    return results
+
+
+def _timed(func, text) -> float:
+    started = time.perf_counter()
+    func(text)
+    return time.perf_counter() - started
+
+
+def check_throughput(only: List[str]) -> int:
+    with open(THROUGHPUT_FILE, "r", encoding="utf-8") as f:
+        floors = json.load(f)
+
+    failures = 0
+    for name, kb_per_sec in measure_throughput(only).items():
+        floor = floors.get(name)
+        if floor is None:
+            print(f"[PERF] {name}: {kb_per_sec:,.0f} KB/s (tanpa batas minimum)")
+            continue
+        ok = kb_per_sec >= floor
+        failures += 0 if ok else 1
+        print(f"[PERF] {'OK  ' if ok else 'FAIL'} {name}: {kb_per_sec:,.0f} KB/s (minimum {floor:,.0f})")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Regression & throughput check parser tender.")
+    parser.add_argument("--update", action="store_true", help="tulis ulang golden output")
+    parser.add_argument("--no-perf", action="store_true", help="lewati cek throughput")
+    parser.add_argument("--parser", action="append", choices=sorted(PARSERS),
+                        help="hanya cek parser ini (boleh diulang)")
+    args = parser.parse_args(argv)
+    only = args.parser or []
+
+    failures = check_outputs(args.update, only)
+    if not args.update:
+        failures += check_records()
+    if not args.update and not args.no_perf:
+        failures += check_throughput(only)
+
+    if failures:
+        print(f"\n❌ {failures} cek gagal")
+        return 1
+    print("\n✅ Semua cek lolos")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,25 @@
 import time
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, date
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+# requests, BeautifulSoup dan pandas di-import di fungsi yang memakainya,
+# supaya modul ini ringan diimport (mis. oleh tender_archive).
+if TYPE_CHECKING:
+    import requests
+
+from tender_archive import HtmlArchive, KIND_LIST, KIND_DETAIL
+from tender_normalize import normalize_frame
+from tender_watchlist import route_if_configured
+from tender_records import TenderBatch, SCRAPE_COLUMNS, SCRAPE_CATEGORIES
+import tender_log
+from tender_log import span
 
 # ================== KONFIGURASI ==================
 
@@ -12,7 +27,8 @@ BASE_URL = "https://www.tender-indonesia.com"
 MOBILE_BASE = f"{BASE_URL}/m"
 
 # URL login member (SESUIKAN jika berbeda dengan yang kamu pakai)
-LOGIN_URL = f"{BASE_URL}/Project_room/index.php"
+LOGIN_PATH = "/Project_room/index.php"
+LOGIN_URL = f"{BASE_URL}{LOGIN_PATH}"
 
 # Kredensial akun kamu
 USERNAME = "KPMOG"
@@ -20,11 +36,15 @@ PASSWORD = "kpm2025"
 
 # Nama field form login (CEK via Inspect Element di browser kamu)
 # Biasanya bukan 'username'/'password' polos. Sesuaikan dengan atribut name= di form.
+LOGIN_USER_FIELD = "USER ID"       # ganti jadi key yg benar, misal "userid" atau "txtID"
+LOGIN_PASSWORD_FIELD = "PASSWORD"  # ganti jadi key yg benar, misal "password" atau "txtPWD"
 LOGIN_PAYLOAD = {
-    "USER ID": USERNAME,   # ganti jadi key yg benar, misal "userid" atau "txtID"
-    "PASSWORD": PASSWORD,  # ganti jadi key yg benar, misal "password" atau "txtPWD"
+    LOGIN_USER_FIELD: USERNAME,
+    LOGIN_PASSWORD_FIELD: PASSWORD,
 }
 
+# Nilai di bawah ini = default; per run bisa ditimpa profil (tender.py --profile, tender_profiles.json)
+
 # Range tanggal rilis pengumuman yang mau di-scrape (format: YYYY-MM-DD)
 START_DATE_STR = "2025-11-01"
 END_DATE_STR   = "2025-11-11"
@@ -35,8 +55,29 @@ OUTPUT_XLSX = "tender_indonesia_filtered.xlsx"
 # Delay antar request (detik)
 REQUEST_DELAY = 1.0
 
+# Jumlah proses untuk parsing HTML (BeautifulSoup = CPU-bound)
+PARSE_WORKERS = 4
+
+# Folder arsip HTML mentah (lihat tender_archive.py). None = tidak diarsip.
+ARCHIVE_DIR = "html_archive"
+
+# Store SQLite untuk hasil scraping (dibaca tender_api / tender_alerts). None = hanya Excel.
+STORE_DB = None
+
+# Folder snapshot untuk delta antar scrape (lihat tender_diff.py). None = tidak ada delta.
+SNAPSHOT_DIR = None
+
+# Maksimum halaman detail mentah yang boleh menunggu diparsing.
+# Kalau penuh, fetcher akan menunggu (backpressure) supaya memori tetap kecil.
+PARSE_QUEUE_SIZE = 32
+
+# Interval (detik) fetcher mengecek sinyal stop saat antrian penuh.
+QUEUE_POLL = 0.5
+
 # =================================================
 
+log = tender_log.get_logger("scrape")
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; TenderScraper/1.0; +https://example.com)"
 }
@@ -46,88 +87,151 @@ def parse_date(date_str: str) -> date:
     return datetime.strptime(date_str, "%Y-%m-%d").date()
 
 
-START_DATE = parse_date(START_DATE_STR)
-END_DATE = parse_date(END_DATE_STR)
+# Writer output hasil scraping
+WRITERS = ("xlsx", "csv", "json", "jsonl")
 
 
-def create_session():
+def default_settings() -> dict:
+    """
+    Konfigurasi di atas sebagai dict. Dibaca saat dipanggil (bukan saat import),
+    jadi bisa ditimpa profil (lihat tender.py) tanpa mengedit file ini.
+    """
+    return {
+        "start": START_DATE_STR,
+        "end": END_DATE_STR,
+        "output": OUTPUT_XLSX,
+        "writer": "xlsx",
+        "rate": 1.0 / REQUEST_DELAY if REQUEST_DELAY else 0.0,
+        "workers": PARSE_WORKERS,
+        "queue_size": PARSE_QUEUE_SIZE,
+        "archive_dir": ARCHIVE_DIR,
+        "store_db": STORE_DB,
+        "snapshot_dir": SNAPSHOT_DIR,
+    }
+
+
+def request_delay(rate: float) -> float:
+    """
+    Request per detik per session -> jeda antar request (0 = tanpa jeda).
+    """
+    return 1.0 / rate if rate else 0.0
+
+
+def create_session(base_url: str = BASE_URL, username: Optional[str] = None, password: Optional[str] = None):
     """
     Buat session & login ke Tender-Indonesia pakai akun kamu.
-    Kamu WAJIB sudah sesuaikan LOGIN_URL & LOGIN_PAYLOAD dengan form asli.
+    Kamu WAJIB sudah sesuaikan LOGIN_PATH & LOGIN_USER_FIELD/LOGIN_PASSWORD_FIELD dengan form asli.
+    Tanpa username/password dipakai akun di LOGIN_PAYLOAD; base_url bisa diganti ke mirror.
     """
+    import requests
+    from bs4 import BeautifulSoup
+
+    login_url = f"{base_url}{LOGIN_PATH}"
+    payload = dict(LOGIN_PAYLOAD)
+    if username is not None:
+        payload[LOGIN_USER_FIELD] = username
+        payload[LOGIN_PASSWORD_FIELD] = password or ""
+
     s = requests.Session()
     s.headers.update(HEADERS)
 
     # 1) GET dulu halaman login (buat ambil cookie / token kalau ada)
-    r = s.get(LOGIN_URL, timeout=15)
+    r = s.get(login_url, timeout=15)
     if r.status_code != 200:
         raise Exception(f"Gagal akses halaman login: {r.status_code}")
 
-    # Kalau ada hidden input (token, dll), tambahkan ke LOGIN_PAYLOAD di sini (optional, tergantung implementasi web)
+    # Kalau ada hidden input (token, dll), tambahkan ke payload di sini (optional, tergantung implementasi web)
     soup = BeautifulSoup(r.text, "html.parser")
     for hidden in soup.find_all("input", {"type": "hidden"}):
         name = hidden.get("name")
         value = hidden.get("value", "")
-        if name and name not in LOGIN_PAYLOAD:
-            LOGIN_PAYLOAD[name] = value
+        if name and name not in payload:
+            payload[name] = value
 
     # 2) POST login
-    r2 = s.post(LOGIN_URL, data=LOGIN_PAYLOAD, timeout=15)
+    r2 = s.post(login_url, data=payload, timeout=15)
     if r2.status_code != 200:
         raise Exception(f"Gagal login: status {r2.status_code}")
 
     # Validasi kasar: cek ada teks yang mengindikasikan sudah login (sesuaikan dengan tampilan actual)
     if "Logout" not in r2.text and "My Admin" not in r2.text and "Member" not in r2.text:
         # Ini hanya indikasi; kalau salah, cek manual HTML respon dan sesuaikan.
-        print("[WARNING] Indikasi login belum jelas. Cek kembali LOGIN_PAYLOAD & LOGIN_URL.")
+        log.warning("Indikasi login belum jelas. Cek kembali LOGIN_PAYLOAD & LOGIN_URL.")
     else:
-        print("[INFO] Login sukses terdeteksi.")
+        log.info("Login sukses terdeteksi.")
 
     return s
 
 
-def generate_date_urls(start_date: date, end_date: date):
+def generate_date_url_pairs(start_date: date, end_date: date, mobile_base: str = MOBILE_BASE):
     """
-    Bangun URL list tender per hari berdasarkan pola:
+    Bangun (tanggal, URL list) per hari berdasarkan pola:
     - Hari ini biasanya: /m/tender.php
     - Hari lain:         /m/tender-YYYY-MM-DD
     """
-    urls = []
+    pairs = []
     today = datetime.today().date()
 
     current = start_date
     while current <= end_date:
         if current == today:
-            urls.append(f"{MOBILE_BASE}/tender.php")
+            pairs.append((current, f"{mobile_base}/tender.php"))
         else:
             slug = f"tender-{current:%Y-%m-%d}"
-            urls.append(f"{MOBILE_BASE}/{slug}")
+            pairs.append((current, f"{mobile_base}/{slug}"))
         current += timedelta(days=1)
 
-    return urls
+    return pairs
+
+
+def generate_date_urls(start_date: date, end_date: date):
+    return [url for _day, url in generate_date_url_pairs(start_date, end_date)]
 
 
-def get_soup(session: requests.Session, url: str):
-    r = session.get(url, timeout=15)
+def fetch_html(session: "requests.Session", url: str,
+               archive: Optional[HtmlArchive] = None, kind: str = KIND_DETAIL) -> Optional[bytes]:
+    """
+    Ambil HTML mentah (bytes) tanpa parsing, supaya parsing bisa
+    dikerjakan terpisah dari network I/O. Kalau archive diberikan,
+    halaman juga disimpan supaya bisa diparsing ulang nanti.
+    """
+    with span(log, "fetch", url=url, kind=kind) as s:
+        r = session.get(url, timeout=15)
+        s.set(status=r.status_code, bytes=len(r.content))
     if r.status_code != 200:
-        print(f"[WARN] {url} -> {r.status_code}")
+        log.warning("Gagal ambil halaman", extra={"url": url, "status": r.status_code})
         return None
-    return BeautifulSoup(r.text, "html.parser")
+    if archive is not None:
+        archive.append(url, kind, r.content)
+    return r.content
+
 
+def get_soup(session: "requests.Session", url: str):
+    html = fetch_html(session, url)
+    if html is None:
+        return None
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, "html.parser")
 
-def parse_list_page(session: requests.Session, url: str, start_date: date, end_date: date):
+
+def parse_list_html(html: bytes, start_date: date, end_date: date, mobile_base: str = MOBILE_BASE):
     """
-    Ambil daftar tender dari halaman list harian.
+    Parse HTML halaman list harian (tanpa akses network).
     Asumsi: setiap baris berbentuk 'dd-mm-YYYY - Judul Tender'
     Filter: hanya ambil yang tanggalnya di antara start_date & end_date (inklusif).
     """
-    soup = get_soup(session, url)
-    if not soup:
-        return []
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
 
     results = []
 
-    for a in soup.find_all("a"):
+    # anchor tanpa href tidak mungkin jadi tender, langsung dilewati
+    for a in soup.find_all("a", href=True):
+        href = a["href"]
+        if not href:
+            continue
+
         text = " ".join(a.get_text(strip=True).split())
         if " - " not in text:
             continue
@@ -135,20 +239,15 @@ def parse_list_page(session: requests.Session, url: str, start_date: date, end_d
         tanggal_part, title = text.split(" - ", 1)
 
         # cek pola tanggal
-        try:
-            tender_date = datetime.strptime(tanggal_part, "%d-%m-%Y").date()
-        except ValueError:
+        tender_date = parse_anchor_date(tanggal_part)
+        if tender_date is None:
             continue
 
         # filter by date range
         if tender_date < start_date or tender_date > end_date:
             continue
 
-        href = a.get("href") or ""
-        if not href:
-            continue
-
-        full_url = urljoin(MOBILE_BASE + "/", href)
+        full_url = urljoin(mobile_base + "/", href)
 
         results.append({
             "announce_date": tender_date,
@@ -160,17 +259,57 @@ def parse_list_page(session: requests.Session, url: str, start_date: date, end_d
     return results
 
 
-def parse_detail_page(session: requests.Session, url: str) -> dict:
+@lru_cache(maxsize=4096)
+def parse_anchor_date(text: str) -> Optional[date]:
     """
-    Ambil info detail singkat dari halaman detail tender.
+    'dd-mm-YYYY' -> date. Satu halaman list hanya punya sedikit tanggal berbeda,
+    jadi hasilnya di-cache; cek bentuk string dulu sebelum konversi.
+    """
+    if len(text) != 10 or text[2] != "-" or text[5] != "-":
+        return None
+    d, m, y = text[:2], text[3:5], text[6:]
+    if not (d.isdigit() and m.isdigit() and y.isdigit()):
+        return None
+    try:
+        return date(int(y), int(m), int(d))
+    except ValueError:
+        return None
+
+
+def complete_dates(tenders, page_date: date) -> set:
+    """
+    Tanggal yang dianggap sudah lengkap terkumpul dari satu halaman list:
+    tanggal halaman itu sendiri + tanggal lain yang muncul, kecuali tanggal
+    paling lama (bisa saja terpotong di akhir halaman).
+    """
+    dates = {t["announce_date"] for t in tenders}
+    if len(dates) > 1:
+        dates.discard(min(dates))
+    dates.add(page_date)
+    return dates
+
+
+def parse_list_page(session: "requests.Session", url: str, start_date: date, end_date: date):
+    """
+    Ambil daftar tender dari halaman list harian.
+    """
+    html = fetch_html(session, url)
+    if html is None:
+        return []
+    return parse_list_html(html, start_date, end_date)
+
+
+def parse_detail_html(html: bytes) -> dict:
+    """
+    Parse HTML halaman detail tender (tanpa akses network).
     Field disesuaikan dengan layout aktual. Di sini kita pakai pendekatan generic:
     baca teks & tarik nilai setelah label 'xxx :'.
     """
-    soup = get_soup(session, url)
-    if not soup:
-        return {}
+    from bs4 import BeautifulSoup
 
-    text = soup.get_text("\n", strip=True)
+    with span(log, "parse_detail", bytes=len(html)):
+        soup = BeautifulSoup(html, "html.parser")
+        text = soup.get_text("\n", strip=True)
 
     fields = [
         ("Project Description", "project_description"),
@@ -194,51 +333,274 @@ def parse_detail_page(session: requests.Session, url: str) -> dict:
     return data
 
 
-def scrape():
+def parse_detail_page(session: "requests.Session", url: str) -> dict:
+    """
+    Ambil info detail singkat dari halaman detail tender.
+    """
+    html = fetch_html(session, url)
+    if html is None:
+        return {}
+    return parse_detail_html(html)
+
+
+def build_row(tender: dict, detail: dict) -> dict:
+    return {
+        "announce_date": tender["announce_date"].isoformat(),
+        "title": tender["title"],
+        "detail_url": tender["detail_url"],
+        "project_description": detail.get("project_description", ""),
+        "category": detail.get("category", ""),
+        "project_owner": detail.get("project_owner", ""),
+        "qualification": detail.get("qualification", ""),
+        "estimation_value": detail.get("estimation_value", ""),
+        "location": detail.get("location", ""),
+        "closing_date": detail.get("closing_date", ""),
+    }
+
+
+# Penanda akhir antrian dari fetcher
+_FETCH_DONE = object()
+
+
+class _FetchStopped(Exception):
+    """Consumer sudah berhenti; fetcher tidak perlu lanjut."""
+
+
+def _put_until_stopped(out_queue: queue.Queue, item, stop: Optional[threading.Event]):
+    """
+    put() yang tetap blocking saat antrian penuh (backpressure), tapi berhenti
+    kalau stop di-set (consumer error dan tidak akan mengosongkan antrian lagi).
+    """
+    while True:
+        if stop is not None and stop.is_set():
+            raise _FetchStopped()
+        try:
+            out_queue.put(item, timeout=QUEUE_POLL)
+            return
+        except queue.Full:
+            continue
+
+
+def fetch_pages(session: "requests.Session", date_urls, pool, out_queue: queue.Queue, errors: list,
+                start_date: date, end_date: date, archive: Optional[HtmlArchive] = None,
+                delay: float = REQUEST_DELAY, mobile_base: str = MOBILE_BASE,
+                stop: Optional[threading.Event] = None):
+    """
+    Producer: ambil halaman list & detail, lalu taruh HTML detail mentah ke
+    out_queue. put() akan blocking kalau antrian penuh (backpressure), kecuali
+    stop sudah di-set consumer (fetcher langsung berhenti).
+    Halaman list diparsing di pool juga, karena URL detail baru diketahui
+    setelah list diparsing.
+
+    date_urls = [(tanggal, url)], diproses dari tanggal terbaru. Kalau satu
+    halaman ternyata memuat beberapa hari, URL hari yang sudah lengkap
+    dilewati, dan URL detail yang sudah pernah diambil tidak diambil lagi.
+    """
+    covered = set()
+    seen_details = set()
+    skipped_pages = 0
+    skipped_details = 0
+
+    try:
+        for day, url in sorted(date_urls, reverse=True):
+            if stop is not None and stop.is_set():
+                raise _FetchStopped()
+            if day in covered:
+                skipped_pages += 1
+                log.debug("Halaman list dilewati (sudah tercakup halaman lain)", extra={"url": url})
+                continue
+
+            html = fetch_html(session, url, archive, KIND_LIST)
+            with span(log, "parse_list", url=url):
+                tenders = pool.submit(parse_list_html, html, start_date, end_date, mobile_base).result() if html else []
+            if html:
+                covered |= complete_dates(tenders, day)
+
+            new_tenders = []
+            for t in tenders:
+                if t["detail_url"] in seen_details:
+                    skipped_details += 1
+                    continue
+                seen_details.add(t["detail_url"])
+                new_tenders.append(t)
+            log.info("Halaman list", extra={"url": url, "tenders": len(new_tenders)})
+
+            for t in new_tenders:
+                detail_html = fetch_html(session, t["detail_url"], archive, KIND_DETAIL)
+                _put_until_stopped(out_queue, (t, detail_html), stop)
+                time.sleep(delay)
+
+            time.sleep(delay)
+
+        if skipped_pages or skipped_details:
+            log.info("Dilewati", extra={"list_pages": skipped_pages, "duplicate_details": skipped_details})
+    except _FetchStopped:
+        log.info("Fetch dihentikan (consumer berhenti)")
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        try:
+            _put_until_stopped(out_queue, _FETCH_DONE, stop)
+        except _FetchStopped:
+            pass
+
+
+def parse_stream(in_queue: queue.Queue, pool, on_row, max_pending: int = PARSE_QUEUE_SIZE,
+                 stop: Optional[threading.Event] = None):
+    """
+    Consumer: kirim HTML detail ke pool, lalu teruskan row ke on_row (writer)
+    sesuai urutan fetch. Jumlah future yang sedang jalan dibatasi
+    max_pending supaya memori tetap bounded. Kalau consumer error, stop
+    di-set supaya fetcher tidak tertahan selamanya di put().
+    """
+    try:
+        _parse_stream(in_queue, pool, on_row, max_pending)
+    except BaseException:
+        if stop is not None:
+            stop.set()
+        raise
+
+
+def _parse_stream(in_queue: queue.Queue, pool, on_row, max_pending: int):
+    pending = deque()
+
+    def emit_one():
+        tender, future = pending.popleft()
+        detail = future.result() if future is not None else {}
+        on_row(build_row(tender, detail))
+
+    while True:
+        item = in_queue.get()
+        if item is _FETCH_DONE:
+            break
+
+        tender, html = item
+        future = pool.submit(parse_detail_html, html) if html is not None else None
+        pending.append((tender, future))
+
+        # keluarkan yang sudah selesai (atau paksa tunggu kalau sudah terlalu banyak)
+        while pending and (len(pending) > max_pending or
+                           pending[0][1] is None or pending[0][1].done()):
+            emit_one()
+
+    while pending:
+        emit_one()
+
+
+def scrape_range(session: "requests.Session", start_date: date, end_date: date,
+                 mobile_base: str = MOBILE_BASE, delay: float = REQUEST_DELAY,
+                 archive_dir: Optional[str] = ARCHIVE_DIR, parse_workers: int = PARSE_WORKERS,
+                 queue_size: int = PARSE_QUEUE_SIZE) -> TenderBatch:
+    """
+    Scrape satu range tanggal dengan satu session. Dipakai scrape() dan oleh
+    worker tender_shard (satu akun / mirror per proses).
+    """
+    date_urls = generate_date_url_pairs(start_date, end_date, mobile_base)
+    all_rows = TenderBatch(SCRAPE_COLUMNS, SCRAPE_CATEGORIES)
+
+    log.info("Mulai scraping", extra={"list_pages": len(date_urls),
+                                      "start": start_date.isoformat(), "end": end_date.isoformat()})
+
+    # Fetch (thread) -> antrian bounded -> parsing (process pool) -> writer
+    html_queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors = []
+    archive = HtmlArchive(archive_dir) if archive_dir else None
+
+    try:
+        with span(log, "scrape", logging.INFO) as s, ProcessPoolExecutor(max_workers=parse_workers) as pool:
+            fetcher = threading.Thread(
+                target=fetch_pages,
+                args=(session, date_urls, pool, html_queue, errors,
+                      start_date, end_date, archive, delay, mobile_base, stop),
+                daemon=True,
+            )
+            fetcher.start()
+            try:
+                parse_stream(html_queue, pool, all_rows.append, queue_size, stop)
+            finally:
+                # tunggu fetcher keluar sebelum pool ditutup
+                fetcher.join()
+            s.set(rows=len(all_rows))
+    finally:
+        if archive is not None:
+            archive.close()
+
+    if errors:
+        raise errors[0]
+    return all_rows
+
+
+def scrape(settings: Optional[dict] = None) -> TenderBatch:
+    """
+    Scrape satu range tanggal dengan akun default. settings menimpa
+    default_settings() (mis. dari profil tender.py).
+    """
+    cfg = dict(default_settings(), **(settings or {}))
+    start_date, end_date = parse_date(cfg["start"]), parse_date(cfg["end"])
+
     session = create_session()
-    list_urls = generate_date_urls(START_DATE, END_DATE)
-    all_rows = []
-
-    print(f"[INFO] Scraping {len(list_urls)} halaman list, range {START_DATE} s/d {END_DATE}")
-
-    for url in list_urls:
-        print(f"[LIST] {url}")
-        tenders = parse_list_page(session, url, START_DATE, END_DATE)
-        print(f"  -> {len(tenders)} tender dalam range")
-
-        for t in tenders:
-            detail = parse_detail_page(session, t["detail_url"])
-            row = {
-                "announce_date": t["announce_date"].isoformat(),
-                "title": t["title"],
-                "detail_url": t["detail_url"],
-                "project_description": detail.get("project_description", ""),
-                "category": detail.get("category", ""),
-                "project_owner": detail.get("project_owner", ""),
-                "qualification": detail.get("qualification", ""),
-                "estimation_value": detail.get("estimation_value", ""),
-                "location": detail.get("location", ""),
-                "closing_date": detail.get("closing_date", ""),
-            }
-            all_rows.append(row)
-            time.sleep(REQUEST_DELAY)
-
-        time.sleep(REQUEST_DELAY)
+    all_rows = scrape_range(session, start_date, end_date, delay=request_delay(cfg["rate"]),
+                            archive_dir=cfg["archive_dir"], parse_workers=cfg["workers"],
+                            queue_size=cfg["queue_size"])
 
     if not all_rows:
-        print("[INFO] Tidak ada data dalam range tanggal ini. Cek kembali START_DATE/END_DATE.")
-        return
+        log.warning("Tidak ada data dalam range tanggal ini. Cek kembali start/end.")
+        return all_rows
+
+    publish_rows(all_rows, cfg["output"], writer=cfg["writer"], store_db=cfg["store_db"],
+                 snapshot_dir=cfg["snapshot_dir"], window=(start_date.isoformat(), end_date.isoformat()))
+    return all_rows
 
-    # Simpan ke Excel
-    df = pd.DataFrame(all_rows)
-    # Sort by announce_date desc biar enak dibaca
-    df = df.sort_values(by="announce_date", ascending=False)
 
-    with pd.ExcelWriter(OUTPUT_XLSX, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name="Tender")
+def publish_rows(all_rows: TenderBatch, output: str, source: str = "scrape", writer: str = "xlsx",
+                 store_db: Optional[str] = None, snapshot_dir: Optional[str] = None,
+                 window: Optional[Tuple[str, str]] = None) -> None:
+    """
+    Tulis hasil scraping ke file, kirim ke watchlist, dan (kalau diberikan)
+    ke store SQLite serta snapshot delta (tender_diff).
 
-    print(f"[DONE] {len(all_rows)} baris tersimpan ke {OUTPUT_XLSX}")
+    window = range tanggal (ISO) yang diminta scrape ini; tender di snapshot
+    sebelumnya dalam range itu yang tidak muncul lagi dicatat "remove",
+    termasuk di hari tepi atau hari yang sekarang kosong.
+    """
+    export_rows(all_rows, output, writer)
+    route_if_configured(all_rows, source=source)
+    if store_db:
+        from tender_store import TenderStore
+
+        with TenderStore(store_db) as store:
+            added = store.append(all_rows, source=source)
+        log.info("Store di-update", extra={"path": store_db, "new_rows": added})
+    if snapshot_dir:
+        from tender_diff import snapshot
+
+        snapshot(all_rows, snapshot_dir, window=window)
+
+
+def export_rows(all_rows: TenderBatch, output: str, writer: str = "xlsx") -> None:
+    import pandas as pd
+
+    if writer not in WRITERS:
+        raise ValueError(f"Writer tidak dikenal: {writer} (pilihan: {', '.join(WRITERS)})")
+
+    with span(log, "export", logging.INFO, rows=len(all_rows), path=output, writer=writer):
+        # tambah kolom nilai IDR & tanggal penutupan yang sudah dinormalisasi (bisa difilter di Excel)
+        df = normalize_frame(all_rows.to_dataframe())
+        # Sort by announce_date desc biar enak dibaca
+        df = df.sort_values(by="announce_date", ascending=False)
+
+        if writer == "xlsx":
+            with pd.ExcelWriter(output, engine="openpyxl") as xw:
+                df.to_excel(xw, index=False, sheet_name="Tender")
+        elif writer == "csv":
+            df.to_csv(output, index=False)
+        elif writer == "json":
+            df.to_json(output, orient="records", force_ascii=False, indent=1, date_format="iso")
+        else:
+            df.to_json(output, orient="records", force_ascii=False, lines=True, date_format="iso")
 
 
 if __name__ == "__main__":
+    tender_log.configure()
     scrape()
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""
+Resolusi sector: koreksi typo nama sector & tebak sector dari nama client.
+
+SectorResolver menggabungkan:
+- peta client -> sector yang dipelajari dari data historis (disimpan ke JSON),
+- satu keyword automaton untuk semua aturan keyword & typo,
+- LRU cache per nama.
+Statistik hit per aturan tersedia di resolver.stats.
+"""
+import json
+import os
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tender_automaton import KeywordAutomaton
+
+# Urutan penting: kalau ada beberapa match, entri yang lebih awal menang.
+SECTOR_CORRECTIONS: Dict[str, str] = {
+    "ELECTRICTY": "ELECTRICITY",
+    "ELECTRIC": "ELECTRICITY",
+    "ELECTRICITY": "ELECTRICITY",
+    "GOVERMENT": "GOVERNMENT",
+    "GOVERNMENT": "GOVERNMENT",
+    "MANUFACTUR": "MANUFACTURE",
+    "MANUFACTURE": "MANUFACTURE",
+    "TELECOMMUNICATON": "TELECOMMUNICATION",
+    "TELECOMMUNICATION": "TELECOMMUNICATION",
+    "INFRASTRUCTUR": "INFRASTRUCTURE",
+    "INFRASTRUCTURE": "INFRASTRUCTURE",
+    "INTERNATONAL": "INTERNATIONAL",
+    "INTERNATIONAL": "INTERNATIONAL",
+    "MINING / CEMENT": "MINING / CEMENT",
+    "PLANTATION": "PLANTATION",
+    "BANK AND FINANCIAL SERVICE": "BANK AND FINANCIAL SERVICE",
+    "HOSPITAL": "HOSPITAL",
+    "OTHER PRIVATE SECTOR": "OTHER PRIVATE SECTOR",
+    "OIL & GAS": "OIL & GAS",
+}
+
+# (sector, keywords) -- urutan = prioritas
+CLIENT_KEYWORD_RULES: List[Tuple[str, List[str]]] = [
+    ("OIL & GAS", ["PERTAMINA", "PETROCHINA", "MEDCO", "CHEVRON", "SHELL", "MUBADALA", "BP "]),
+    ("ELECTRICITY", ["PLN", "ELECTRIC", "POWER", "TENAGA LISTRIK"]),
+    ("GOVERNMENT", ["KEMENTERIAN", "PEMERINTAH", "PEMKAB", "PEMKOT", "PEMPROV", "DINAS", "KABUPATEN", "KOTA"]),
+    ("BANK AND FINANCIAL SERVICE", ["BANK ", "BPR ", "FINANCE", "ASURANSI"]),
+    ("HOSPITAL", ["RS ", "RUMAH SAKIT", "HOSPITAL", "CLINIC", "KLINIK"]),
+    ("PLANTATION", ["PLANTATION", "SAWIT", "PALM", "PERKEBUNAN"]),
+]
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def normalize_client(client_name: str) -> str:
+    return re.sub(r"\s+", " ", client_name.replace("\xa0", " ")).strip().upper()
+
+
+class SectorResolver:
+    def __init__(self,
+                 keyword_rules: List[Tuple[str, List[str]]] = CLIENT_KEYWORD_RULES,
+                 corrections: Optional[Dict[str, str]] = None,
+                 learned_path: Optional[str] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        self.corrections = dict(SECTOR_CORRECTIONS if corrections is None else corrections)
+        self.learned_path = learned_path
+        self.stats: Counter = Counter()
+
+        # client (normalized) -> Counter(sector -> jumlah kemunculan)
+        self._history: Dict[str, Counter] = {}
+        self._learned: Dict[str, str] = {}
+        self._loaded = learned_path is None
+
+        self._client_automaton = KeywordAutomaton()
+        priority = 0
+        for sector, keywords in keyword_rules:
+            for kw in keywords:
+                self._client_automaton.add(kw, (priority, sector, kw))
+                priority += 1
+        self._client_automaton.build()
+
+        self._typo_automaton = KeywordAutomaton()
+        for priority, (wrong, fixed) in enumerate(self.corrections.items()):
+            self._typo_automaton.add(wrong, (priority, fixed, wrong))
+        self._typo_automaton.build()
+
+        self._resolve_client = lru_cache(maxsize=cache_size)(self._resolve_client_uncached)
+        self._resolve_sector = lru_cache(maxsize=cache_size)(self._resolve_sector_uncached)
+
+    # ---------- sector typo ----------
+
+    def _resolve_sector_uncached(self, name: str) -> Tuple[str, str]:
+        fixed = self.corrections.get(name)
+        if fixed is not None:
+            return fixed, "typo:exact"
+
+        # partial match: entri koreksi paling awal yang muncul di nama
+        best = min(self._typo_automaton.values(name), default=None)
+        if best is not None:
+            return best[1], f"typo:partial:{best[2]}"
+
+        return name, "typo:none"
+
+    def correct(self, sector_name: str) -> str:
+        """
+        Normalize common typos / variations in sector name.
+        """
+        if not sector_name:
+            return ""
+        sector, rule = self._resolve_sector(sector_name.upper().strip())
+        self.stats[rule] += 1
+        return sector
+
+    # ---------- client -> sector ----------
+
+    def _resolve_client_uncached(self, key: str) -> Tuple[str, str]:
+        learned = self._learned.get(key)
+        if learned:
+            return learned, "learned"
+
+        best = min(self._client_automaton.values(key), default=None)
+        if best is not None:
+            return best[1], f"keyword:{best[2].strip()}"
+
+        return "", "miss"
+
+    def from_client(self, client_name: str) -> str:
+        """
+        Tebak sector dari nama client (peta historis dulu, lalu keyword).
+        """
+        if not client_name:
+            return ""
+        self._ensure_loaded()
+        sector, rule = self._resolve_client(normalize_client(client_name))
+        self.stats[rule] += 1
+        return sector
+
+    # ---------- learning ----------
+
+    def learn(self, client_name: str, sector: str) -> None:
+        """
+        Catat satu pasangan client -> sector yang sudah pasti (dari header sector).
+        """
+        if not client_name or not sector:
+            return
+        self._ensure_loaded()
+        key = normalize_client(client_name)
+        counts = self._history.setdefault(key, Counter())
+        counts[sector] += 1
+
+        best = counts.most_common(1)[0][0]
+        if self._learned.get(key) != best:
+            self._learned[key] = best
+            self._resolve_client.cache_clear()
+
+    def learn_from_records(self, records: Iterable[Dict]) -> None:
+        for rec in records:
+            self.learn(rec.get("Client", ""), rec.get("Sector", ""))
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.learned_path or not os.path.exists(self.learned_path):
+            return
+        with open(self.learned_path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        for key, counts in raw.items():
+            self._history[key] = Counter(counts)
+            self._learned[key] = self._history[key].most_common(1)[0][0]
+        self._resolve_client.cache_clear()
+
+    def save(self, path: Optional[str] = None) -> Optional[str]:
+        path = path or self.learned_path
+        if not path:
+            return None
+        self._ensure_loaded()
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({k: dict(v) for k, v in sorted(self._history.items())}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+        return path
+
+    # ---------- info ----------
+
+    def cache_info(self) -> Dict[str, object]:
+        return {
+            "client": self._resolve_client.cache_info(),
+            "sector": self._resolve_sector.cache_info(),
+        }
+
+    def format_stats(self, top: int = 10) -> str:
+        lines = [f"{rule}: {n}" for rule, n in self.stats.most_common(top)]
+        return "\n".join(lines)
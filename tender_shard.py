@@ -0,0 +1,347 @@
+"""
+Scraping paralel dengan beberapa akun (dan mirror) tender-indonesia.
+
+Range tanggal dipecah jadi shard (SHARD_DAYS hari berurutan). Setiap akun
+jalan di proses worker sendiri: login sekali, punya session dan jeda request
+sendiri (rate), lalu mengambil shard berikutnya dari antrian bersama sampai
+habis, jadi akun yang lebih cepat otomatis mengerjakan lebih banyak shard.
+Shard yang gagal (atau worker-nya mati) dikembalikan ke antrian untuk akun lain.
+
+Hasil digabung deterministik: urut shard dari tanggal terbaru (sama dengan
+scrape biasa), URL detail dari mirror ditulis ulang ke MOBILE_BASE, dan
+detail_url yang sama hanya diambil sekali. Output tidak bergantung pada jumlah
+akun atau urutan selesai worker.
+
+File akun (scrape_accounts.json):
+    {"accounts": [
+        {"name": "kpm1", "username": "KPMOG", "password": "...", "rate": 1.0},
+        {"name": "kpm2", "username": "...", "password": "...", "base_url": "https://mirror.example.com"}
+    ]}
+rate = request per detik untuk akun itu (default 1 / REQUEST_DELAY).
+Arsip HTML tiap akun ditulis ke <ARCHIVE_DIR>/shard-<name>.
+
+Contoh:
+    python tender_shard.py --accounts scrape_accounts.json --start 2025-11-01 --end 2025-11-30
+    python tender_shard.py --stub 3 --start 2025-11-01 --end 2025-11-11    # tes lokal, 3 situs tiruan
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import tender_log
+import tender_scrapping as ts
+from tender_records import SCRAPE_CATEGORIES, SCRAPE_COLUMNS, TenderBatch
+
+DEFAULT_ACCOUNTS_FILE = "scrape_accounts.json"
+
+# jumlah hari per shard; shard berurutan supaya halaman list yang memuat
+# beberapa hari tetap dimanfaatkan di dalam satu shard
+SHARD_DAYS = 3
+
+# proses parsing per worker (tiap akun sudah proses sendiri)
+SHARD_PARSE_WORKERS = 1
+
+# berapa kali satu shard boleh dicoba ulang di akun lain
+SHARD_RETRIES = 2
+
+# akun berhenti dipakai setelah sekian shard gagal berturut-turut (login gagal = langsung berhenti)
+ACCOUNT_MAX_FAILURES = 3
+
+log = tender_log.get_logger("shard")
+
+
+def make_shards(start_date: date, end_date: date, days: int = SHARD_DAYS) -> List[Tuple[date, date]]:
+    """
+    Pecah range tanggal jadi shard berurutan, mulai dari tanggal terbaru.
+    """
+    shards = []
+    end = end_date
+    while end >= start_date:
+        start = max(start_date, end - timedelta(days=days - 1))
+        shards.append((start, end))
+        end = start - timedelta(days=1)
+    return shards
+
+
+def load_accounts(path: str) -> List[Dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    accounts = data.get("accounts", data) if isinstance(data, dict) else data
+    if not accounts:
+        raise ValueError(f"Tidak ada akun di {path}")
+    for i, acc in enumerate(accounts):
+        acc.setdefault("name", acc.get("username") or f"akun{i + 1}")
+        acc.setdefault("base_url", ts.BASE_URL)
+        if "username" not in acc:
+            raise ValueError(f"Akun {acc['name']} tanpa username")
+    names = [acc["name"] for acc in accounts]
+    if len(set(names)) != len(names):
+        raise ValueError("Nama akun harus unik")
+    return accounts
+
+
+def canonical_url(url: str, mobile_base: str) -> str:
+    """
+    URL detail dari mirror -> URL di MOBILE_BASE, supaya dedupe & store konsisten.
+    """
+    if mobile_base != ts.MOBILE_BASE and url.startswith(mobile_base + "/"):
+        return ts.MOBILE_BASE + url[len(mobile_base):]
+    return url
+
+
+def _shard_worker(account: Dict, tasks, results, options: Dict) -> None:
+    """
+    Proses worker untuk satu akun: login, lalu kerjakan shard dari antrian
+    sampai dapat None.
+    """
+    tender_log.configure(**options["log"])
+    name = account["name"]
+    base_url = account["base_url"].rstrip("/")
+    mobile_base = f"{base_url}/m"
+    rate = account.get("rate")
+    delay = 1.0 / rate if rate else options["delay"]
+    archive_dir = os.path.join(options["archive_dir"], f"shard-{name}") if options["archive_dir"] else None
+
+    session = None
+    failures = 0
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        idx, start_iso, end_iso = task
+        results.put(("start", name, idx, None))
+        started = time.perf_counter()
+        if session is None:
+            try:
+                session = ts.create_session(base_url, account["username"], account.get("password", ""))
+            except Exception as e:
+                # akun / mirror tidak bisa dipakai: shard dikembalikan, worker berhenti
+                results.put(("failed", name, idx, f"login: {type(e).__name__}: {e}"))
+                return
+        try:
+            rows = ts.scrape_range(session, date.fromisoformat(start_iso), date.fromisoformat(end_iso),
+                                   mobile_base=mobile_base, delay=delay, archive_dir=archive_dir,
+                                   parse_workers=options["parse_workers"], queue_size=options["queue_size"])
+        except Exception as e:
+            session = None  # login ulang untuk shard berikutnya
+            failures += 1
+            results.put(("failed", name, idx, f"{type(e).__name__}: {e}"))
+            if failures >= ACCOUNT_MAX_FAILURES:
+                return
+            continue
+        failures = 0
+        url_pos = rows.columns.index("detail_url")
+        payload = []
+        for values in rows.rows():
+            values = list(values)
+            values[url_pos] = canonical_url(values[url_pos], mobile_base)
+            payload.append(tuple(values))
+        results.put(("done", name, idx, (payload, time.perf_counter() - started)))
+
+
+class ShardCoordinator:
+    def __init__(self, accounts: Sequence[Dict], start_date: date, end_date: date,
+                 shard_days: int = SHARD_DAYS, parse_workers: int = SHARD_PARSE_WORKERS,
+                 archive_dir: Optional[str] = ts.ARCHIVE_DIR, log_config: Optional[Dict] = None,
+                 delay: float = ts.REQUEST_DELAY, queue_size: int = ts.PARSE_QUEUE_SIZE):
+        self.accounts = list(accounts)
+        self.shards = make_shards(start_date, end_date, shard_days)
+        self.options = {
+            "delay": delay,
+            "parse_workers": parse_workers,
+            "queue_size": queue_size,
+            "archive_dir": archive_dir,
+            "log": log_config or {},
+        }
+        # per akun: shard selesai, baris, detik kerja
+        self.stats: Dict[str, Dict[str, float]] = {
+            acc["name"]: {"shards": 0, "rows": 0, "seconds": 0.0, "failed": 0} for acc in self.accounts
+        }
+        self.failed_shards: List[Tuple[date, date]] = []
+
+    @property
+    def window(self) -> Tuple[str, str]:
+        """
+        Range tanggal (ISO) semua shard, untuk window snapshot tender_diff.
+        """
+        return self.shards[-1][0].isoformat(), self.shards[0][1].isoformat()
+
+    def snapshot_dir(self, snapshot_dir: Optional[str]) -> Optional[str]:
+        """
+        Snapshot delta hanya kalau semua shard berhasil; tender di shard yang
+        gagal akan terbaca sebagai "remove" kalau snapshot tetap ditulis.
+        """
+        if snapshot_dir and self.failed_shards:
+            log.warning("Snapshot delta dilewati karena ada shard gagal",
+                        extra={"failed_shards": len(self.failed_shards)})
+            return None
+        return snapshot_dir
+
+    def run(self) -> TenderBatch:
+        ctx = multiprocessing.get_context()
+        tasks, results = ctx.Queue(), ctx.Queue()
+        for idx, (start, end) in enumerate(self.shards):
+            tasks.put((idx, start.isoformat(), end.isoformat()))
+
+        workers = {}
+        for acc in self.accounts:
+            proc = ctx.Process(target=_shard_worker, args=(acc, tasks, results, self.options),
+                               name=f"shard-{acc['name']}")
+            proc.start()
+            workers[acc["name"]] = proc
+
+        done: Dict[int, list] = {}
+        attempts = [0] * len(self.shards)
+        running: Dict[str, int] = {}  # akun -> shard yang sedang dikerjakan
+        failed = set()
+
+        def retry(idx: int, reason: str) -> None:
+            attempts[idx] += 1
+            start, end = self.shards[idx]
+            if attempts[idx] > SHARD_RETRIES:
+                failed.add(idx)
+                log.error("Shard gagal permanen", extra={"shard": idx, "start": start.isoformat(),
+                                                         "end": end.isoformat(), "error": reason})
+            else:
+                log.warning("Shard dicoba ulang", extra={"shard": idx, "error": reason})
+                tasks.put((idx, start.isoformat(), end.isoformat()))
+
+        try:
+            with tender_log.span(log, "shard_scrape", logging.INFO,
+                                 accounts=len(self.accounts), shards=len(self.shards)) as sp:
+                while len(done) + len(failed) < len(self.shards):
+                    try:
+                        kind, name, idx, payload = results.get(timeout=1.0)
+                    except queue.Empty:
+                        alive = [n for n, p in workers.items() if p.is_alive()]
+                        for n in [n for n in running if n not in alive]:
+                            retry(running.pop(n), f"worker {n} berhenti")
+                        if not alive:
+                            raise RuntimeError("Semua worker berhenti sebelum shard selesai")
+                        continue
+
+                    if kind == "start":
+                        running[name] = idx
+                    elif kind == "failed":
+                        running.pop(name, None)
+                        self.stats[name]["failed"] += 1
+                        retry(idx, payload)
+                    else:
+                        running.pop(name, None)
+                        rows, seconds = payload
+                        done[idx] = rows
+                        st = self.stats[name]
+                        st["shards"] += 1
+                        st["rows"] += len(rows)
+                        st["seconds"] += seconds
+                        log.info("Shard selesai", extra={"shard": idx, "account": name, "rows": len(rows),
+                                                         "seconds": round(seconds, 2)})
+                sp.set(failed=len(failed))
+                self.failed_shards = [self.shards[i] for i in sorted(failed)]
+        finally:
+            for _ in workers:
+                tasks.put(None)
+            for proc in workers.values():
+                proc.join(timeout=30)
+                if proc.is_alive():
+                    proc.terminate()
+
+        return self.merge(done)
+
+    def merge(self, done: Dict[int, list]) -> TenderBatch:
+        """
+        Gabung hasil per shard sesuai urutan shard (terbaru dulu), detail_url unik.
+        """
+        merged = TenderBatch(SCRAPE_COLUMNS, SCRAPE_CATEGORIES)
+        url_pos = SCRAPE_COLUMNS.index("detail_url")
+        seen = set()
+        for idx in sorted(done):
+            for values in done[idx]:
+                url = values[url_pos]
+                if url in seen:
+                    continue
+                seen.add(url)
+                merged.add(*values)
+        return merged
+
+
+def stub_accounts(n: int, per_day: int, rate: float) -> Tuple[List[Dict], list]:
+    """
+    Jalankan n situs tiruan lokal (lihat tender_stubsite) dan satu akun per situs.
+    """
+    from tender_stubsite import start_stub
+
+    servers = [start_stub(per_day=per_day) for _ in range(n)]
+    accounts = [{"name": f"stub{i + 1}", "username": f"user{i + 1}", "password": "x",
+                 "base_url": server.base_url, "rate": rate} for i, server in enumerate(servers)]
+    return accounts, servers
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scraping paralel dengan beberapa akun / mirror.")
+    parser.add_argument("--accounts", default=DEFAULT_ACCOUNTS_FILE, help="file JSON daftar akun")
+    parser.add_argument("--start", default=ts.START_DATE_STR, help="tanggal awal (YYYY-MM-DD)")
+    parser.add_argument("--end", default=ts.END_DATE_STR, help="tanggal akhir (YYYY-MM-DD)")
+    parser.add_argument("--shard-days", type=int, default=SHARD_DAYS, help="jumlah hari per shard")
+    parser.add_argument("--parse-workers", type=int, default=SHARD_PARSE_WORKERS,
+                        help="proses parsing per akun")
+    parser.add_argument("-o", "--output", default=ts.OUTPUT_XLSX)
+    parser.add_argument("--writer", choices=ts.WRITERS, default=None,
+                        help="format output (default: dari ekstensi -o, selain itu xlsx)")
+    parser.add_argument("--no-archive", action="store_true", help="jangan simpan HTML mentah")
+    parser.add_argument("--stub", type=int, default=0, metavar="N",
+                        help="tes lokal: jalankan N situs tiruan, satu akun per situs")
+    parser.add_argument("--stub-per-day", type=int, default=10, help="tender per hari di situs tiruan")
+    parser.add_argument("--stub-rate", type=float, default=50.0, help="request/detik per akun tiruan")
+    tender_log.add_log_arguments(parser)
+    args = parser.parse_args(argv)
+    tender_log.configure_from_args(args)
+
+    servers = []
+    if args.stub:
+        accounts, servers = stub_accounts(args.stub, args.stub_per_day, args.stub_rate)
+    else:
+        accounts = load_accounts(args.accounts)
+
+    coordinator = ShardCoordinator(
+        accounts, ts.parse_date(args.start), ts.parse_date(args.end),
+        shard_days=args.shard_days, parse_workers=args.parse_workers,
+        archive_dir=None if args.no_archive or args.stub else ts.ARCHIVE_DIR,
+        log_config={"level": args.log_level, "json_output": args.log_json, "sample": args.trace_sample},
+    )
+    started = time.perf_counter()
+    try:
+        rows = coordinator.run()
+    finally:
+        for server in servers:
+            server.shutdown()
+    elapsed = time.perf_counter() - started
+
+    print(f"{'akun':12} {'shard':>6} {'baris':>7} {'detik':>8} {'gagal':>6}")
+    for name, st in coordinator.stats.items():
+        print(f"{name:12} {st['shards']:6d} {st['rows']:7d} {st['seconds']:8.1f} {st['failed']:6d}")
+    print(f"Total {len(rows)} tender dari {len(coordinator.shards)} shard dalam {elapsed:.1f} s")
+
+    for start, end in coordinator.failed_shards:
+        print(f"❌ Shard {start} s/d {end} gagal, belum ada di output")
+
+    if not rows:
+        log.warning("Tidak ada data dalam range tanggal ini.")
+        return 1
+    writer = args.writer
+    if writer is None:
+        ext = os.path.splitext(args.output)[1].lower().lstrip(".")
+        writer = ext if ext in ts.WRITERS else "xlsx"
+    ts.publish_rows(rows, args.output, writer=writer, store_db=ts.STORE_DB,
+                    snapshot_dir=coordinator.snapshot_dir(ts.SNAPSHOT_DIR), window=coordinator.window)
+    return 1 if coordinator.failed_shards else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,15 +1,25 @@
-import pandas as pd
+import argparse
+import sys
 import re
 from datetime import datetime
 
+from tender_records import TenderBatch
+import tender_io
+from tender_stats import TenderStats
+import tender_log
+
+log = tender_log.get_logger("simple")
+
 def parse_tender_data(text_content):
     """
     Fungsi parsing yang lebih sederhana dan akurat
     """
     lines = text_content.split('\n')
-    tenders = []
+    tenders = TenderBatch()
     current_sector = ""
     current_client = ""
+    # None kalau level trace tidak aktif (tanpa overhead per baris)
+    trace = tender_log.tracer(log)
     
     i = 0
     while i < len(lines):
@@ -27,6 +37,8 @@ def parse_tender_data(text_content):
             'GOVERNMENT' in line or 'GOVERMENT' in line):
             current_sector = line
             current_client = ""
+            if trace:
+                trace("sector", i, line, sector=current_sector)
             i += 1
             continue
         
@@ -41,6 +53,10 @@ def parse_tender_data(text_content):
             # Skip jika ini adalah sub-category government
             if not any(gov in line for gov in ['CENTRAL', 'PROVINCE', 'CITY', 'REGENCY', 'ALL']):
                 current_client = line
+                if trace:
+                    trace("client", i, line, client=current_client)
+            elif trace:
+                trace("sub-category", i, line)
             i += 1
             continue
         
@@ -74,57 +90,23 @@ def parse_tender_data(text_content):
                 sow = sow.strip()
                 title = title.strip()
                 
+                if trace:
+                    trace("tender", i, line, date=date, sow=sow, title=title)
+                
                 # Add to tenders
                 if current_sector and title:
-                    tenders.append({
-                        'Sector': current_sector,
-                        'Client': current_client if current_client else 'Tidak Diketahui',
-                        'Tanggal Rilis': date,
-                        'SOW': sow,
-                        'Judul Tender': title
-                    })
+                    tenders.add(
+                        current_sector,
+                        current_client if current_client else 'Tidak Diketahui',
+                        date,
+                        sow,
+                        title,
+                    )
         
         i += 1
     
     return tenders
 
-def debug_parse_tender_data(text_content):
-    """
-    Fungsi untuk debugging - lihat proses parsing
-    """
-    print("🔍 DEBUG MODE - Proses Parsing:")
-    print("=" * 80)
-    
-    lines = text_content.split('\n')
-    current_sector = ""
-    current_client = ""
-    
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if not line:
-            continue
-            
-        print(f"Line {i:2d}: {line}")
-        
-        # Detect sector
-        if (line in ['OIL & GAS', 'ELECTRICITY'] or 'GOVERNMENT' in line or 'GOVERMENT' in line):
-            current_sector = line
-            current_client = ""
-            print(f"   → SECTOR: {current_sector}")
-        
-        # Detect client
-        elif (current_sector and not current_client and 
-              not line.startswith('o') and not line.startswith('(') and
-              not re.search(r'\d{4}-\d{2}-\d{2}', line) and len(line) > 3):
-            current_client = line
-            print(f"   → CLIENT: {current_client}")
-        
-        # Parse tender
-        elif line.startswith('o') or '(' in line:
-            print(f"   → TENDER: {line}")
-    
-    print("=" * 80)
-
 def mac_input_mode():
     """
     Mode input untuk Mac
@@ -138,25 +120,45 @@ def mac_input_mode():
     print("-" * 60)
     print("Silakan paste data:")
     
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
-    
-    text_content = "\n".join(lines)
-    
-    # Tampilkan debug info
-    debug_parse_tender_data(text_content)
+    # baca sampai Ctrl + D sekaligus (lebih cepat dari loop input() untuk paste besar)
+    text_content = sys.stdin.read()
     
     return parse_tender_data(text_content)
 
+def batch_mode(args):
+    """
+    Mode non-interaktif: baca file/stdin sekaligus, tulis ke format pilihan.
+    """
+    text_content = tender_io.read_input(args.input)
+    tenders = parse_tender_data(text_content)
+    if not tenders:
+        tender_io.info("❌ Tidak ada data yang berhasil diproses.")
+        return 1
+
+    output, fmt = tender_io.resolve_output(args.output, args.format)
+    tender_io.write_output(tenders, output, fmt)
+    tender_io.info(f"✅ {len(tenders)} tender -> {output} ({fmt})")
+    if args.db:
+        tender_io.append_to_store(tenders, args.db, source=args.input or "-")
+    return 0
+
 def main():
     """
     Main function
     """
+    parser = argparse.ArgumentParser(description="Ekstrak data tender (versi simple) dari teks paste")
+    tender_io.add_io_arguments(parser)
+    tender_log.add_log_arguments(parser)
+    parser.add_argument("--debug", action="store_true",
+                        help="tampilkan trace parsing per baris (sama dengan --log-level trace)")
+    args = parser.parse_args()
+    if args.debug:
+        args.log_level = "trace"
+    tender_log.configure_from_args(args)
+
+    if tender_io.is_batch_mode(args):
+        return batch_mode(args)
+
     print("🚀 Memulai ekstraksi data tender...")
     
     tenders = mac_input_mode()
@@ -165,7 +167,7 @@ def main():
         print(f"\n✅ SUKSES: Ditemukan {len(tenders)} tender!")
         
         # Buat DataFrame
-        df = pd.DataFrame(tenders)
+        df = tenders.to_dataframe()
         df = df[['Sector', 'Client', 'Tanggal Rilis', 'SOW', 'Judul Tender']]
         
         # Simpan ke Excel
@@ -186,17 +188,17 @@ def main():
         print(f"   • Total Tenders: {len(tenders)}")
         
         # Tampilkan per sector
-        sector_count = {}
-        for tender in tenders:
-            sector = tender['Sector']
-            sector_count[sector] = sector_count.get(sector, 0) + 1
+        stats = TenderStats.from_records(tenders)
         
         print(f"   • Distribusi per Sector:")
-        for sector, count in sector_count.items():
+        for sector, count in stats.summary('sector'):
             print(f"      - {sector}: {count} tender")
+
+        if args.db:
+            tender_io.append_to_store(tenders, args.db, source="paste")
             
     else:
         print("❌ Tidak ada data yang berhasil diproses.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(main())
\ No newline at end of file
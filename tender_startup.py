@@ -0,0 +1,135 @@
+"""
+Benchmark waktu startup (import) script-script tender.
+
+Setiap modul di-import di interpreter baru dengan `python -X importtime`,
+diulang beberapa kali (diambil yang tercepat). Laporan: waktu import modul,
+wall-clock proses dibanding `python -c pass`, dan import langsung terberat.
+
+Contoh:
+    python tender_startup.py
+    python tender_startup.py tender_hybrid --top 15
+    python tender_startup.py --budget-ms 150     # exit 1 kalau ada yang lebih lambat
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ENTRY_MODULES = [
+    "tender",
+    "tender_extract",
+    "tender_simple",
+    "tender_hybrid",
+    "tender_scrapping",
+    "tender_watch",
+    "tender_api",
+    "tender_archive",
+    "tender_stats",
+]
+
+DEFAULT_RUNS = 5
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, int, int, str]]:
+    """
+    Baris 'import time: self | cumulative | <indent>nama' -> (self_us, cum_us, depth, nama).
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # baris header
+        name = parts[2].rstrip()
+        stripped = name.lstrip(" ")
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append((int(parts[0]), int(parts[1]), depth, stripped))
+    return entries
+
+
+def direct_imports(entries, module: str) -> List[Tuple[str, int]]:
+    """
+    Import langsung (depth 1) milik modul, urut dari yang terberat.
+    importtime mencetak anak sebelum induknya.
+    """
+    children = []
+    for _self, cum, depth, name in entries:
+        if depth == 0:
+            if name == module:
+                break
+            children = []
+        elif depth == 1:
+            children.append((name, cum))
+    return sorted(children, key=lambda x: x[1], reverse=True)
+
+
+def run_once(code: str, importtime: bool) -> Tuple[float, str]:
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    started = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=BASE_DIR, capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(f"Gagal menjalankan {code!r}:\n{proc.stderr.strip()[-2000:]}")
+    return elapsed, proc.stderr
+
+
+def measure(module: str, runs: int) -> Dict:
+    best_wall = float("inf")
+    best_entries = None
+    best_cum = None
+    for _ in range(runs):
+        wall, _ = run_once(f"import {module}", importtime=False)
+        best_wall = min(best_wall, wall)
+        _, stderr = run_once(f"import {module}", importtime=True)
+        entries = parse_importtime(stderr)
+        cum = next((c for _s, c, d, n in entries if d == 0 and n == module), 0)
+        if best_cum is None or cum < best_cum:
+            best_cum, best_entries = cum, entries
+    return {
+        "module": module,
+        "import_ms": best_cum / 1000,
+        "wall_ms": best_wall * 1000,
+        "imports": [(name, cum / 1000) for name, cum in direct_imports(best_entries, module)],
+    }
+
+
+def baseline_ms(runs: int) -> float:
+    return min(run_once("pass", importtime=False)[0] for _ in range(runs)) * 1000
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark waktu startup script tender.")
+    parser.add_argument("modules", nargs="*", default=ENTRY_MODULES)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--top", type=int, default=5, help="jumlah import terberat yang ditampilkan")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="batas waktu import per modul; exit 1 kalau terlewati")
+    parser.add_argument("--json", action="store_true", help="output JSON")
+    args = parser.parse_args(argv)
+
+    base = baseline_ms(args.runs)
+    results = [measure(m, args.runs) for m in args.modules]
+    over = [r["module"] for r in results if args.budget_ms is not None and r["import_ms"] > args.budget_ms]
+
+    if args.json:
+        print(json.dumps({"python_ms": base, "results": results, "over_budget": over}, indent=1))
+    else:
+        print(f"python -c pass: {base:.1f} ms (baseline)")
+        print(f"{'modul':20} {'import ms':>10} {'wall ms':>10}  import terberat")
+        for r in results:
+            heavy = ", ".join(f"{name} {ms:.1f}" for name, ms in r["imports"][:args.top])
+            print(f"{r['module']:20} {r['import_ms']:10.1f} {r['wall_ms']:10.1f}  {heavy}")
+        if over:
+            print(f"\n❌ Melebihi {args.budget_ms:.0f} ms: {', '.join(over)}")
+
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""
+Statistik tender: jumlah per sector, client, SOW dan tanggal rilis
+(harian / mingguan / bulanan).
+
+- TenderStats: hitungan in-memory untuk satu run (dipakai preview di CLI).
+- Di store (SQLite), hitungan yang sama disimpan di tabel tender_agg dan
+  di-update oleh trigger setiap kali tender ditambah/dihapus, jadi ringkasan
+  dashboard tidak perlu scan ulang semua data.
+
+Contoh:
+    python tender_stats.py --db tender_store.db --by sector --top 20
+    python tender_stats.py --db tender_store.db --by month
+"""
+import argparse
+from collections import Counter
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tender_records import TenderBatch
+
+DIMENSIONS = ("sector", "client", "sow", "day", "week", "month")
+
+# dimensi waktu diurutkan berdasarkan key, bukan jumlah
+TIME_DIMENSIONS = ("day", "week", "month")
+
+# kolom parser -> dimensi
+_SOURCE_COLUMNS = {
+    "sector": ("Sector", "sector"),
+    # client kosong (hasil scraping) -> project_owner, sama dengan tender_store.CLIENT_KEY
+    "client": ("Client", "client", "project_owner"),
+    "sow": ("SOW", "sow"),
+    "day": ("Tanggal Rilis", "release_date", "announce_date"),
+}
+
+
+def week_key(day: str) -> Optional[str]:
+    """
+    'YYYY-MM-DD' -> 'YYYY-Www' (minggu mulai Senin, sama dengan strftime %W di SQLite).
+    """
+    try:
+        return date.fromisoformat(day).strftime("%Y-W%W")
+    except (TypeError, ValueError):
+        return None
+
+
+def month_key(day: str) -> Optional[str]:
+    try:
+        return date.fromisoformat(day).strftime("%Y-%m")
+    except (TypeError, ValueError):
+        return None
+
+
+class TenderStats:
+    def __init__(self):
+        self.total = 0
+        self.counts: Dict[str, Counter] = {dim: Counter() for dim in DIMENSIONS}
+
+    def add(self, sector: str = "", client: str = "", sow: str = "", release_date: str = "") -> None:
+        self.total += 1
+        self.counts["sector"][sector] += 1
+        self.counts["client"][client] += 1
+        self.counts["sow"][sow] += 1
+        self._add_day(release_date, 1)
+
+    def _add_day(self, day: str, n: int) -> None:
+        week = week_key(day)
+        if week is None:
+            return
+        self.counts["day"][day] += n
+        self.counts["week"][week] += n
+        self.counts["month"][month_key(day)] += n
+
+    def add_records(self, records) -> "TenderStats":
+        """
+        Tambah banyak tender sekaligus. Untuk TenderBatch, hitungan diambil
+        langsung dari kolom (tanpa membuat dict per baris).
+        """
+        if isinstance(records, TenderBatch):
+            self.total += len(records)
+            for dim, candidates in _SOURCE_COLUMNS.items():
+                present = [c for c in candidates if c in records.columns]
+                if not present:
+                    continue
+                if len(present) == 1:
+                    counts = records.value_counts(present[0])
+                else:
+                    # mis. Client kosong + project_owner: nilai tidak kosong pertama per baris
+                    counts = Counter(next((v for v in values if v), "")
+                                     for values in zip(*(records.column(c) for c in present)))
+                if dim == "day":
+                    for day, n in counts.items():
+                        self._add_day(day, n)
+                else:
+                    self.counts[dim].update(counts)
+            return self
+
+        for rec in records:
+            values = {}
+            for dim, candidates in _SOURCE_COLUMNS.items():
+                values[dim] = next((rec[c] for c in candidates if rec.get(c)), "")
+            self.add(values["sector"], values["client"], values["sow"], values["day"])
+        return self
+
+    @classmethod
+    def from_records(cls, records) -> "TenderStats":
+        return cls().add_records(records)
+
+    def summary(self, dim: str, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        return sort_summary(dim, self.counts[dim].items(), limit)
+
+
+def sort_summary(dim: str, items: Iterable[Tuple[str, int]], limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    if dim in TIME_DIMENSIONS:
+        out = sorted(items)
+    else:
+        out = sorted(items, key=lambda kv: (-kv[1], kv[0]))
+    return out[:limit] if limit else out
+
+
+def main():
+    from tender_store import TenderStore, DEFAULT_DB
+
+    parser = argparse.ArgumentParser(description="Ringkasan tender dari store (tanpa scan ulang data).")
+    parser.add_argument("--db", default=DEFAULT_DB)
+    parser.add_argument("--by", choices=DIMENSIONS, default="sector")
+    parser.add_argument("--top", type=int, default=None)
+    args = parser.parse_args()
+
+    with TenderStore(args.db) as store:
+        print(f"Total tender: {store.count()}")
+        for key, n in store.summary(args.by, limit=args.top):
+            print(f"{n:8d}  {key or '-'}")
+
+
+if __name__ == "__main__":
+    main()
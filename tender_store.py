@@ -0,0 +1,565 @@
+"""
+Penyimpanan tender di SQLite (satu file, tanpa server).
+
+Satu tabel `tenders` menampung hasil dari semua sumber:
+- teks paste / file lokal (Sector, Client, Tanggal Rilis, SOW, Judul Tender)
+- hasil scraping (announce_date, title, detail_url, project_owner, ...)
+
+Append bersifat idempotent: setiap baris punya row_key, jadi file yang
+diproses ulang tidak membuat duplikat. Baris hasil scraping dikenali dari
+detail_url (scrape ulang meng-update field yang berubah, mis. closing_date,
+dan baris itu pindah ke id baru supaya konsumen incremental seperti
+tender_alerts dan ETag API ikut melihatnya); baris paste tanpa URL dikenali
+dari hash isinya. Mode WAL dipakai supaya
+proses lain bisa membaca sambil data ditambahkan.
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from tender_normalize import normalize_dates, normalize_values
+from tender_records import TenderBatch
+from tender_stats import sort_summary
+
+DEFAULT_DB = "tender_store.db"
+
+# kolom tabel (urutan tetap)
+STORE_COLUMNS = (
+    "sector",
+    "client",
+    "release_date",
+    "sow",
+    "title",
+    "detail_url",
+    "project_description",
+    "category",
+    "project_owner",
+    "qualification",
+    "estimation_value",
+    "location",
+    "closing_date",
+)
+
+# kolom hasil normalisasi (lihat tender_normalize.py), diisi otomatis saat append:
+# nilai estimasi dalam IDR dan tanggal penutupan ISO (NULL kalau tidak terbaca)
+NORMALIZED_COLUMNS = (
+    ("estimation_idr", "REAL"),
+    ("estimation_currency", "TEXT NOT NULL DEFAULT ''"),
+    ("closing_on", "TEXT"),
+)
+NORMALIZED_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_tenders_closing ON tenders(closing_on);
+CREATE INDEX IF NOT EXISTS idx_tenders_value ON tenders(estimation_idr);
+"""
+
+# nama kolom di parser -> nama kolom di store
+FIELD_MAP = {
+    "Sector": "sector",
+    "Client": "client",
+    "Tanggal Rilis": "release_date",
+    "SOW": "sow",
+    "Judul Tender": "title",
+    "announce_date": "release_date",
+    "title": "title",
+}
+for _col in STORE_COLUMNS:
+    FIELD_MAP.setdefault(_col, _col)
+
+# client efektif: baris hasil scraping hanya punya project_owner (client kosong),
+# sama dengan fallback TenderStats. Dipakai agregat client & filter search(client=...).
+CLIENT_KEY = "COALESCE(NULLIF(client, ''), project_owner)"
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS tenders (
+    id INTEGER PRIMARY KEY,
+    row_key TEXT NOT NULL UNIQUE,
+    {", ".join(f"{c} TEXT NOT NULL DEFAULT ''" for c in STORE_COLUMNS)},
+    {", ".join(f"{c} {decl}" for c, decl in NORMALIZED_COLUMNS)},
+    source TEXT NOT NULL DEFAULT '',
+    ingested_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tenders_release ON tenders(release_date);
+CREATE INDEX IF NOT EXISTS idx_tenders_sector ON tenders(sector, release_date);
+CREATE INDEX IF NOT EXISTS idx_tenders_client ON tenders(client, release_date);
+CREATE INDEX IF NOT EXISTS idx_tenders_client_key ON tenders({CLIENT_KEY}, release_date);
+CREATE INDEX IF NOT EXISTS idx_tenders_url ON tenders(detail_url);
+
+-- Statistik materialized (lihat tender_stats.py), di-update oleh trigger
+CREATE TABLE IF NOT EXISTS tender_agg (
+    dim TEXT NOT NULL,
+    key TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (dim, key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    rows INTEGER NOT NULL,
+    ingested_at REAL NOT NULL
+);
+"""
+
+# (dimensi, ekspresi SQL atas baris tender). Week/month NULL kalau tanggal tidak valid.
+AGG_EXPRESSIONS = (
+    ("total", "''"),
+    ("sector", "{r}.sector"),
+    ("client", "COALESCE(NULLIF({r}.client, ''), {r}.project_owner)"),
+    ("sow", "{r}.sow"),
+    ("day", "date({r}.release_date)"),
+    ("week", "strftime('%Y-W%W', {r}.release_date)"),
+    ("month", "strftime('%Y-%m', {r}.release_date)"),
+)
+
+# kolom yang dipakai AGG_EXPRESSIONS (trigger update hanya jalan kalau salah satunya berubah)
+AGG_SOURCE_COLUMNS = ("sector", "client", "project_owner", "sow", "release_date")
+
+
+def _agg_trigger_sql() -> str:
+    inserts = "\n".join(
+        f"    INSERT INTO tender_agg (dim, key, n) SELECT '{dim}', {expr.format(r='NEW')}, 1 "
+        f"WHERE {expr.format(r='NEW')} IS NOT NULL "
+        f"ON CONFLICT(dim, key) DO UPDATE SET n = n + 1;"
+        for dim, expr in AGG_EXPRESSIONS
+    )
+    deletes = "\n".join(
+        f"    UPDATE tender_agg SET n = n - 1 WHERE dim = '{dim}' AND key = {expr.format(r='OLD')};"
+        for dim, expr in AGG_EXPRESSIONS
+    )
+    return f"""
+CREATE TRIGGER IF NOT EXISTS trg_tenders_agg_insert AFTER INSERT ON tenders BEGIN
+{inserts}
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tenders_agg_delete AFTER DELETE ON tenders BEGIN
+{deletes}
+    DELETE FROM tender_agg WHERE n <= 0;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tenders_agg_update AFTER UPDATE OF {", ".join(AGG_SOURCE_COLUMNS)} ON tenders BEGIN
+{deletes}
+{inserts}
+    DELETE FROM tender_agg WHERE n <= 0;
+END;
+"""
+
+
+_VALUE_POS = STORE_COLUMNS.index("estimation_value")
+_CLOSING_POS = STORE_COLUMNS.index("closing_date")
+_URL_POS = STORE_COLUMNS.index("detail_url")
+
+# versi skema row_key (PRAGMA user_version); 1 = baris scraping dikunci detail_url
+ROW_KEY_VERSION = 1
+
+
+def url_key(detail_url: str) -> str:
+    return hashlib.sha1(f"url\x1f{detail_url}".encode("utf-8")).hexdigest()
+
+
+def row_key(values: Sequence[str]) -> str:
+    """
+    Identitas baris: detail_url kalau ada (stabil walau isi tender berubah),
+    selain itu hash seluruh isi (baris paste tanpa URL).
+    """
+    if values[_URL_POS]:
+        return url_key(values[_URL_POS])
+    h = hashlib.sha1("\x1f".join(values).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _upsert_sql() -> str:
+    """
+    INSERT baru; kalau row_key sudah ada, field yang berubah di-update dan
+    baris mendapat id baru (id > semua id lama, lihat rows_since). Nilai
+    kosong tidak menimpa isi lama (mis. halaman detail gagal diambil).
+    """
+    columns = STORE_COLUMNS + tuple(c for c, _ in NORMALIZED_COLUMNS)
+    placeholders = ", ".join("?" * (len(columns) + 3))
+    mutable = [c for c in STORE_COLUMNS if c != "detail_url"]
+    # kolom normalisasi ikut kolom mentahnya
+    derived = {"estimation_idr": "estimation_value", "estimation_currency": "estimation_value",
+               "closing_on": "closing_date"}
+    sets = ["id = (SELECT MAX(id) FROM tenders) + 1"]
+    sets += [f"{c} = COALESCE(NULLIF(excluded.{c}, ''), {c})" for c in mutable]
+    sets += [f"{c} = CASE WHEN excluded.{raw} != '' THEN excluded.{c} ELSE {c} END"
+             for c, raw in derived.items()]
+    changed = " OR ".join(f"(excluded.{c} != '' AND excluded.{c} != {c})" for c in mutable)
+    return (f"INSERT INTO tenders (row_key, {', '.join(columns)}, source, ingested_at) "
+            f"VALUES ({placeholders}) "
+            f"ON CONFLICT(row_key) DO UPDATE SET {', '.join(sets)} WHERE {changed}")
+
+
+def _to_store_rows(records) -> Iterable[Tuple[str, ...]]:
+    """
+    Ubah TenderBatch / list of dict menjadi tuple sesuai STORE_COLUMNS.
+    """
+    if isinstance(records, TenderBatch):
+        positions = {FIELD_MAP.get(col, col): i for i, col in enumerate(records.columns)}
+        for values in records.rows():
+            yield tuple(
+                str(values[positions[col]]) if col in positions and values[positions[col]] is not None else ""
+                for col in STORE_COLUMNS
+            )
+        return
+
+    for rec in records:
+        mapped = {FIELD_MAP.get(k, k): v for k, v in rec.items()}
+        yield tuple(str(mapped.get(col) or "") for col in STORE_COLUMNS)
+
+
+_UPSERT_SQL = _upsert_sql()
+
+# kolom yang diindeks full-text (pencarian keyword)
+FTS_COLUMNS = ("title", "sow", "client", "project_owner", "project_description")
+FTS_TRIGGERS = ("trg_tenders_fts_insert", "trg_tenders_fts_delete", "trg_tenders_fts_update")
+
+FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS tenders_fts USING fts5(
+    {", ".join(FTS_COLUMNS)}, content='tenders', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS trg_tenders_fts_insert AFTER INSERT ON tenders BEGIN
+    INSERT INTO tenders_fts (rowid, {", ".join(FTS_COLUMNS)})
+    VALUES (NEW.id, {", ".join("NEW." + c for c in FTS_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tenders_fts_delete AFTER DELETE ON tenders BEGIN
+    INSERT INTO tenders_fts (tenders_fts, rowid, {", ".join(FTS_COLUMNS)})
+    VALUES ('delete', OLD.id, {", ".join("OLD." + c for c in FTS_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS trg_tenders_fts_update AFTER UPDATE OF id, {", ".join(FTS_COLUMNS)} ON tenders BEGIN
+    INSERT INTO tenders_fts (tenders_fts, rowid, {", ".join(FTS_COLUMNS)})
+    VALUES ('delete', OLD.id, {", ".join("OLD." + c for c in FTS_COLUMNS)});
+    INSERT INTO tenders_fts (rowid, {", ".join(FTS_COLUMNS)})
+    VALUES (NEW.id, {", ".join("NEW." + c for c in FTS_COLUMNS)});
+END;
+"""
+
+
+def fts_query(keyword: str) -> str:
+    """
+    Keyword bebas -> query FTS5 aman: setiap kata jadi prefix term, digabung AND.
+    """
+    terms = re.findall(r"\w+", keyword, flags=re.UNICODE)
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+class TenderStore:
+    def __init__(self, path: str = DEFAULT_DB, readonly: bool = False):
+        self.path = path
+        self.readonly = readonly
+        self._lock = threading.Lock()
+
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+            self.has_fts = self._table_exists("tenders_fts")
+            self.has_normalized = not self._missing_normalized()
+            return
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._ensure_agg_triggers()
+        self.conn.commit()
+        self._ensure_url_keys()
+        self._ensure_normalized()
+        self.has_normalized = True
+        self._ensure_stats()
+        self.has_fts = self._ensure_fts()
+
+    def _table_exists(self, name: str) -> bool:
+        row = self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone()
+        return row is not None
+
+    def _missing_normalized(self) -> List[Tuple[str, str]]:
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(tenders)")}
+        return [(c, decl) for c, decl in NORMALIZED_COLUMNS if c not in existing]
+
+    def _ensure_normalized(self) -> None:
+        """
+        Store lama (sebelum ada kolom normalisasi): tambah kolom lalu isi dari data mentah.
+        """
+        missing = self._missing_normalized()
+        with self.conn:
+            for col, decl in missing:
+                self.conn.execute(f"ALTER TABLE tenders ADD COLUMN {col} {decl}")
+        self.conn.executescript(NORMALIZED_INDEXES)
+        if missing:
+            self.renormalize()
+
+    def renormalize(self) -> None:
+        """
+        Hitung ulang kolom normalisasi untuk semua baris (mis. setelah kurs USD diubah).
+        """
+        with self._lock:
+            ids, values, closing = [], [], []
+            for row_id, value, closing_date in self.conn.execute(
+                    "SELECT id, estimation_value, closing_date FROM tenders"):
+                ids.append(row_id)
+                values.append(value)
+                closing.append(closing_date)
+            idr, currency = normalize_values(values)
+            closing_on = normalize_dates(closing)
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE tenders SET estimation_idr = ?, estimation_currency = ?, closing_on = ? WHERE id = ?",
+                    [(idr[i], currency[i], closing_on[i] or None, ids[i]) for i in range(len(ids))],
+                )
+
+    def _ensure_fts(self) -> bool:
+        """
+        Buat index full-text (kalau SQLite mendukung FTS5); isi ulang untuk store lama.
+        Index dari versi lama (kolom FTS_COLUMNS berbeda) dibuat ulang.
+        """
+        existed = self._table_exists("tenders_fts")
+        if existed:
+            columns = tuple(row[1] for row in self.conn.execute("PRAGMA table_info(tenders_fts)"))
+            if columns != FTS_COLUMNS:
+                with self.conn:
+                    for trigger in FTS_TRIGGERS:
+                        self.conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                    self.conn.execute("DROP TABLE tenders_fts")
+                existed = False
+        try:
+            self.conn.executescript(FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            return False
+        if not existed:
+            with self.conn:
+                self.conn.execute("INSERT INTO tenders_fts (tenders_fts) VALUES ('rebuild')")
+        return True
+
+    def _ensure_agg_triggers(self) -> None:
+        """
+        Buat trigger statistik; trigger dari versi lama (ekspresi AGG_EXPRESSIONS
+        berbeda) diganti lalu statistik dihitung ulang.
+        """
+        row = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_tenders_agg_insert'"
+        ).fetchone()
+        outdated = row is not None and not all(expr.format(r="NEW") in row[0] for _, expr in AGG_EXPRESSIONS)
+        if outdated:
+            self.conn.execute("DROP TRIGGER trg_tenders_agg_insert")
+            self.conn.execute("DROP TRIGGER IF EXISTS trg_tenders_agg_delete")
+            self.conn.execute("DROP TRIGGER IF EXISTS trg_tenders_agg_update")
+        self.conn.executescript(_agg_trigger_sql())
+        if outdated:
+            self.rebuild_stats()
+
+    def _ensure_url_keys(self) -> None:
+        """
+        Store lama (row_key = hash isi untuk semua baris): baris scraping dengan
+        detail_url sama digabung (yang terbaru dipertahankan) lalu di-key ulang
+        dengan url_key.
+        """
+        version, = self.conn.execute("PRAGMA user_version").fetchone()
+        if version >= ROW_KEY_VERSION:
+            return
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM tenders WHERE detail_url != '' AND id NOT IN "
+                "(SELECT MAX(id) FROM tenders WHERE detail_url != '' GROUP BY detail_url)"
+            )
+            self.conn.executemany(
+                "UPDATE tenders SET row_key = ? WHERE id = ?",
+                [(url_key(url), row_id) for row_id, url in
+                 self.conn.execute("SELECT id, detail_url FROM tenders WHERE detail_url != ''").fetchall()],
+            )
+            self.conn.execute(f"PRAGMA user_version = {ROW_KEY_VERSION}")
+
+    def _ensure_stats(self) -> None:
+        """
+        Store lama (dibuat sebelum ada tender_agg): hitung statistik sekali.
+        """
+        has_rows = self.conn.execute("SELECT 1 FROM tenders LIMIT 1").fetchone()
+        has_agg = self.conn.execute("SELECT 1 FROM tender_agg LIMIT 1").fetchone()
+        if has_rows and not has_agg:
+            self.rebuild_stats()
+
+    def rebuild_stats(self) -> None:
+        selects = " UNION ALL ".join(
+            f"SELECT '{dim}' AS dim, {expr.format(r='t')} AS key FROM tenders t"
+            for dim, expr in AGG_EXPRESSIONS
+        )
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM tender_agg")
+            self.conn.execute(
+                f"INSERT INTO tender_agg (dim, key, n) "
+                f"SELECT dim, key, COUNT(*) FROM ({selects}) WHERE key IS NOT NULL GROUP BY dim, key"
+            )
+
+    def append(self, records, source: str = "") -> int:
+        """
+        Tambah tender ke store; tender scraping yang sudah ada (detail_url sama)
+        di-update. Return jumlah baris yang benar-benar baru.
+        """
+        now = time.time()
+        rows = list(_to_store_rows(records))
+        if not rows:
+            return 0
+
+        # normalisasi per kolom (parsing sekali per nilai unik)
+        idr, currency = normalize_values(r[_VALUE_POS] for r in rows)
+        closing_on = normalize_dates(r[_CLOSING_POS] for r in rows)
+        params = [
+            (row_key(values), *values, idr[i], currency[i], closing_on[i] or None, source, now)
+            for i, values in enumerate(rows)
+        ]
+
+        with self._lock, self.conn:
+            # rowcount ikut menghitung baris yang di-update, jadi baris baru
+            # dihitung dari selisih total
+            before = self._total()
+            self.conn.executemany(_UPSERT_SQL, params)
+            return self._total() - before
+
+    def _total(self) -> int:
+        row = self.conn.execute("SELECT n FROM tender_agg WHERE dim = 'total'").fetchone()
+        return row[0] if row else 0
+
+    def count(self) -> int:
+        with self._lock:
+            row = self.conn.execute("SELECT n FROM tender_agg WHERE dim = 'total'").fetchone()
+        return row[0] if row else 0
+
+    def summary(self, dim: str, limit: Optional[int] = None,
+                start: Optional[str] = None, end: Optional[str] = None) -> List[Tuple[str, int]]:
+        """
+        Ringkasan materialized per dimensi (lihat tender_stats.DIMENSIONS).
+        Untuk dimensi waktu bisa dibatasi start/end (key inklusif).
+        """
+        sql = "SELECT key, n FROM tender_agg WHERE dim = ?"
+        params: list = [dim]
+        if start:
+            sql += " AND key >= ?"
+            params.append(start)
+        if end:
+            sql += " AND key <= ?"
+            params.append(end)
+        with self._lock:
+            items = self.conn.execute(sql, params).fetchall()
+        return sort_summary(dim, items, limit)
+
+    # ---------- file tracking (dipakai watcher) ----------
+
+    def file_seen(self, path: str, size: int, mtime: float) -> bool:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT size, mtime FROM ingested_files WHERE path = ?", (path,)
+            ).fetchone()
+        return row is not None and row[0] == size and row[1] == mtime
+
+    def mark_file(self, path: str, size: int, mtime: float, rows: int) -> None:
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO ingested_files (path, size, mtime, rows, ingested_at) VALUES (?, ?, ?, ?, ?)",
+                (path, size, mtime, rows, time.time()),
+            )
+
+    def version(self) -> str:
+        """
+        Penanda versi data (berubah setiap ada tambah/hapus); dipakai untuk ETag.
+        """
+        with self._lock:
+            max_id, = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM tenders").fetchone()
+            row = self.conn.execute("SELECT n FROM tender_agg WHERE dim = 'total'").fetchone()
+        return f"{max_id}-{row[0] if row else 0}"
+
+    def search(self, start: Optional[str] = None, end: Optional[str] = None,
+               sector: Optional[str] = None, client: Optional[str] = None,
+               keyword: Optional[str] = None, limit: int = 50, offset: int = 0,
+               closing_start: Optional[str] = None, closing_end: Optional[str] = None,
+               min_value: Optional[float] = None, max_value: Optional[float] = None,
+               ) -> Tuple[int, List[Dict[str, str]]]:
+        """
+        Cari tender (filter tanggal rilis, sector, client, keyword, tanggal
+        penutupan ISO, nilai estimasi IDR). Return (jumlah total yang cocok,
+        baris halaman ini), urut tanggal terbaru dulu.
+        """
+        where: List[str] = []
+        params: list = []
+        normalized_filters = (("closing_on >= ?", closing_start), ("closing_on <= ?", closing_end),
+                              ("estimation_idr >= ?", min_value), ("estimation_idr <= ?", max_value))
+        for cond, value in normalized_filters:
+            if value is None or value == "":
+                continue
+            if not self.has_normalized:
+                raise ValueError("Store belum punya kolom normalisasi; buka sekali tanpa readonly untuk migrasi")
+            where.append(cond)
+            params.append(value)
+        if start:
+            where.append("release_date >= ?")
+            params.append(start)
+        if end:
+            where.append("release_date <= ?")
+            params.append(end)
+        if sector:
+            where.append("sector = ?")
+            params.append(sector)
+        if client:
+            where.append(f"{CLIENT_KEY} = ?")
+            params.append(client)
+        if keyword:
+            if self.has_fts and fts_query(keyword):
+                where.append("id IN (SELECT rowid FROM tenders_fts WHERE tenders_fts MATCH ?)")
+                params.append(fts_query(keyword))
+            else:
+                where.append(f"({' OR '.join(f'{c} LIKE ?' for c in FTS_COLUMNS)})")
+                params.extend([f"%{keyword}%"] * len(FTS_COLUMNS))
+
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        with self._lock:
+            total, = self.conn.execute(f"SELECT COUNT(*) FROM tenders{clause}", params).fetchone()
+            extra = "".join(f", {c}" for c, _ in NORMALIZED_COLUMNS) if self.has_normalized else ""
+            cur = self.conn.execute(
+                f"SELECT id, {', '.join(STORE_COLUMNS)}{extra}, source FROM tenders{clause} "
+                f"ORDER BY release_date DESC, id DESC LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            )
+            names = [d[0] for d in cur.description]
+            rows = [dict(zip(names, r)) for r in cur.fetchall()]
+        return total, rows
+
+    def rows_since(self, last_id: int, columns: Sequence[str], limit: int = 10000,
+                   closing_after: Optional[str] = None) -> List[Dict]:
+        """
+        Baris dengan id > last_id (urut id), untuk konsumen incremental
+        (mis. tender_alerts): cukup simpan id terakhir, tanpa scan ulang.
+        Baris yang berubah karena scrape ulang muncul lagi (id-nya baru).
+        closing_after (ISO) = hanya tender yang tutup setelah tanggal itu.
+        """
+        allowed = {"id", "row_key", "source", "ingested_at", *STORE_COLUMNS, *(c for c, _ in NORMALIZED_COLUMNS)}
+        unknown = [c for c in columns if c not in allowed]
+        if unknown:
+            raise ValueError(f"Kolom tidak dikenal: {', '.join(unknown)}")
+        cols = ["id"] + [c for c in columns if c != "id"]
+        where, params = "id > ?", [last_id]
+        if closing_after:
+            where += " AND closing_on > ?"
+            params.append(closing_after)
+        with self._lock:
+            cur = self.conn.execute(
+                f"SELECT {', '.join(cols)} FROM tenders WHERE {where} ORDER BY id LIMIT ?", params + [limit]
+            )
+            return [dict(zip(cols, r)) for r in cur.fetchall()]
+
+    def rows(self, where: str = "", params: Sequence = ()) -> List[Dict[str, str]]:
+        sql = f"SELECT {', '.join(STORE_COLUMNS)}, source FROM tenders"
+        if where:
+            sql += f" WHERE {where}"
+        sql += " ORDER BY id"
+        with self._lock:
+            cur = self.conn.execute(sql, tuple(params))
+            names = [d[0] for d in cur.description]
+            return [dict(zip(names, r)) for r in cur.fetchall()]
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self) -> "TenderStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
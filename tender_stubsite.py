@@ -0,0 +1,192 @@
+"""
+Situs tiruan tender-indonesia.com untuk tes lokal scraper (tender_scrapping,
+tender_shard) tanpa akses ke situs asli.
+
+- GET  /Project_room/index.php          : form login (dengan hidden token)
+- POST /Project_room/index.php          : login -> cookie sesi + teks "Logout"
+- GET  /m/tender-YYYY-MM-DD, /m/tender.php : halaman list harian
+- GET  /m/detail.php?id=YYYY-MM-DD-N    : halaman detail
+- GET  /_stats                          : jumlah request per user (JSON)
+
+Halaman list/detail tanpa cookie sesi dijawab 403. Isi halaman deterministik
+dari tanggal, jadi beberapa stub (mirror) mengembalikan data yang sama. Seperti
+situs aslinya, halaman list juga memuat beberapa tender hari sebelumnya.
+
+Contoh:
+    python tender_stubsite.py --port 8081 --per-day 20
+"""
+import argparse
+import hashlib
+import json
+import secrets
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from tender_scrapping import LOGIN_PATH, LOGIN_USER_FIELD
+
+DEFAULT_PER_DAY = 10
+
+# jumlah tender hari sebelumnya yang ikut tampil di halaman list
+SPILL_PER_PAGE = 3
+
+_WORDS = ("Pembangunan", "Pengadaan", "Jasa", "Konsultan", "Pipa", "Gardu", "Jalan", "Jembatan",
+          "Gedung", "Pemeliharaan", "Instalasi", "Survey", "Rig", "Trafo", "Dermaga", "Tangki")
+_OWNERS = ("PT PERTAMINA HULU ROKAN", "PT PLN (PERSERO)", "PT JASA MARGA", "PT PGN", "KEMENTERIAN PUPR")
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode(), digest_size=8).digest()
+
+
+def tender_title(day: date, n: int) -> str:
+    h = _digest(f"{day}-{n}")
+    return " ".join(_WORDS[b % len(_WORDS)] for b in h[:5]) + f" Paket {n + 1}"
+
+
+def list_html(day: date, per_day: int) -> str:
+    items = [(day, n) for n in range(per_day)]
+    prev = day - timedelta(days=1)
+    items += [(prev, n) for n in range(min(SPILL_PER_PAGE, per_day))]
+    anchors = "\n".join(
+        f'<li><a href="detail.php?id={d}-{n}">{d:%d-%m-%Y} - {tender_title(d, n)}</a></li>' for d, n in items
+    )
+    return f"<html><body><h3>Tender {day:%d-%m-%Y}</h3><ul>\n{anchors}\n</ul></body></html>"
+
+
+def detail_html(day: date, n: int) -> str:
+    h = _digest(f"detail-{day}-{n}")
+    closing = day + timedelta(days=7 + h[0] % 21)
+    fields = [
+        ("Project Description", tender_title(day, n)),
+        ("Category", ("Konstruksi", "Pengadaan", "Jasa")[h[1] % 3]),
+        ("Project Owner", _OWNERS[h[2] % len(_OWNERS)]),
+        ("Qualification", ("Kecil", "Menengah", "Besar")[h[3] % 3]),
+        ("Estimation Value", f"Rp {1 + h[4] % 90} M"),
+        ("Location", ("Jakarta", "Riau", "Kalimantan Timur", "Jawa Barat")[h[5] % 4]),
+        ("Closing Date", f"{closing:%d %b %Y}"),
+    ]
+    body = "".join(f"<p>{label} : {value}</p>" for label, value in fields)
+    return f"<html><body><h3>{tender_title(day, n)}</h3>{body}</body></html>"
+
+
+class StubSite(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], per_day: int = DEFAULT_PER_DAY, latency: float = 0.0):
+        super().__init__(address, _Handler)
+        self.per_day = per_day
+        self.latency = latency
+        self.sessions: Dict[str, str] = {}  # token -> user
+        self.requests: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, user: str) -> None:
+        with self._lock:
+            self.requests[user] = self.requests.get(user, 0) + 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StubSite
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status: int, body: str, headers: Optional[Dict[str, str]] = None) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _user(self) -> Optional[str]:
+        for part in self.headers.get("Cookie", "").split(";"):
+            key, _, value = part.strip().partition("=")
+            if key == "sid":
+                return self.server.sessions.get(value)
+        return None
+
+    def do_POST(self):
+        if urlsplit(self.path).path != LOGIN_PATH:
+            return self._send(404, "not found")
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        user = (form.get(LOGIN_USER_FIELD) or [""])[0]
+        if not user or "token" not in form:
+            return self._send(200, "<html><body>Login gagal</body></html>")
+        token = secrets.token_hex(8)
+        self.server.sessions[token] = user
+        self._send(200, f"<html><body>Welcome {user} | Logout</body></html>",
+                   {"Set-Cookie": f"sid={token}; Path=/"})
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path = parts.path
+        if path == LOGIN_PATH:
+            return self._send(200, '<html><body><form method="post">'
+                                   f'<input type="hidden" name="token" value="{secrets.token_hex(4)}">'
+                                   "</form></body></html>")
+        if path == "/_stats":
+            return self._send(200, json.dumps(self.server.requests))
+
+        user = self._user()
+        if user is None:
+            return self._send(403, "login dulu")
+        self.server.count(user)
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        try:
+            if path == "/m/tender.php":
+                return self._send(200, list_html(date.today(), self.server.per_day))
+            if path.startswith("/m/tender-"):
+                return self._send(200, list_html(date.fromisoformat(path[len("/m/tender-"):]),
+                                                 self.server.per_day))
+            if path == "/m/detail.php":
+                day, _, n = parse_qs(parts.query).get("id", [""])[0].rpartition("-")
+                return self._send(200, detail_html(date.fromisoformat(day), int(n)))
+        except ValueError:
+            pass
+        self._send(404, "not found")
+
+
+def start_stub(per_day: int = DEFAULT_PER_DAY, host: str = "127.0.0.1", port: int = 0,
+               latency: float = 0.0) -> StubSite:
+    """
+    Jalankan stub di thread background (port 0 = port bebas). Hentikan dengan .shutdown().
+    """
+    server = StubSite((host, port), per_day=per_day, latency=latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Situs tiruan tender-indonesia untuk tes lokal.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--per-day", type=int, default=DEFAULT_PER_DAY, help="jumlah tender per hari")
+    parser.add_argument("--latency", type=float, default=0.0, help="jeda tiap respon (detik)")
+    args = parser.parse_args()
+
+    server = StubSite((args.host, args.port), per_day=args.per_day, latency=args.latency)
+    print(f"Stub jalan di {server.base_url} (Ctrl+C untuk berhenti)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
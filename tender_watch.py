@@ -0,0 +1,252 @@
+"""
+Daemon watch-folder: setiap file .html/.htm/.txt baru di folder langsung
+diparsing dan ditambahkan ke store (SQLite).
+
+Pakai inotify (Linux) kalau tersedia, selain itu polling. File baru diproses
+setelah ukurannya tidak berubah selama DEBOUNCE_SECONDS, supaya file yang
+masih ditulis/dicopy tidak terbaca setengah.
+
+Contoh:
+    python tender_watch.py /mnt/shared/tender --db tender_store.db
+    python tender_watch.py /mnt/shared/tender --sector-map sector_map.json   # belajar client -> sector
+"""
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import tender_hybrid
+import tender_log
+from tender_hybrid import extract_tender_items_from_lines, read_lines_from_file
+from tender_store import TenderStore, DEFAULT_DB
+from tender_watchlist import route_if_configured
+
+WATCH_EXTS = (".html", ".htm", ".txt")
+
+# File dianggap selesai ditulis kalau tidak berubah selama ini (detik)
+DEBOUNCE_SECONDS = 1.0
+
+# Interval scan untuk mode polling (detik)
+POLL_INTERVAL = 1.0
+
+log = tender_log.get_logger("watch")
+
+# inotify constants (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_candidate(name: str) -> bool:
+    return name.lower().endswith(WATCH_EXTS) and not name.startswith(".")
+
+
+class InotifyWatcher:
+    """
+    Bungkus tipis inotify via ctypes (tanpa dependency tambahan).
+    """
+
+    def __init__(self, folder: str):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc tidak ditemukan")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify tidak tersedia")
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 gagal")
+
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        wd = libc.inotify_add_watch(self.fd, os.fsencode(folder), mask)
+        if wd < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch gagal untuk {folder}")
+
+    def wait(self, timeout: float) -> List[str]:
+        """
+        Tunggu event sampai timeout; return nama file yang berubah.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        names = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            _wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            name = buf[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+            offset += length
+            if name:
+                names.append(name)
+        return names
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def scan_folder(folder: str) -> Iterator[Tuple[str, int, float]]:
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_file() and is_candidate(entry.name):
+                st = entry.stat()
+                yield entry.path, st.st_size, st.st_mtime
+
+
+def ingest_file(store: TenderStore, path: str) -> int:
+    """
+    Parse satu file & tambahkan ke store. Return jumlah tender baru.
+    """
+    lines = read_lines_from_file(path)
+    tenders = extract_tender_items_from_lines(lines)
+    added = store.append(tenders, source=os.path.basename(path))
+    route_if_configured(tenders, source=os.path.basename(path))
+    return added
+
+
+class FolderWatcher:
+    def __init__(self, folder: str, store: TenderStore,
+                 debounce: float = DEBOUNCE_SECONDS, poll_interval: float = POLL_INTERVAL,
+                 use_inotify: bool = True):
+        self.folder = folder
+        self.store = store
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+
+        # path -> (size, mtime, waktu terakhir berubah)
+        self._pending: Dict[str, Tuple[int, float, float]] = {}
+
+        self._inotify: Optional[InotifyWatcher] = None
+        if use_inotify:
+            try:
+                self._inotify = InotifyWatcher(folder)
+            except (OSError, AttributeError) as e:
+                log.warning("inotify tidak bisa dipakai, pakai polling", extra={"error": str(e)})
+
+    @property
+    def mode(self) -> str:
+        return "inotify" if self._inotify else "polling"
+
+    def _touch(self, path: str, now: float) -> None:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._pending.pop(path, None)
+            return
+
+        prev = self._pending.get(path)
+        if prev is None or prev[0] != st.st_size or prev[1] != st.st_mtime:
+            if prev is None and self.store.file_seen(path, st.st_size, st.st_mtime):
+                return
+            self._pending[path] = (st.st_size, st.st_mtime, now)
+
+    def _ready(self, now: float) -> List[str]:
+        ready = []
+        for path, (size, mtime, changed_at) in list(self._pending.items()):
+            if now - changed_at < self.debounce:
+                continue
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                del self._pending[path]
+                continue
+            if st.st_size != size or st.st_mtime != mtime:
+                # masih ditulis
+                self._pending[path] = (st.st_size, st.st_mtime, now)
+                continue
+            ready.append(path)
+        return ready
+
+    def _process(self, path: str) -> None:
+        size, mtime, _ = self._pending.pop(path)
+        started = time.perf_counter()
+        try:
+            added = ingest_file(self.store, path)
+            self.store.mark_file(path, size, mtime, added)
+            tender_hybrid.SECTOR_RESOLVER.save()
+        except (OSError, UnicodeDecodeError) as e:
+            log.warning("Gagal membaca file", extra={"path": path, "error": str(e)})
+            return
+        except Exception as e:
+            # file rusak / error parser / error SQLite: catat, daemon jalan terus
+            log.error("Gagal memproses file", extra={"path": path, "error": f"{type(e).__name__}: {e}"},
+                      exc_info=True)
+            return
+        elapsed = time.perf_counter() - started
+        log.info("File diproses", extra={"file": os.path.basename(path), "new_rows": added,
+                                         "seconds": round(elapsed, 2)})
+
+    def run_once(self, timeout: float) -> None:
+        if self._inotify:
+            for name in self._inotify.wait(timeout):
+                if is_candidate(name):
+                    self._touch(os.path.join(self.folder, name), time.time())
+        else:
+            time.sleep(timeout)
+            now = time.time()
+            for path, _size, _mtime in scan_folder(self.folder):
+                self._touch(path, now)
+
+        for path in self._ready(time.time()):
+            self._process(path)
+
+    def run(self) -> None:
+        # file yang sudah ada saat start juga diproses (kalau belum pernah)
+        now = time.time()
+        for path, _size, _mtime in scan_folder(self.folder):
+            self._touch(path, now - self.debounce)
+
+        log.info("Memantau folder", extra={"folder": self.folder, "mode": self.mode, "store": self.store.path})
+        while True:
+            # saat ada file pending, bangun lebih cepat untuk cek debounce
+            timeout = min(self.poll_interval, self.debounce / 2) if self._pending else self.poll_interval
+            self.run_once(timeout)
+
+    def close(self) -> None:
+        if self._inotify:
+            self._inotify.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pantau folder & parse file tender baru secara otomatis.")
+    parser.add_argument("folder", help="folder yang dipantau")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"file SQLite store (default: {DEFAULT_DB})")
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE_SECONDS,
+                        help="detik file harus stabil sebelum diproses")
+    parser.add_argument("--poll", action="store_true", help="paksa mode polling (mis. untuk network share)")
+    parser.add_argument("--poll-interval", type=float, default=POLL_INTERVAL)
+    parser.add_argument("--sector-map",
+                        help="peta client -> sector yang dipelajari & disimpan (JSON); default: tidak dipakai")
+    tender_log.add_log_arguments(parser)
+    args = parser.parse_args()
+    tender_log.configure_from_args(args)
+    tender_hybrid.use_sector_map(args.sector_map)
+
+    store = TenderStore(args.db)
+    watcher = FolderWatcher(args.folder, store, debounce=args.debounce,
+                            poll_interval=args.poll_interval, use_inotify=not args.poll)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        log.info("Berhenti")
+    finally:
+        watcher.close()
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Watchlist per user: tender yang cocok dengan keyword/client pilihan langsung
+dikirim ke file output masing-masing saat data masuk (ingest).
+
+File watchlists.json:
+    {
+      "andi": ["PERTAMINA + pipeline", "PLN + substation"],
+      "budi": {"rules": ["PGN", ["WIKA", "jalan tol"]], "output": "budi_tender.jsonl"}
+    }
+
+Satu aturan = beberapa kata yang semuanya harus ada (AND, dipisah " + "),
+aturan-aturan satu user digabung OR. Pencocokan tidak case-sensitive dan per
+kata utuh ("PLN" tidak cocok dengan "PLNX").
+
+Semua kata dari semua user dikompilasi jadi satu automaton (tender_automaton),
+jadi setiap tender cukup di-scan sekali. Setiap aturan diindeks di bawah satu
+kata "anchor" (yang paling jarang dipakai), sehingga yang dicek hanya aturan
+yang anchor-nya muncul; biaya hampir tidak bertambah walau watchlist ribuan.
+
+Contoh:
+    python tender_watchlist.py info
+    python tender_watchlist.py route dump.txt halaman.html hasil.jsonl
+"""
+import argparse
+import json
+import os
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import tender_log
+from tender_automaton import KeywordAutomaton
+from tender_records import TenderBatch
+
+DEFAULT_WATCHLIST_FILE = "watchlists.json"
+DEFAULT_OUTPUT_DIR = "watch_output"
+
+# field tender yang dicocokkan (paste/hybrid maupun hasil scraping)
+MATCH_FIELDS = (
+    "Sector", "Client", "SOW", "Judul Tender",
+    "title", "project_description", "category", "project_owner", "location",
+    "sector", "client", "sow",
+)
+
+log = tender_log.get_logger("watchlist")
+
+
+def normalize_term(term: str) -> str:
+    return " ".join(term.upper().split())
+
+
+def parse_rule(rule) -> Tuple[str, ...]:
+    """
+    "PERTAMINA + pipeline" atau ["PERTAMINA", "pipeline"] -> ("PERTAMINA", "PIPELINE").
+    """
+    parts = rule.split("+") if isinstance(rule, str) else rule
+    terms = tuple(dict.fromkeys(t for t in (normalize_term(p) for p in parts) if t))
+    if not terms:
+        raise ValueError(f"Aturan watchlist kosong: {rule!r}")
+    return terms
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum()
+
+
+class WatchlistMatcher:
+    def __init__(self):
+        self.users: Dict[str, Dict] = {}
+        self._rules: List[Tuple[str, Tuple[int, ...], str]] = []  # (user, term ids, label)
+        self._terms: Dict[str, int] = {}
+        self._by_anchor: Dict[int, List[int]] = {}
+        self._automaton: Optional[KeywordAutomaton] = None
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    # ---------- builder ----------
+
+    def add_user(self, user: str, rules: Iterable, output: Optional[str] = None) -> None:
+        self.users[user] = {"output": output}
+        for rule in rules:
+            terms = parse_rule(rule)
+            ids = tuple(self._terms.setdefault(t, len(self._terms)) for t in terms)
+            self._rules.append((user, ids, " + ".join(terms)))
+        self._automaton = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "WatchlistMatcher":
+        matcher = cls()
+        for user, spec in data.items():
+            if isinstance(spec, dict):
+                matcher.add_user(user, spec.get("rules", []), spec.get("output"))
+            else:
+                matcher.add_user(user, spec)
+        return matcher.build()
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_WATCHLIST_FILE) -> "WatchlistMatcher":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def build(self) -> "WatchlistMatcher":
+        automaton = KeywordAutomaton()
+        for term, term_id in self._terms.items():
+            automaton.add(term, (term_id, len(term)))
+        automaton.build()
+
+        # anchor = kata yang paling sedikit dipakai aturan lain
+        usage = Counter(t for _user, ids, _label in self._rules for t in ids)
+        by_anchor: Dict[int, List[int]] = {}
+        for rule_id, (_user, ids, _label) in enumerate(self._rules):
+            anchor = min(ids, key=lambda t: usage[t])
+            by_anchor.setdefault(anchor, []).append(rule_id)
+
+        self._by_anchor = by_anchor
+        self._automaton = automaton
+        return self
+
+    # ---------- matching ----------
+
+    def terms_in(self, text: str) -> set:
+        """
+        Id kata watchlist yang muncul (sebagai kata utuh) di text (sudah uppercase).
+        """
+        if self._automaton is None:
+            self.build()
+        found = set()
+        n = len(text)
+        for end, (term_id, length) in self._automaton.iter_matches(text):
+            if term_id in found:
+                continue
+            start = end - length + 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end + 1 < n and _is_word_char(text[end + 1]):
+                continue
+            found.add(term_id)
+        return found
+
+    def match_text(self, text: str) -> Dict[str, List[str]]:
+        """
+        user -> label aturan yang cocok.
+        """
+        found = self.terms_in(" ".join(text.upper().split()))
+        if not found:
+            return {}
+        result: Dict[str, List[str]] = {}
+        rules, by_anchor = self._rules, self._by_anchor
+        for term_id in found:
+            for rule_id in by_anchor.get(term_id, ()):
+                user, ids, label = rules[rule_id]
+                if all(t in found for t in ids):
+                    result.setdefault(user, []).append(label)
+        return result
+
+    def match(self, record: Dict) -> Dict[str, List[str]]:
+        text = " | ".join(str(record[f]) for f in MATCH_FIELDS if record.get(f))
+        return self.match_text(text)
+
+    def match_records(self, records) -> Iterable[Tuple[Dict, Dict[str, List[str]]]]:
+        """
+        Yield (record, {user: [aturan]}) untuk setiap tender yang cocok dengan minimal satu user.
+        """
+        if isinstance(records, TenderBatch):
+            fields = [i for i, col in enumerate(records.columns) if col in MATCH_FIELDS]
+            cols = records.columns
+            for values in records.rows():
+                text = " | ".join(str(values[i]) for i in fields if values[i])
+                matched = self.match_text(text)
+                if matched:
+                    yield dict(zip(cols, values)), matched
+            return
+
+        for record in records:
+            matched = self.match(record)
+            if matched:
+                yield record, matched
+
+
+class WatchlistRouter:
+    """
+    Tulis tender yang cocok ke file JSONL per user (append).
+    """
+
+    def __init__(self, matcher: WatchlistMatcher, output_dir: str = DEFAULT_OUTPUT_DIR):
+        self.matcher = matcher
+        self.output_dir = output_dir
+
+    def output_path(self, user: str) -> str:
+        custom = self.matcher.users.get(user, {}).get("output")
+        if custom:
+            return custom if os.path.isabs(custom) else os.path.join(self.output_dir, custom)
+        safe = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in user)
+        return os.path.join(self.output_dir, f"{safe}.jsonl")
+
+    def route(self, records, source: str = "") -> Dict[str, int]:
+        """
+        Return jumlah tender per user yang ditulis.
+        """
+        per_user: Dict[str, List[str]] = {}
+        for record, matched in self.matcher.match_records(records):
+            for user, rules in matched.items():
+                line = dict(record, watch_rules=rules, watch_source=source)
+                per_user.setdefault(user, []).append(json.dumps(line, ensure_ascii=False))
+
+        if per_user:
+            os.makedirs(self.output_dir, exist_ok=True)
+        for user, lines in per_user.items():
+            with open(self.output_path(user), "a", encoding="utf-8") as f:
+                f.write("\n".join(lines))
+                f.write("\n")
+        counts = {user: len(lines) for user, lines in per_user.items()}
+        if counts:
+            log.info("Tender watchlist", extra={"source": source, "users": len(counts),
+                                                "matches": sum(counts.values())})
+        return counts
+
+
+_router_cache: Dict[Tuple[str, str], Tuple[float, WatchlistRouter]] = {}
+
+
+def route_if_configured(records, source: str = "", path: str = DEFAULT_WATCHLIST_FILE,
+                        output_dir: str = DEFAULT_OUTPUT_DIR) -> Dict[str, int]:
+    """
+    Dipanggil di titik ingest (hybrid, watch folder, scrape). Tidak melakukan
+    apa-apa kalau file watchlist tidak ada; dikompilasi ulang kalau file berubah.
+    """
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return {}
+    key = (path, output_dir)
+    cached = _router_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        try:
+            router = WatchlistRouter(WatchlistMatcher.from_file(path), output_dir)
+        except (OSError, ValueError) as e:
+            log.error("Watchlist tidak bisa dibaca", extra={"path": path, "error": str(e)})
+            return {}
+        cached = _router_cache[key] = (mtime, router)
+    return cached[1].route(records, source)
+
+
+def _read_records(path: str):
+    if path.lower().endswith(".jsonl"):
+        with open(path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    from tender_hybrid import extract_tender_items_from_lines, read_lines_from_file
+    return extract_tender_items_from_lines(read_lines_from_file(path))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Watchlist tender per user.")
+    parser.add_argument("--watchlists", default=DEFAULT_WATCHLIST_FILE)
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    tender_log.add_log_arguments(parser)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("info", help="ringkasan watchlist yang dikompilasi")
+    p_route = sub.add_parser("route", help="cocokkan file (.txt/.html/.jsonl) dan tulis ke output per user")
+    p_route.add_argument("files", nargs="+")
+    args = parser.parse_args(argv)
+    tender_log.configure_from_args(args)
+
+    matcher = WatchlistMatcher.from_file(args.watchlists)
+    if args.command == "info":
+        print(f"{len(matcher.users)} user, {len(matcher)} aturan, {len(matcher._terms)} kata unik")
+        return 0
+
+    router = WatchlistRouter(matcher, args.output_dir)
+    for path in args.files:
+        counts = router.route(_read_records(path), source=os.path.basename(path))
+        print(f"{path}: {sum(counts.values())} match untuk {len(counts)} user")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())